@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import inspect
 import sys
 import traceback
 
@@ -13,7 +12,7 @@ def _create_error_message():
     :rtype:  str
     """
 
-    called_func = inspect.stack()[1].function
+    called_func = sys._getframe(1).f_code.co_name
     trace_details = traceback.format_stack()
     error_message = ''
     file_info_pysimplegui = trace_details[-1].split(',')[0]
@@ -72,6 +71,9 @@ def _error_popup_with_code(title, filename, line_num, *args, emoji=None):
     :param emoji:     An optional BASE64 Encoded image to shows in the error window
     :type emoji:      bytes
     """
+    from FreeSimpleGUI.execute import execute_editor
+    from FreeSimpleGUI.execute import execute_get_editor
+
     editor_filename = execute_get_editor()
     emoji_data = emoji if emoji is not None else _random_error_emoji()
     layout = [[Text('ERROR'), Text(title)], [Image(data=emoji_data)]]
@@ -130,8 +132,6 @@ def _exit_mainloop(exiting_window):
 
 import FreeSimpleGUI
 from FreeSimpleGUI import _random_error_emoji
-from FreeSimpleGUI import execute_editor
-from FreeSimpleGUI import execute_get_editor
 from FreeSimpleGUI import popup_quick_message
 from FreeSimpleGUI import WIN_CLOSED
 from FreeSimpleGUI.elements.button import Button
@@ -0,0 +1,728 @@
+from __future__ import annotations
+
+import inspect
+import os
+import sys
+import time
+import traceback
+
+import FreeSimpleGUI
+from FreeSimpleGUI import _ReadProfiler
+from FreeSimpleGUI import B
+from FreeSimpleGUI import Cancel
+from FreeSimpleGUI import CB
+from FreeSimpleGUI import I
+from FreeSimpleGUI import In
+from FreeSimpleGUI import obj_to_string_single_obj
+from FreeSimpleGUI import Ok
+from FreeSimpleGUI import popup_quick_message
+from FreeSimpleGUI import popup_scrolled
+from FreeSimpleGUI import popup_yes_no
+from FreeSimpleGUI import PSG_DEBUGGER_LOGO
+from FreeSimpleGUI import SYMBOL_X
+from FreeSimpleGUI import T
+from FreeSimpleGUI import theme
+from FreeSimpleGUI import theme_button_color
+from FreeSimpleGUI.elements.button import Button
+from FreeSimpleGUI.elements.checkbox import Checkbox
+from FreeSimpleGUI.elements.column import Column
+from FreeSimpleGUI.elements.frame import Frame
+from FreeSimpleGUI.elements.input import Input
+from FreeSimpleGUI.elements.multiline import Multiline
+from FreeSimpleGUI.elements.separator import VerticalSeparator
+from FreeSimpleGUI.elements.tab import Tab
+from FreeSimpleGUI.elements.tab import TabGroup
+from FreeSimpleGUI.elements.text import Text
+from FreeSimpleGUI.window import Window
+
+
+class _Debugger:
+    debugger = None
+    DEBUGGER_MAIN_WINDOW_THEME = 'dark grey 13'
+    DEBUGGER_POPOUT_THEME = 'dark grey 13'
+    WIDTH_VARIABLES = 23
+    WIDTH_RESULTS = 46
+
+    WIDTH_WATCHER_VARIABLES = 20
+    WIDTH_WATCHER_RESULTS = 60
+
+    WIDTH_LOCALS = 80
+    NUM_AUTO_WATCH = 9
+
+    MAX_LINES_PER_RESULT_FLOATING = 4
+    MAX_LINES_PER_RESULT_MAIN = 3
+
+    DEBUGGER_POPOUT_WINDOW_FONT = 'Sans 8'
+    DEBUGGER_VARIABLE_DETAILS_FONT = 'Courier 10'
+
+    PROFILER_REFRESH_SECONDS = 1
+
+    '''
+        #     #                    ######
+        ##   ##   ##   # #    #    #     # ###### #####  #    #  ####   ####  ###### #####
+        # # # #  #  #  # ##   #    #     # #      #    # #    # #    # #    # #      #    #
+        #  #  # #    # # # #  #    #     # #####  #####  #    # #      #      #####  #    #
+        #     # ###### # #  # #    #     # #      #    # #    # #  ### #  ### #      #####
+        #     # #    # # #   ##    #     # #      #    # #    # #    # #    # #      #   #
+        #     # #    # # #    #    ######  ###### #####   ####   ####   ####  ###### #    #
+    '''
+
+    def __init__(self):
+        self.watcher_window = None  # type: Window
+        self.popout_window = None  # type: Window
+        self.local_choices = {}
+        self.myrc = ''
+        self.custom_watch = ''
+        self.locals = {}
+        self.globals = {}
+        self.popout_choices = {}
+        self.profiler_last_refresh = 0
+
+    # Includes the DUAL PANE (now 2 tabs)!  Don't forget REPL is there too!
+    def _build_main_debugger_window(self, location=(None, None)):
+        old_theme = theme()
+        theme(_Debugger.DEBUGGER_MAIN_WINDOW_THEME)
+
+        def InVar(key1):
+            row1 = [
+                T('    '),
+                I(key=key1, size=(_Debugger.WIDTH_VARIABLES, 1)),
+                T('', key=key1 + 'CHANGED_', size=(_Debugger.WIDTH_RESULTS, 1)),
+                B('Detail', key=key1 + 'DETAIL_'),
+                B('Obj', key=key1 + 'OBJ_'),
+            ]
+            return row1
+
+        variables_frame = [
+            InVar('_VAR0_'),
+            InVar('_VAR1_'),
+            InVar('_VAR2_'),
+        ]
+
+        interactive_frame = [
+            [
+                T('>>> '),
+                In(
+                    size=(83, 1),
+                    key='-REPL-',
+                    tooltip='Type in any "expression" or "statement"\n and it will be disaplayed below.\nPress RETURN KEY instead of "Go"\nbutton for faster use',
+                ),
+                B('Go', bind_return_key=True, visible=True),
+            ],
+            [Multiline(size=(93, 26), key='-OUTPUT-', autoscroll=True, do_not_clear=True)],
+        ]
+
+        autowatch_frame = [
+            [
+                Button('Choose Variables To Auto Watch', key='-LOCALS-'),
+                Button('Clear All Auto Watches'),
+                Button('Show All Variables', key='-SHOW_ALL-'),
+                Button('Locals', key='-ALL_LOCALS-'),
+                Button('Globals', key='-GLOBALS-'),
+                Button('Popout', key='-POPOUT-'),
+            ]
+        ]
+
+        var_layout = []
+        for i in range(_Debugger.NUM_AUTO_WATCH):
+            var_layout.append(
+                [
+                    T('', size=(_Debugger.WIDTH_WATCHER_VARIABLES, 1), key='_WATCH%s_' % i),
+                    T(
+                        '',
+                        size=(_Debugger.WIDTH_WATCHER_RESULTS, _Debugger.MAX_LINES_PER_RESULT_MAIN),
+                        key='_WATCH%s_RESULT_' % i,
+                    ),
+                ]
+            )
+
+        col1 = [
+            # [Frame('Auto Watches', autowatch_frame+variable_values, title_color='blue')]
+            [Frame('Auto Watches', autowatch_frame + var_layout, title_color=theme_button_color()[0])]
+        ]
+
+        col2 = [
+            [
+                Frame('Variables or Expressions to Watch', variables_frame, title_color=theme_button_color()[0]),
+            ],
+            [
+                Frame(
+                    'REPL-Light - Press Enter To Execute Commands',
+                    interactive_frame,
+                    title_color=theme_button_color()[0],
+                ),
+            ],
+        ]
+
+        col3 = [
+            [
+                Button('Refresh', key='-PROFILER_REFRESH-'),
+                Checkbox('Auto Refresh', default=True, key='-PROFILER_AUTO_REFRESH-'),
+            ],
+            [
+                Multiline(
+                    size=(93, 30),
+                    key='-PROFILER-',
+                    font=_Debugger.DEBUGGER_VARIABLE_DETAILS_FONT,
+                    disabled=True,
+                )
+            ],
+        ]
+
+        # Tab based layout
+        layout = [
+            [Text('Debugging: ' + self._find_users_code())],
+            [TabGroup([[Tab('Variables', col1), Tab('REPL & Watches', col2), Tab('Profiler', col3)]])],
+        ]
+
+        # ------------------------------- Create main window -------------------------------
+        window = Window(
+            'PySimpleGUI Debugger',
+            layout,
+            icon=PSG_DEBUGGER_LOGO,
+            margins=(0, 0),
+            location=location,
+            keep_on_top=True,
+            right_click_menu=[
+                [''],
+                [
+                    'Exit',
+                ],
+            ],
+        )
+
+        Window._read_call_from_debugger = True
+        window.finalize()
+        Window._read_call_from_debugger = False
+
+        window.Element('_VAR1_').SetFocus()
+        self.watcher_window = window
+        Window._add_read_hook(self._read_hook)
+        theme(old_theme)
+        return window
+
+    '''
+        #     #                    #######                               #
+        ##   ##   ##   # #    #    #       #    # ###### #    # #####    #        ####   ####  #####
+        # # # #  #  #  # ##   #    #       #    # #      ##   #   #      #       #    # #    # #    #
+        #  #  # #    # # # #  #    #####   #    # #####  # #  #   #      #       #    # #    # #    #
+        #     # ###### # #  # #    #       #    # #      #  # #   #      #       #    # #    # #####
+        #     # #    # # #   ##    #        #  #  #      #   ##   #      #       #    # #    # #
+        #     # #    # # #    #    #######   ##   ###### #    #   #      #######  ####   ####  #
+    '''
+
+    def _read_hook(self, window, frame):
+        """
+        Registered as a read hook while a debugger window is open.  Gets the variables of the code that called read
+        and refreshes the debugger windows.  Removes itself once both debugger windows are closed.
+
+        :param window: The window being read
+        :type window:  (Window)
+        :param frame:  The frame of the code that called read
+        :type frame:   (types.FrameType)
+        """
+        self.locals = frame.f_locals
+        self.globals = frame.f_globals
+        if self.popout_window:
+            self._refresh_floating_window()
+        if self.watcher_window:
+            self._refresh_main_debugger_window(self.locals, self.globals)
+        if not self.popout_window and not self.watcher_window:
+            Window._remove_read_hook(self._read_hook)
+
+    def _refresh_main_debugger_window(self, mylocals, myglobals):
+        if not self.watcher_window:  # if there is no window setup, nothing to do
+            return False
+        event, values = self.watcher_window.read(timeout=1)
+        if event in (None, 'Exit', '_EXIT_', '-EXIT-'):  # EXIT BUTTON / X BUTTON
+            try:
+                self.watcher_window.close()
+            except:
+                pass
+            self.watcher_window = None
+            return False
+        # ------------------------------- Process events from REPL Tab -------------------------------
+        cmd = values['-REPL-']  # get the REPL entered
+        # BUTTON - GO (NOTE - This button is invisible!!)
+        if event == 'Go':  # GO BUTTON
+            self.watcher_window.Element('-REPL-').Update('')
+            self.watcher_window.Element('-OUTPUT-').Update(f'>>> {cmd}\n', append=True, autoscroll=True)
+
+            try:
+                result = eval(f'{cmd}', myglobals, mylocals)
+            except Exception:
+                if sys.version_info[0] < 3:
+                    result = 'Not available in Python 2'
+                else:
+                    try:
+                        result = exec(f'{cmd}', myglobals, mylocals)
+                    except Exception as e:
+                        result = f'Exception {e}\n'
+
+            self.watcher_window.Element('-OUTPUT-').Update(f'{result}\n', append=True, autoscroll=True)
+        # BUTTON - DETAIL
+        elif event.endswith('_DETAIL_'):  # DETAIL BUTTON
+            var = values[f'_VAR{event[4]}_']
+            try:
+                result = str(eval(str(var), myglobals, mylocals))
+            except:
+                result = ''
+            old_theme = theme()
+            theme(_Debugger.DEBUGGER_MAIN_WINDOW_THEME)
+            popup_scrolled(
+                str(values[f'_VAR{event[4]}_']) + '\n' + result,
+                title=var,
+                non_blocking=True,
+                font=_Debugger.DEBUGGER_VARIABLE_DETAILS_FONT,
+            )
+            theme(old_theme)
+        # BUTTON - OBJ
+        elif event.endswith('_OBJ_'):  # OBJECT BUTTON
+            var = values[f'_VAR{event[4]}_']
+            try:
+                result = obj_to_string_single_obj(mylocals[var])
+            except Exception:
+                try:
+                    result = eval(f'{var}', myglobals, mylocals)
+                    result = obj_to_string_single_obj(result)
+                except Exception as e:
+                    result = f'{e}\nError showing object {var}'
+            old_theme = theme()
+            theme(_Debugger.DEBUGGER_MAIN_WINDOW_THEME)
+            popup_scrolled(
+                str(var) + '\n' + str(result),
+                title=var,
+                non_blocking=True,
+                font=_Debugger.DEBUGGER_VARIABLE_DETAILS_FONT,
+            )
+            theme(old_theme)
+        # ------------------------------- Process Watch Tab -------------------------------
+        # BUTTON - Choose Locals to see
+        elif event == '-LOCALS-':  # Show all locals BUTTON
+            self._choose_auto_watches(mylocals)
+        # BUTTON - Locals (quick popup)
+        elif event == '-ALL_LOCALS-':
+            self._display_all_vars('All Locals', mylocals)
+        # BUTTON - Globals (quick popup)
+        elif event == '-GLOBALS-':
+            self._display_all_vars('All Globals', myglobals)
+        # BUTTON - clear all
+        elif event == 'Clear All Auto Watches':
+            if popup_yes_no('Do you really want to clear all Auto-Watches?', 'Really Clear??') == 'Yes':
+                self.local_choices = {}
+                self.custom_watch = ''
+        # BUTTON - Popout
+        elif event == '-POPOUT-':
+            if not self.popout_window:
+                self._build_floating_window()
+        # BUTTON - Show All
+        elif event == '-SHOW_ALL-':
+            for key in self.locals:
+                self.local_choices[key] = not key.startswith('_')
+
+        # -------------------- Process the Profiler Tab ------------------
+        if event == '-PROFILER_REFRESH-' or (values['-PROFILER_AUTO_REFRESH-'] and time.time() - self.profiler_last_refresh >= _Debugger.PROFILER_REFRESH_SECONDS):
+            self._refresh_profiler_tab()
+
+        # -------------------- Process the manual "watch list" ------------------
+        for i in range(3):
+            key = f'_VAR{i}_'
+            out_key = f'_VAR{i}_CHANGED_'
+            self.myrc = ''
+            if self.watcher_window.Element(key):
+                var = values[key]
+                try:
+                    result = eval(str(var), myglobals, mylocals)
+                except:
+                    result = ''
+                self.watcher_window.Element(out_key).Update(str(result))
+            else:
+                self.watcher_window.Element(out_key).Update('')
+
+        # -------------------- Process the automatic "watch list" ------------------
+        slot = 0
+        for key in self.local_choices:
+            if key == '-CUSTOM_WATCH-':
+                continue
+            if self.local_choices[key]:
+                self.watcher_window.Element(f'_WATCH{slot}_').Update(key)
+                try:
+                    self.watcher_window.Element(f'_WATCH{slot}_RESULT_', silent_on_error=True).Update(mylocals[key])
+                except:
+                    self.watcher_window.Element(f'_WATCH{slot}_RESULT_').Update('')
+                slot += 1
+
+            if slot + int(self.custom_watch not in (None, '')) >= _Debugger.NUM_AUTO_WATCH:
+                break
+        # If a custom watch was set, display that value in the window
+        if self.custom_watch:
+            self.watcher_window.Element(f'_WATCH{slot}_').Update(self.custom_watch)
+            try:
+                self.myrc = eval(self.custom_watch, myglobals, mylocals)
+            except:
+                self.myrc = ''
+            self.watcher_window.Element(f'_WATCH{slot}_RESULT_').Update(self.myrc)
+            slot += 1
+        # blank out all of the slots not used (blank)
+        for i in range(slot, _Debugger.NUM_AUTO_WATCH):
+            self.watcher_window.Element(f'_WATCH{i}_').Update('')
+            self.watcher_window.Element(f'_WATCH{i}_RESULT_').Update('')
+
+        return True  # return indicating the window stayed open
+
+    def _refresh_profiler_tab(self):
+        """
+        Shows the statistics of all windows that have a profiler enabled in the Profiler tab
+        """
+        self.profiler_last_refresh = time.time()
+        profilers = list(_ReadProfiler.profiled_windows.values())
+        if profilers:
+            report = '\n\n'.join(profiler.format_stats() for profiler in profilers)
+        else:
+            report = 'No windows are being profiled.\nCall window.enable_profiler() to start recording the reads of a window.'
+        self.watcher_window['-PROFILER-'].update(report)
+
+    def _find_users_code(self):
+        try:  # lots can go wrong so wrapping the entire thing
+            trace_details = traceback.format_stack()
+            file_info_pysimplegui, error_message = None, ''
+            for line in reversed(trace_details):
+                if os.path.dirname(FreeSimpleGUI.__file__) not in line:
+                    file_info_pysimplegui = line.split(',')[0]
+                    error_message = line
+                    break
+            if file_info_pysimplegui is None:
+                return ''
+            error_parts = None
+            if error_message != '':
+                error_parts = error_message.split(', ')
+                if len(error_parts) < 4:
+                    error_message = error_parts[0] + '\n' + error_parts[1] + '\n' + ''.join(error_parts[2:])
+            if error_parts is None:
+                print('*** Error popup attempted but unable to parse error details ***')
+                print(trace_details)
+                return ''
+            filename = error_parts[0][error_parts[0].index('File ') + 5 :]
+            return filename
+        except:
+            return
+
+    '''
+        ######                                 #     #
+        #     #  ####  #####  #    # #####     #  #  # # #    # #####   ####  #    #
+        #     # #    # #    # #    # #    #    #  #  # # ##   # #    # #    # #    #
+        ######  #    # #    # #    # #    #    #  #  # # # #  # #    # #    # #    #
+        #       #    # #####  #    # #####     #  #  # # #  # # #    # #    # # ## #
+        #       #    # #      #    # #         #  #  # # #   ## #    # #    # ##  ##
+        #        ####  #       ####  #          ## ##  # #    # #####   ####  #    #
+
+        ######                                    #                     #     #
+        #     # #    # #    # #####   ####       # #   #      #         #     #   ##   #####   ####
+        #     # #    # ##  ## #    # #          #   #  #      #         #     #  #  #  #    # #
+        #     # #    # # ## # #    #  ####     #     # #      #         #     # #    # #    #  ####
+        #     # #    # #    # #####       #    ####### #      #          #   #  ###### #####       #
+        #     # #    # #    # #      #    #    #     # #      #           # #   #    # #   #  #    #
+        ######   ####  #    # #       ####     #     # ###### ######       #    #    # #    #  ####
+    '''
+    # displays them into a single text box
+
+    def _display_all_vars(self, title, dict):
+        out_text = title + '\n'
+        sorted_dict = {}
+        for key in sorted(dict.keys()):
+            sorted_dict[key] = dict[key]
+        for key in sorted_dict:
+            value = dict[key]
+            wrapped_text = str(value)
+            out_text += f'{key} - {wrapped_text}\n'
+        old_theme = theme()
+        theme(_Debugger.DEBUGGER_MAIN_WINDOW_THEME)
+        popup_scrolled(
+            out_text,
+            title=title,
+            non_blocking=True,
+            font=_Debugger.DEBUGGER_VARIABLE_DETAILS_FONT,
+            keep_on_top=True,
+            icon=PSG_DEBUGGER_LOGO,
+        )
+        theme(old_theme)
+
+    '''
+        #####                                        #     #
+       #     # #    #  ####   ####   ####  ######    #  #  #   ##   #####  ####  #    #
+       #       #    # #    # #    # #      #         #  #  #  #  #    #   #    # #    #
+       #       ###### #    # #    #  ####  #####     #  #  # #    #   #   #      ######
+       #       #    # #    # #    #      # #         #  #  # ######   #   #      #    #
+       #     # #    # #    # #    # #    # #         #  #  # #    #   #   #    # #    #
+        #####  #    #  ####   ####   ####  ######     ## ##  #    #   #    ####  #    #
+
+        #     #                                                       #     #
+        #     #   ##   #####  #   ##   #####  #      ######  ####     #  #  # # #    #
+        #     #  #  #  #    # #  #  #  #    # #      #      #         #  #  # # ##   #
+        #     # #    # #    # # #    # #####  #      #####   ####     #  #  # # # #  #
+         #   #  ###### #####  # ###### #    # #      #           #    #  #  # # #  # #
+          # #   #    # #   #  # #    # #    # #      #      #    #    #  #  # # #   ##
+           #    #    # #    # # #    # #####  ###### ######  ####      ## ##  # #    #
+    '''
+
+    def _choose_auto_watches(self, my_locals):
+        old_theme = theme()
+        theme(_Debugger.DEBUGGER_MAIN_WINDOW_THEME)
+        num_cols = 3
+        cur_col = 0
+        layout = [[Text('Choose your "Auto Watch" variables', font='ANY 14', text_color='red')]]
+        longest_line = max([len(key) for key in my_locals])
+        line = []
+        sorted_dict = {}
+        for key in sorted(my_locals.keys()):
+            sorted_dict[key] = my_locals[key]
+        for key in sorted_dict:
+            line.append(
+                CB(
+                    key,
+                    key=key,
+                    size=(longest_line, 1),
+                    default=self.local_choices[key] if key in self.local_choices else False,
+                )
+            )
+            if cur_col + 1 == num_cols:
+                cur_col = 0
+                layout.append(line)
+                line = []
+            else:
+                cur_col += 1
+        if cur_col:
+            layout.append(line)
+
+        layout += [
+            [
+                Text('Custom Watch (any expression)'),
+                Input(default_text=self.custom_watch, size=(40, 1), key='-CUSTOM_WATCH-'),
+            ]
+        ]
+        layout += [[Ok(), Cancel(), Button('Clear All'), Button('Select [almost] All', key='-AUTO_SELECT-')]]
+
+        window = Window('Choose Watches', layout, icon=PSG_DEBUGGER_LOGO, finalize=True, keep_on_top=True)
+
+        while True:  # event loop
+            event, values = window.read()
+            if event in (None, 'Cancel', '-EXIT-'):
+                break
+            elif event == 'Ok':
+                self.local_choices = values
+                self.custom_watch = values['-CUSTOM_WATCH-']
+                break
+            elif event == 'Clear All':
+                popup_quick_message(
+                    'Cleared Auto Watches',
+                    auto_close=True,
+                    auto_close_duration=3,
+                    non_blocking=True,
+                    text_color='red',
+                    font='ANY 18',
+                )
+                for key in sorted_dict:
+                    window.Element(key).Update(False)
+                window.Element('-CUSTOM_WATCH-').Update('')
+            elif event == 'Select All':
+                for key in sorted_dict:
+                    window.Element(key).Update(False)
+            elif event == '-AUTO_SELECT-':
+                for key in sorted_dict:
+                    window.Element(key).Update(not key.startswith('_'))
+
+        # exited event loop
+        window.Close()
+        theme(old_theme)
+
+    '''
+        ######                            #######
+        #     # #    # # #      #####     #       #       ####    ##   ##### # #    #  ####
+        #     # #    # # #      #    #    #       #      #    #  #  #    #   # ##   # #    #
+        ######  #    # # #      #    #    #####   #      #    # #    #   #   # # #  # #
+        #     # #    # # #      #    #    #       #      #    # ######   #   # #  # # #  ###
+        #     # #    # # #      #    #    #       #      #    # #    #   #   # #   ## #    #
+        ######   ####  # ###### #####     #       ######  ####  #    #   #   # #    #  ####
+
+        #     #
+        #  #  # # #    # #####   ####  #    #
+        #  #  # # ##   # #    # #    # #    #
+        #  #  # # # #  # #    # #    # #    #
+        #  #  # # #  # # #    # #    # # ## #
+        #  #  # # #   ## #    # #    # ##  ##
+         ## ##  # #    # #####   ####  #    #
+    '''
+
+    def _build_floating_window(self, location=(None, None)):
+        """
+
+        :param location:
+        :type location:
+
+        """
+        if self.popout_window:  # if floating window already exists, close it first
+            self.popout_window.Close()
+        old_theme = theme()
+        theme(_Debugger.DEBUGGER_POPOUT_THEME)
+        num_cols = 2
+        width_var = 15
+        width_value = 30
+        layout = []
+        line = []
+        col = 0
+        # self.popout_choices = self.local_choices
+        self.popout_choices = {}
+        if self.popout_choices == {}:  # if nothing chosen, then choose all non-_ variables
+            for key in sorted(self.locals.keys()):
+                self.popout_choices[key] = not key.startswith('_')
+
+        width_var = max([len(key) for key in self.popout_choices])
+        for key in self.popout_choices:
+            if self.popout_choices[key] is True:
+                value = str(self.locals.get(key))
+                h = min(len(value) // width_value + 1, _Debugger.MAX_LINES_PER_RESULT_FLOATING)
+                line += [
+                    Text(f'{key}', size=(width_var, 1), font=_Debugger.DEBUGGER_POPOUT_WINDOW_FONT),
+                    Text(' = ', font=_Debugger.DEBUGGER_POPOUT_WINDOW_FONT),
+                    Text(value, key=key, size=(width_value, h), font=_Debugger.DEBUGGER_POPOUT_WINDOW_FONT),
+                ]
+                if col + 1 < num_cols:
+                    line += [VerticalSeparator(), T(' ')]
+                col += 1
+            if col >= num_cols:
+                layout.append(line)
+                line = []
+                col = 0
+        if col != 0:
+            layout.append(line)
+        layout = [[T(SYMBOL_X, enable_events=True, key='-EXIT-', font='_ 7')], [Column(layout)]]
+
+        Window._read_call_from_debugger = True
+        self.popout_window = Window(
+            'Floating',
+            layout,
+            alpha_channel=0,
+            no_titlebar=True,
+            grab_anywhere=True,
+            element_padding=(0, 0),
+            margins=(0, 0),
+            keep_on_top=True,
+            right_click_menu=['&Right', ['Debugger::RightClick', 'Exit::RightClick']],
+            location=location,
+            finalize=True,
+        )
+        Window._read_call_from_debugger = False
+        Window._add_read_hook(self._read_hook)
+
+        if location == (None, None):
+            screen_size = self.popout_window.GetScreenDimensions()
+            self.popout_window.Move(screen_size[0] - self.popout_window.Size[0], 0)
+        self.popout_window.SetAlpha(1)
+        theme(old_theme)
+        return True
+
+    '''
+        ######
+        #     # ###### ###### #####  ######  ####  #    #
+        #     # #      #      #    # #      #      #    #
+        ######  #####  #####  #    # #####   ####  ######
+        #   #   #      #      #####  #           # #    #
+        #    #  #      #      #   #  #      #    # #    #
+        #     # ###### #      #    # ######  ####  #    #
+
+        #######
+        #       #       ####    ##   ##### # #    #  ####
+        #       #      #    #  #  #    #   # ##   # #    #
+        #####   #      #    # #    #   #   # # #  # #
+        #       #      #    # ######   #   # #  # # #  ###
+        #       #      #    # #    #   #   # #   ## #    #
+        #       ######  ####  #    #   #   # #    #  ####
+
+        #     #
+        #  #  # # #    # #####   ####  #    #
+        #  #  # # ##   # #    # #    # #    #
+        #  #  # # # #  # #    # #    # #    #
+        #  #  # # #  # # #    # #    # # ## #
+        #  #  # # #   ## #    # #    # ##  ##
+         ## ##  # #    # #####   ####  #    #
+    '''
+
+    def _refresh_floating_window(self):
+        if not self.popout_window:
+            return
+        for key in self.popout_choices:
+            if self.popout_choices[key] is True and key in self.locals:
+                if key is not None and self.popout_window is not None:
+                    self.popout_window.Element(key, silent_on_error=True).Update(self.locals.get(key))
+        event, values = self.popout_window.read(timeout=5)
+        if event in (None, '_EXIT_', 'Exit::RightClick', '-EXIT-'):
+            self.popout_window.Close()
+            self.popout_window = None
+        elif event == 'Debugger::RightClick':
+            show_debugger_window()
+
+
+# 888     888                                .d8888b.         d8888 888 888          888      888
+# 888     888                               d88P  Y88b       d88888 888 888          888      888
+# 888     888                               888    888      d88P888 888 888          888      888
+# 888     888 .d8888b   .d88b.  888d888     888            d88P 888 888 888  8888b.  88888b.  888  .d88b.
+# 888     888 88K      d8P  Y8b 888P"       888           d88P  888 888 888     "88b 888 "88b 888 d8P  Y8b
+# 888     888 "Y8888b. 88888888 888         888    888   d88P   888 888 888 .d888888 888  888 888 88888888
+# Y88b. .d88P      X88 Y8b.     888         Y88b  d88P  d8888888888 888 888 888  888 888 d88P 888 Y8b.
+#  "Y88888P"   88888P'  "Y8888  888          "Y8888P"  d88P     888 888 888 "Y888888 88888P"  888  "Y8888
+
+# 8888888888                            888    d8b
+# 888                                   888    Y8P
+# 888                                   888
+# 8888888    888  888 88888b.   .d8888b 888888 888  .d88b.  88888b.  .d8888b
+# 888        888  888 888 "88b d88P"    888    888 d88""88b 888 "88b 88K
+# 888        888  888 888  888 888      888    888 888  888 888  888 "Y8888b.
+# 888        Y88b 888 888  888 Y88b.    Y88b.  888 Y88..88P 888  888      X88
+# 888         "Y88888 888  888  "Y8888P  "Y888 888  "Y88P"  888  888  88888P'
+
+
+def show_debugger_window(location=(None, None), *args):
+    """
+    Shows the large main debugger window
+    :param location: Locations (x,y) on the screen to place upper left corner of the window
+    :type location:  (int, int)
+    :return:         None
+    :rtype:          None
+    """
+    if _Debugger.debugger is None:
+        _Debugger.debugger = _Debugger()
+    debugger = _Debugger.debugger
+    frame = inspect.currentframe()
+    try:
+        debugger.locals = frame.f_back.f_locals
+        debugger.globals = frame.f_back.f_globals
+    finally:
+        del frame
+
+    if not debugger.watcher_window:
+        debugger.watcher_window = debugger._build_main_debugger_window(location=location)
+    return True
+
+
+def show_debugger_popout_window(location=(None, None), *args):
+    """
+    Shows the smaller "popout" window.  Default location is the upper right corner of your screen
+
+    :param location: Locations (x,y) on the screen to place upper left corner of the window
+    :type location:  (int, int)
+    :return:         None
+    :rtype:          None
+    """
+    if _Debugger.debugger is None:
+        _Debugger.debugger = _Debugger()
+    debugger = _Debugger.debugger
+    frame = inspect.currentframe()
+    try:
+        debugger.locals = frame.f_back.f_locals
+        debugger.globals = frame.f_back.f_globals
+    finally:
+        del frame
+    if debugger.popout_window:
+        debugger.popout_window.Close()
+        debugger.popout_window = None
+    debugger._build_floating_window(location=location)
@@ -164,6 +164,9 @@ class Element:
         self.hsb_style = None  # The ttk style used for the horizontal scrollbar if one is attached to element
         self.hsb = None  # The horizontal scrollbar if one is attached to element
         self.vsb = None  # The vertical scrollbar if one is attached to element
+        self._value_cache = None  # The value returned for this element the last time the window was read
+        self._value_dirty = True  # True if the value must be read from tkinter again when the window is read
+        self._value_trace_var = None  # The tkinter variable that has a trace on it to set _value_dirty
         ## TTK Scrollbar Settings
         self.ttk_part_overrides = TTKPartOverrides(
             sbar_trough_color=sbar_trough_color,
@@ -526,6 +529,16 @@ class Element:
         """
         self._generic_callback_handler('')
 
+    def _value_changed_callback(self, *args):
+        """
+        Internal callback for when the tkinter variable holding the element's value is written.
+        Marks the element so that its value is read from tkinter the next time the window is read
+
+        :param args: Information from tkinter about the callback (not used)
+        :type args:
+        """
+        self._value_dirty = True
+
     def _this_elements_window_closed(self, quick_check=True):
         if self.ParentForm is not None:
             return self.ParentForm.is_closed(quick_check=quick_check)
@@ -6,6 +6,7 @@ import warnings
 from tkinter import ttk
 
 import FreeSimpleGUI
+from FreeSimpleGUI import _ttk_style_make_private
 from FreeSimpleGUI import BROWSE_FILES_DELIMITER
 from FreeSimpleGUI import BUTTON_DISABLED_MEANS_IGNORE
 from FreeSimpleGUI import BUTTON_TYPE_BROWSE_FILE
@@ -419,7 +420,7 @@ class Button(Element):
             _exit_mainloop(self.ParentForm)
 
             if self.ParentForm.NonBlocking:
-                self.ParentForm.TKroot.destroy()
+                self.ParentForm._destroy_tkroot()
                 Window._DecrementOpenCount()
         elif self.BType == BUTTON_TYPE_READ_FORM:  # LEAVE THE WINDOW OPEN!! DO NOT CLOSE
             # This is a PLAIN BUTTON
@@ -433,7 +434,7 @@ class Button(Element):
             _exit_mainloop(self.ParentForm)
         elif self.BType == BUTTON_TYPE_CLOSES_WIN_ONLY:  # special kind of button that does not exit main loop
             self.ParentForm._Close(without_event=True)
-            self.ParentForm.TKroot.destroy()  # close the window with tkinter
+            self.ParentForm._destroy_tkroot()  # close the window with tkinter
             Window._DecrementOpenCount()
         elif self.BType == BUTTON_TYPE_CALENDAR_CHOOSER:  # this is a return type button so GET RESULTS and destroy window
             # ------------ new chooser code -------------
@@ -515,6 +516,8 @@ class Button(Element):
 
         if self.UseTtkButtons:
             style_name = self.ttk_style_name  # created when made initial window (in the pack)
+            if button_color != (None, None) or image_data is not None or image_filename is not None or disabled_button_color != (None, None):
+                style_name = _ttk_style_make_private(self, self.TKButton)  # the style may be shared with other buttons
             # style_name = str(self.Key) + 'custombutton.TButton'
             button_style = ttk.Style()
         if text is not None:
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-import calendar
+import datetime
 import tkinter as tk
 import tkinter.font
 from tkinter import ttk
@@ -14,11 +14,13 @@ class TKCalendar(ttk.Frame):
 
     # XXX ToDo: cget and configure
 
-    datetime = calendar.datetime.datetime
-    timedelta = calendar.datetime.timedelta
+    timedelta = datetime.timedelta
+    datetime = datetime.datetime
 
     def __init__(self, master=None, target_element=None, close_when_chosen=True, default_date=(None, None, None), **kw):
         """WIDGET-SPECIFIC OPTIONS: locale, firstweekday, year, month, selectbackground, selectforeground"""
+        import calendar
+
         self._TargetElement = target_element
         default_mon, default_day, default_year = default_date
         # remove custom options from kw before initializating ttk.Frame
@@ -204,6 +206,8 @@ class TKCalendar(ttk.Frame):
 
     def _next_month(self):
         """Update calendar to show the next month."""
+        import calendar
+
         self._canvas.place_forget()
 
         year, month = self._date.year, self._date.month
@@ -5,6 +5,7 @@ import tkinter.font
 from tkinter import ttk
 
 import FreeSimpleGUI
+from FreeSimpleGUI import _ttk_style_make_private
 from FreeSimpleGUI import COLOR_SYSTEM_DEFAULT
 from FreeSimpleGUI import ELEM_TYPE_INPUT_COMBO
 from FreeSimpleGUI import Element
@@ -206,6 +207,7 @@ class Combo(Element):
             except:
                 pass
             self.Values = values
+            self._value_dirty = True  # returned value is looked up in Values so it must be read again
             if value is None:
                 self.TKCombo.set('')
             if size == (None, None):
@@ -252,6 +254,8 @@ class Combo(Element):
 
         combostyle = self.ttk_style
         style_name = self.ttk_style_name
+        if text_color is not None or background_color is not None:
+            style_name = _ttk_style_make_private(self, self.TKCombo)  # the style may be shared with other combos
         if text_color is not None:
             combostyle.configure(style_name, foreground=text_color)
             combostyle.configure(style_name, selectforeground=text_color)
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import sys
 import tkinter as tk
 from math import floor
 
+from FreeSimpleGUI import _put_pixels_in_photo_image
 from FreeSimpleGUI import COLOR_SYSTEM_DEFAULT
 from FreeSimpleGUI import ELEM_TYPE_GRAPH
 from FreeSimpleGUI import Element
@@ -10,6 +12,36 @@ from FreeSimpleGUI import TEXT_LOCATION_CENTER
 from FreeSimpleGUI._utils import _error_popup_with_traceback
 from FreeSimpleGUI._utils import _exit_mainloop
 
+# Tcl procedure used by the batch drawing methods. Creates many canvas items with a single call from Python
+_CREATE_ITEMS_PROC = """
+proc ::FreeSimpleGUI_create_items {canvas type items options} {
+    set ids {}
+    foreach item $items {
+        lappend ids [$canvas create $type {*}$item {*}$options]
+    }
+    return $ids
+}
+"""
+
+# Canvas item types that can be used for the figures of a Graph's scene
+_SCENE_FIGURE_TYPES = ('line', 'polygon', 'rectangle', 'oval', 'arc', 'text')
+
+
+class _SceneFigure:
+    """
+    Not user callable.  One figure in the retained scene of a Graph element.  Holds the figure's current geometry and
+    options along with the ones last pushed to the canvas so that a commit only sends what changed.
+    """
+
+    def __init__(self, figure_type, points, options, group):
+        self.figure_type = figure_type
+        self.points = points
+        self.options = options
+        self.group = group
+        self.id = None
+        self.committed_points = None
+        self.committed_options = {}
+
 
 class Graph(Element):
     """
@@ -108,6 +140,10 @@ class Graph(Element):
         self.expand_x = expand_x
         self.expand_y = expand_y
         self.motion_events = motion_events
+        self._create_items_proc_defined = False
+        self._scene_figures = {}  # type: dict[str, _SceneFigure]
+        self._scene_dirty = {}  # names of figures changed since the last commit. A dict is used as an ordered set
+        self._scene_deleted_ids = []
 
         super().__init__(
             ELEM_TYPE_GRAPH,
@@ -143,6 +179,175 @@ class Graph(Element):
         new_y = self.CanvasSize[1] + scale_y * (y_in - self.BottomLeft[1])
         return new_x, new_y
 
+    def _convert_points_to_canvas_xy(self, points):
+        """
+        Not user callable.  Converts many points from the user's coordinates into the ones used by tkinter at once.
+        If the points are a NumPy array, NumPy does the conversion.
+
+        :param points: The points to convert
+        :type points:  List[(int, int) | Tuple[float, float]] | numpy.ndarray
+        :return:       The converted x values and the converted y values
+        :rtype:        (List[float], List[float])
+        """
+        try:
+            scale_x = (self.CanvasSize[0] - 0) / (self.TopRight[0] - self.BottomLeft[0])
+            scale_y = (0 - self.CanvasSize[1]) / (self.TopRight[1] - self.BottomLeft[1])
+        except:
+            scale_x = scale_y = 0
+        left, bottom = self.BottomLeft
+        height = self.CanvasSize[1]
+        numpy = sys.modules.get('numpy')  # only used if the user already has it, it's never imported here
+        if numpy is not None and isinstance(points, numpy.ndarray):
+            points = points.reshape(-1, 2).astype(float)
+            return (scale_x * (points[:, 0] - left)).tolist(), (height + scale_y * (points[:, 1] - bottom)).tolist()
+        return [scale_x * (x - left) for x, y in points], [height + scale_y * (y - bottom) for x, y in points]
+
+    def _create_items(self, item_type, items, options):
+        """
+        Not user callable.  Creates many canvas items of one type using a single Tcl call
+
+        :param item_type: The type of canvas item ('line', 'oval', 'rectangle', 'text', etc)
+        :type item_type:  (str)
+        :param items:     One entry per item. Each entry has the item's coordinates, optionally followed by options only for that item
+        :type items:      List[Tuple]
+        :param options:   Options used for every item, as a flat list of option names and values
+        :type options:    List
+        :return:          The ids of the items created or None if the window was closed
+        :rtype:           List[int] | None
+        """
+        if self._TKCanvas2 is None:
+            print('*** WARNING - The Graph element has not been finalized and cannot be drawn upon ***')
+            print('Call Window.Finalize() prior to this operation')
+            return None
+        if not items:
+            return []
+        try:  # in case window was closed with an X
+            canvas = self._TKCanvas2
+            if not self._create_items_proc_defined:
+                canvas.tk.eval(_CREATE_ITEMS_PROC)
+                self._create_items_proc_defined = True
+            ids = canvas.tk.call('::FreeSimpleGUI_create_items', canvas._w, item_type, items, options)
+            return [int(id) for id in canvas.tk.splitlist(ids)]
+        except:
+            return None
+
+    @staticmethod
+    def _batch_options(count, **options):
+        """
+        Not user callable.  Splits the options for a batch drawing call into the ones used for every item and the ones
+        that have a list with a different value for each item.  Options that are None are left out.  A list is only
+        taken to be one value per item when it has a value for every item.  Fonts are never split as a font can itself
+        be a list such as ['Helvetica', 12].
+
+        :param count:   The number of items being drawn
+        :type count:    (int)
+        :param options: The options. Each is either a single value or a list with one value per item
+        :type options:  Any
+        :return:        The options for every item as a flat list, and a list of flat lists of options for each item
+        :rtype:         (List, List[List])
+        """
+        shared = []
+        per_item = [[] for _ in range(count)]
+        for name, value in options.items():
+            if isinstance(value, list) and len(value) == count and name != 'font':
+                for item_options, item_value in zip(per_item, value):
+                    if item_value is not None:
+                        item_options += ['-' + name, item_value]
+            elif value is not None:
+                shared += ['-' + name, value]
+        return shared, per_item
+
+    def draw_points(self, points, size=2, color='black'):
+        """
+        Draws many points at once, the same way draw_point draws one.  Much faster than calling draw_point for each point.
+
+        :param points: Center locations using USER'S coordinate system. A list of (x, y) points or a NumPy array with 2 columns
+        :type points:  List[(int, int) | Tuple[float, float]] | numpy.ndarray
+        :param size:   Size of the points in user's coordinate values
+        :type size:    int | float
+        :param color:  color of the points. Either one color or a list with a color for every point
+        :type color:   str | List[str]
+        :return:       ids returned from tkinter, one for each point, or None if the window was closed
+        :rtype:        List[int] | None
+        """
+        xs, ys = self._convert_points_to_canvas_xy(points)
+        size = self._convert_xy_to_canvas_xy(self.BottomLeft[0] + size, self.BottomLeft[1])[0] - self._convert_xy_to_canvas_xy(self.BottomLeft[0], self.BottomLeft[1])[0]
+        half = size // 2
+        options, item_options = self._batch_options(len(xs), width=0, fill=color, outline=color)
+        items = [(x - half, y - half, x + half, y + half, *extra) for x, y, extra in zip(xs, ys, item_options)]
+        return self._create_items('oval', items, options)
+
+    def draw_line_segments(self, points_from, points_to, color='black', width=1):
+        """
+        Draws many separate lines at once. Line N goes from points_from[N] to points_to[N].  Much faster than calling
+        draw_line for each line.
+
+        :param points_from: Starting points for the lines. A list of (x, y) points or a NumPy array with 2 columns
+        :type points_from:  List[(int, int) | Tuple[float, float]] | numpy.ndarray
+        :param points_to:   Ending points for the lines
+        :type points_to:    List[(int, int) | Tuple[float, float]] | numpy.ndarray
+        :param color:       Color of the lines. Either one color or a list with a color for every line
+        :type color:        str | List[str]
+        :param width:       width of the lines in pixels
+        :type width:        (int)
+        :return:            ids returned from tkinter, one for each line, or None if the window was closed
+        :rtype:             List[int] | None
+        """
+        xs_from, ys_from = self._convert_points_to_canvas_xy(points_from)
+        xs_to, ys_to = self._convert_points_to_canvas_xy(points_to)
+        options, item_options = self._batch_options(len(xs_from), width=width, fill=color)
+        items = [(x1, y1, x2, y2, *extra) for x1, y1, x2, y2, extra in zip(xs_from, ys_from, xs_to, ys_to, item_options)]
+        return self._create_items('line', items, options)
+
+    def draw_rectangles(self, top_lefts, bottom_rights, fill_color=None, line_color=None, line_width=None):
+        """
+        Draws many rectangles at once. Much faster than calling draw_rectangle for each rectangle.
+
+        :param top_lefts:     the top left points of the rectangles. A list of (x, y) points or a NumPy array with 2 columns
+        :type top_lefts:      List[(int, int) | Tuple[float, float]] | numpy.ndarray
+        :param bottom_rights: the bottom right points of the rectangles
+        :type bottom_rights:  List[(int, int) | Tuple[float, float]] | numpy.ndarray
+        :param fill_color:    color of the interiors. Either one color or a list with a color for every rectangle
+        :type fill_color:     str | List[str]
+        :param line_color:    color of outlines. Either one color or a list with a color for every rectangle
+        :type line_color:     str | List[str]
+        :param line_width:    width of the lines in pixels
+        :type line_width:     (int)
+        :return:              ids returned from tkinter, one for each rectangle, or None if the window was closed
+        :rtype:               List[int] | None
+        """
+        xs1, ys1 = self._convert_points_to_canvas_xy(top_lefts)
+        xs2, ys2 = self._convert_points_to_canvas_xy(bottom_rights)
+        if line_width is None:
+            line_width = 1
+        options, item_options = self._batch_options(len(xs1), fill=fill_color, outline=line_color, width=line_width)
+        items = [(x1, y1, x2, y2, *extra) for x1, y1, x2, y2, extra in zip(xs1, ys1, xs2, ys2, item_options)]
+        return self._create_items('rectangle', items, options)
+
+    def draw_texts(self, texts, locations, color='black', font=None, angle=0, text_location=TEXT_LOCATION_CENTER):
+        """
+        Draws many pieces of text at once. Much faster than calling draw_text for each one.
+
+        :param texts:         text to display, one for each location
+        :type texts:          List[Any]
+        :param locations:     locations of the text. A list of (x, y) points or a NumPy array with 2 columns
+        :type locations:      List[(int, int) | Tuple[float, float]] | numpy.ndarray
+        :param color:         text color. Either one color or a list with a color for every text
+        :type color:          str | List[str]
+        :param font:          specifies the  font family, size, etc. Tuple or Single string format 'name size styles'. Styles: italic * roman bold normal underline overstrike
+        :type font:           (str or (str, int[, str]) or None)
+        :param angle:         Angle 0 to 360 to draw the text.  Zero represents horizontal text
+        :type angle:          (float)
+        :param text_location: "anchor" location for the text. Values start with TEXT_LOCATION_
+        :type text_location:  (enum)
+        :return:              ids returned from tkinter, one for each text, or None if the window was closed
+        :rtype:               List[int] | None
+        """
+        xs, ys = self._convert_points_to_canvas_xy(locations)
+        options, item_options = self._batch_options(len(xs), fill=color, font=font, angle=angle, anchor=text_location)
+        items = [(x, y, '-text', str(text), *extra) for x, y, text, extra in zip(xs, ys, texts, item_options)]
+        return self._create_items('text', items, options)
+
     def _convert_canvas_xy_to_xy(self, x_in, y_in):
         """
         Not user callable.  Used to convert tkinter Canvas coords into user's coordinates
@@ -477,21 +682,28 @@ class Graph(Element):
             id = None
         return id
 
-    def draw_image(self, filename=None, data=None, location=(None, None)):
+    def draw_image(self, filename=None, data=None, location=(None, None), pixels=None, pixels_size=None, figure=None):
         """
         Places an image onto your canvas.  It's a really important method for this element as it enables so much
 
-        :param filename: if image is in a file, path and filename for the image. (GIF and PNG only!)
-        :type filename:  (str)
-        :param data:     if image is in Base64 format or raw? format then use instead of filename
-        :type data:      str | bytes
-        :param location: the (x,y) location to place image's top left corner
-        :type location:  (int, int) | Tuple[float, float]
-        :return:         id returned from tkinter that you'll need if you want to manipulate the image
-        :rtype:          int | None
+        :param filename:    if image is in a file, path and filename for the image. (GIF and PNG only!)
+        :type filename:     (str)
+        :param data:        if image is in Base64 format or raw? format then use instead of filename
+        :type data:         str | bytes
+        :param location:    the (x,y) location to place image's top left corner
+        :type location:     (int, int) | Tuple[float, float]
+        :param pixels:      Raw pixels, row after row, 3 bytes (RGB), 4 bytes (RGBA, alpha is not shown) or 1 byte (grayscale) per pixel. A NumPy uint8 array with a shape of (height, width, channels) can be passed directly. No PNG encoding is needed
+        :type pixels:       bytes | bytearray | memoryview | numpy.ndarray
+        :param pixels_size: (width, height) of the pixels. Only needed when pixels is a flat buffer such as bytes
+        :type pixels_size:  (int, int) | None
+        :param figure:      id of an image drawn earlier with pixels. The new pixels are copied into that image, and it is moved to location, instead of a new image being drawn
+        :type figure:       int | None
+        :return:            id returned from tkinter that you'll need if you want to manipulate the image
+        :rtype:             int | None
         """
         if location == (None, None):
             return
+        photo = None
         if filename is not None:
             image = tk.PhotoImage(file=filename)
         elif data is not None:
@@ -500,11 +712,24 @@ class Graph(Element):
                 image = tk.PhotoImage(data=data)
             except:
                 return None  # an error likely means the window has closed so exit
+        elif pixels is not None:
+            photo = self.Images.get(figure) if figure is not None else None
+            try:
+                image = _put_pixels_in_photo_image(photo, pixels, pixels_size)
+            except Exception as e:
+                _error_popup_with_traceback('Error in Graph.draw_image - Bad pixels', e)
+                return None
         converted_point = self._convert_xy_to_canvas_xy(location[0], location[1])
         if self._TKCanvas2 is None:
             print('*** WARNING - The Graph element has not been finalized and cannot be drawn upon ***')
             print('Call Window.Finalize() prior to this operation')
             return None
+        if photo is not None:  # the figure is already showing the image that the pixels were copied into
+            try:  # in case closed with X
+                self._TKCanvas2.coords(figure, converted_point)
+            except:
+                pass
+            return figure
         try:  # in case closed with X
             id = self._TKCanvas2.create_image(converted_point, image=image, anchor=tk.NW)
             self.Images[id] = image
@@ -521,6 +746,9 @@ class Graph(Element):
             print('Call Window.Finalize() prior to this operation')
             return None
         self.Images = {}
+        self._scene_figures = {}
+        self._scene_dirty = {}
+        self._scene_deleted_ids = []
         try:  # in case window was closed with X
             self._TKCanvas2.delete('all')
         except:
@@ -692,6 +920,174 @@ class Graph(Element):
         """
         self.BottomLeft = graph_bottom_left
         self.TopRight = graph_top_right
+        # every figure in the scene has to be moved to match the new coordinates on the next commit
+        for name, figure in self._scene_figures.items():
+            figure.committed_points = None
+            self._scene_dirty[name] = None
+
+    def set_scene_figure(self, name, figure_type, points, group=None, **options):
+        """
+        Adds a figure to the Graph's scene or replaces one already there.  The scene is a "retained" way of drawing.
+        Rather than erasing and drawing everything again for every frame of an animation, the figures are given names,
+        changed using the scene methods, and then commit_scene is called.  Only the figures that changed since the last
+        commit are changed on the canvas, and they are changed in place rather than deleted and drawn again.
+        Nothing is shown until commit_scene is called.
+
+        :param name:        Name for the figure. Used to change or delete it later
+        :type name:         (Any)
+        :param figure_type: Type of figure - 'line', 'polygon', 'rectangle', 'oval', 'arc' or 'text'
+        :type figure_type:  (str)
+        :param points:      Points using USER'S coordinate system. Rectangles, ovals and arcs use (top_left, bottom_right). Text uses a single point in a list
+        :type points:       List[(int, int) | Tuple[float, float]]
+        :param group:       Name of the group the figure is part of. All figures in a group can be moved or deleted together
+        :type group:        (Any)
+        :param options:     tkinter canvas item options for the figure (fill, outline, width, text, font, etc)
+        :type options:      Any
+        """
+        if figure_type not in _SCENE_FIGURE_TYPES:
+            _error_popup_with_traceback('Error in Graph.set_scene_figure - Bad figure type', 'Figure type = {}'.format(figure_type), 'Valid types are {}'.format(_SCENE_FIGURE_TYPES))
+            return
+        figure = self._scene_figures.get(name)
+        if figure is not None and figure.figure_type == figure_type:
+            figure.points = [tuple(point) for point in points]
+            figure.options = dict(options)
+            figure.group = group
+        else:
+            if figure is not None:
+                self._scene_deleted_ids.append(figure.id)
+            self._scene_figures[name] = _SceneFigure(figure_type, [tuple(point) for point in points], dict(options), group)
+        self._scene_dirty[name] = None
+
+    def update_scene_figure(self, name, points=None, **options):
+        """
+        Changes a figure in the Graph's scene.  Only the values passed in are changed.  The change is shown on the
+        next call to commit_scene.
+
+        :param name:    The name the figure was given when set_scene_figure was called
+        :type name:     (Any)
+        :param points:  New points using USER'S coordinate system. If None, the figure's points are not changed
+        :type points:   List[(int, int) | Tuple[float, float]]
+        :param options: tkinter canvas item options to change (fill, outline, width, text, font, etc)
+        :type options:  Any
+        """
+        figure = self._scene_figures.get(name)
+        if figure is None:
+            print('** Scene figure not found **', name)
+            return
+        if points is not None:
+            figure.points = [tuple(point) for point in points]
+        figure.options.update(options)
+        self._scene_dirty[name] = None
+
+    def move_scene_group(self, group, x_direction, y_direction):
+        """
+        Moves every figure in a group of the Graph's scene by the amounts given in USER'S coordinates.  The move is
+        shown on the next call to commit_scene.
+
+        :param group:       The group to move
+        :type group:        (Any)
+        :param x_direction: how far to move in the "X" direction in your coordinates
+        :type x_direction:  int | float
+        :param y_direction: how far to move in the "Y" direction in your coordinates
+        :type y_direction:  int | float
+        """
+        for name, figure in self._scene_figures.items():
+            if figure.group == group:
+                figure.points = [(x + x_direction, y + y_direction) for x, y in figure.points]
+                self._scene_dirty[name] = None
+
+    def delete_scene_figure(self, name):
+        """
+        Removes a figure from the Graph's scene.  It's removed from the canvas on the next call to commit_scene.
+
+        :param name: The name the figure was given when set_scene_figure was called
+        :type name:  (Any)
+        """
+        figure = self._scene_figures.pop(name, None)
+        if figure is None:
+            return
+        self._scene_dirty.pop(name, None)
+        if figure.id is not None:
+            self._scene_deleted_ids.append(figure.id)
+
+    def delete_scene_group(self, group):
+        """
+        Removes every figure in a group from the Graph's scene.  They are removed from the canvas on the next call to commit_scene.
+
+        :param group: The group to delete
+        :type group:  (Any)
+        """
+        for name in [name for name, figure in self._scene_figures.items() if figure.group == group]:
+            self.delete_scene_figure(name)
+
+    def get_scene_figure_id(self, name):
+        """
+        Returns the id of the canvas figure for a figure in the Graph's scene.  The id can be used with the other Graph
+        methods that take an id such as bring_figure_to_front.  The id is None until the figure has been committed.
+
+        :param name: The name the figure was given when set_scene_figure was called
+        :type name:  (Any)
+        :return:     The id of the figure or None if not found or not yet committed
+        :rtype:      int | None
+        """
+        figure = self._scene_figures.get(name)
+        return None if figure is None else figure.id
+
+    def commit_scene(self):
+        """
+        Shows the changes made to the Graph's scene since the last commit.  Figures that were added are drawn, figures
+        that were changed are changed in place and figures that were deleted are removed. Figures that were not changed
+        are not touched.  Call this once per frame of an animation after making all of the changes for the frame.
+
+        :return: The number of figures that were drawn or changed, or None if the window was closed
+        :rtype:  int | None
+        """
+        if self._TKCanvas2 is None:
+            print('*** WARNING - The Graph element has not been finalized and cannot be drawn upon ***')
+            print('Call Window.Finalize() prior to this operation')
+            return None
+        canvas = self._TKCanvas2
+        changed = 0
+        deleted_ids = [id for id in self._scene_deleted_ids if id is not None]
+        dirty = self._scene_dirty
+        self._scene_deleted_ids = []
+        self._scene_dirty = {}
+        try:  # in case window was closed with X
+            if deleted_ids:
+                canvas.delete(*deleted_ids)
+        except tk.TclError:
+            return None
+        for name in dirty:
+            figure = self._scene_figures[name]
+            try:
+                if figure.id is None or figure.points != figure.committed_points:
+                    xs, ys = self._convert_points_to_canvas_xy(figure.points)
+                    coords = [value for point in zip(xs, ys) for value in point]
+                else:
+                    coords = None
+                if figure.id is None:
+                    figure.id = getattr(canvas, 'create_' + figure.figure_type)(*coords, **figure.options)
+                else:
+                    changed_options = {option: value for option, value in figure.options.items() if option not in figure.committed_options or figure.committed_options[option] != value}
+                    # options no longer given are put back to their defaults. The default is item 3 of tkinter's option description
+                    for option in figure.committed_options:
+                        if option not in figure.options:
+                            changed_options[option] = canvas.itemconfigure(figure.id, option)[3]
+                    if coords is None and not changed_options:
+                        continue
+                    if coords is not None:
+                        canvas.coords(figure.id, *coords)
+                    if changed_options:
+                        canvas.itemconfigure(figure.id, **changed_options)
+            except tk.TclError as e:
+                if self._this_elements_window_closed():
+                    return None
+                print('Error encountered committing scene figure', name, e)
+                continue
+            figure.committed_points = list(figure.points)
+            figure.committed_options = dict(figure.options)
+            changed += 1
+        return changed
 
     @property
     def tk_canvas(self):
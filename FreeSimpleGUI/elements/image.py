@@ -3,11 +3,165 @@ from __future__ import annotations
 import time
 import tkinter as tk
 import warnings
+from collections import OrderedDict
 
+from FreeSimpleGUI import _put_pixels_in_photo_image
 from FreeSimpleGUI import ELEM_TYPE_IMAGE
 from FreeSimpleGUI._utils import _error_popup_with_traceback
 from FreeSimpleGUI.elements.base import Element
 
+# Frames of animated GIFs shared by all Image elements, including popup_animated's windows. Least recently used first
+_gif_frame_cache = OrderedDict()  # type: OrderedDict[str | bytes, _GifFrames]
+_gif_frame_cache_root = None  # the tkinter root the cached frames belong to
+_GIF_FRAME_CACHE_MAX_PIXELS = 16_000_000  # least recently used GIFs are dropped when the decoded frames have more pixels than this
+
+
+def _skip_gif_sub_blocks(gif, pos):
+    """
+    Not user callable.  Returns the position just after a chain of GIF data sub-blocks.
+
+    :param gif: The GIF file's contents
+    :type gif:  (bytes)
+    :param pos: Position of the first sub-block's size byte
+    :type pos:  (int)
+    :return:    Position just after the block terminator
+    :rtype:     (int)
+    """
+    while gif[pos]:
+        pos += gif[pos] + 1
+    return pos + 1
+
+
+def _split_gif_frames(source):
+    """
+    Not user callable.  Splits an animated GIF into a small GIF for each frame.  Each has the GIF's header and global
+    colors followed by just one frame, so tkinter decodes only that frame rather than reading through every frame
+    before it as it does for 'gif -index' images.  The file is read and split once, which is cheap since nothing is decoded.
+
+    :param source: Filename or Base64 encoded string containing the GIF
+    :type source:  str | bytes
+    :return:       The GIF data of each frame or None if source is not a GIF that can be split
+    :rtype:        List[bytes] | None
+    """
+    try:
+        if type(source) is not bytes:
+            with open(source, 'rb') as f:
+                gif = f.read()
+        elif source[:3] == b'GIF':
+            gif = source
+        else:
+            import base64
+
+            gif = base64.b64decode(source)
+        if gif[:6] not in (b'GIF87a', b'GIF89a'):
+            return None
+        pos = 13
+        if gif[10] & 0x80:  # global color table follows the logical screen descriptor
+            pos += 3 << ((gif[10] & 7) + 1)
+        header = gif[:pos]
+        frames = []
+        control = b''
+        while pos < len(gif) and gif[pos] != 0x3B:  # 0x3B is the trailer
+            start = pos
+            if gif[pos] == 0x21:  # extension
+                pos = _skip_gif_sub_blocks(gif, pos + 2)
+                if gif[start + 1] == 0xF9:  # graphic control extension. Holds the transparent color of the next frame
+                    control = gif[start:pos]
+            elif gif[pos] == 0x2C:  # image descriptor
+                if gif[pos + 9] & 0x80:  # local color table
+                    pos += 3 << ((gif[pos + 9] & 7) + 1)
+                pos = _skip_gif_sub_blocks(gif, pos + 11)  # skips the descriptor and the LZW minimum code size
+                frames.append(header + control + gif[start:pos] + b';')
+                control = b''
+            else:
+                break  # not a block that can be in a GIF. Use the frames found so far
+    except (OSError, IndexError, ValueError):
+        return None
+    return frames or None
+
+
+class _GifFrames:
+    """
+    The frames of an animated GIF.  The GIF is split into its frames once and each frame is decoded into a PhotoImage
+    the first time it's shown, so the first frame is shown right away rather than after every frame has been decoded.
+    """
+
+    def __init__(self, source):
+        """
+        :param source: Filename or Base64 encoded string containing the GIF
+        :type source:  str | bytes
+        """
+        self.root = tk._default_root  # the tkinter root the frames belong to
+        self.frame_data = _split_gif_frames(source)
+        self.pixels = 0  # pixels of the frames decoded so far
+        if self.frame_data is not None:
+            self.images = [None] * len(self.frame_data)  # type: List[tk.PhotoImage | None]
+            return
+        # Not a GIF that could be split. Let tkinter find the frames, loading up to 1000 of them
+        self.images = []
+        for i in range(1000):
+            try:
+                if type(source) is not bytes:
+                    image = tk.PhotoImage(file=source, format='gif -index %i' % (i))
+                else:
+                    image = tk.PhotoImage(data=source, format='gif -index %i' % (i))
+            except Exception:
+                break
+            self.images.append(image)
+            self.pixels += image.width() * image.height()
+
+    def frame(self, index):
+        """
+        Returns a frame, decoding it if this is the first time it's been asked for
+
+        :param index: The frame number
+        :type index:  (int)
+        :return:      The frame or None if it could not be decoded
+        :rtype:       tk.PhotoImage | None
+        """
+        image = self.images[index]
+        if image is None:
+            try:
+                image = self.images[index] = tk.PhotoImage(data=self.frame_data[index], format='gif')
+            except Exception:
+                return None
+            self.pixels += image.width() * image.height()
+            _trim_gif_frame_cache()
+        return image
+
+
+def _gif_frames_from_cache(source):
+    """
+    Not user callable.  Returns the frames of an animated GIF from the shared cache, adding them if needed.
+
+    :param source: Filename or Base64 encoded string containing the GIF
+    :type source:  str | bytes
+    :return:       The frames of the GIF
+    :rtype:        (_GifFrames)
+    """
+    global _gif_frame_cache_root
+    if _gif_frame_cache_root is not tk._default_root:  # images can't be used with a different root
+        _gif_frame_cache_root = tk._default_root
+        _gif_frame_cache.clear()
+    frames = _gif_frame_cache.get(source)
+    if frames is None:
+        frames = _gif_frame_cache[source] = _GifFrames(source)
+        _trim_gif_frame_cache()
+    else:
+        _gif_frame_cache.move_to_end(source)
+    return frames
+
+
+def _trim_gif_frame_cache():
+    """
+    Not user callable.  Drops the least recently used GIFs from the cache until its frames have no more than
+    _GIF_FRAME_CACHE_MAX_PIXELS pixels.  The most recently used GIF is always kept.
+    """
+    total_pixels = sum(frames.pixels for frames in _gif_frame_cache.values())
+    while total_pixels > _GIF_FRAME_CACHE_MAX_PIXELS and len(_gif_frame_cache) > 1:
+        source, frames = _gif_frame_cache.popitem(last=False)
+        total_pixels -= frames.pixels
+
 
 class Image(Element):
     """
@@ -99,6 +253,10 @@ class Image(Element):
         self.LastFrameTime = 0
         self.ImageSubsample = subsample
         self.zoom = int(zoom) if zoom is not None else None
+        self._pixels_image = None  # type: tk.PhotoImage | None  # reused every time update is called with pixels
+        self._gif_frames = None  # type: _GifFrames | None  # frames being shown by update_animation. Kept even if the cache drops them
+        self._unbuffered_source = None
+        self._unbuffered_frame_data = None  # GIF data for each frame of the GIF shown by update_animation_no_buffering
 
         self.Source = filename if filename is not None else data
         key = key if key is not None else k
@@ -119,7 +277,7 @@ class Image(Element):
         )
         return
 
-    def update(self, source=None, filename=None, data=None, size=(None, None), subsample=None, zoom=None, visible=None):
+    def update(self, source=None, filename=None, data=None, size=(None, None), subsample=None, zoom=None, visible=None, pixels=None, pixels_size=None):
         """
         Changes some of the settings for the Image Element. Must call `Window.Read` or `Window.Finalize` prior.
         To clear an image that's been displayed, call with NONE of the options set.  A blank update call will
@@ -145,6 +303,10 @@ class Image(Element):
         :type zoom:      (int)
         :param visible:  control visibility of element
         :type visible:   (bool)
+        :param pixels:   Raw pixels, row after row, 3 bytes (RGB), 4 bytes (RGBA, alpha is not shown) or 1 byte (grayscale) per pixel. A NumPy uint8 array with a shape of (height, width, channels) can be passed directly. The pixels are copied into the same image every update, so no PNG encoding is needed. Fastest way to show video frames
+        :type pixels:    bytes | bytearray | memoryview | numpy.ndarray
+        :param pixels_size: (width, height) of the pixels. Only needed when pixels is a flat buffer such as bytes
+        :type pixels_size:  (int, int) | None
         """
 
         if not self._widget_was_created():  # if widget hasn't been created yet, then don't allow
@@ -185,7 +347,26 @@ class Image(Element):
                 image = data
                 # return  # an error likely means the window has closed so exit
 
-        if image is not None:
+        elif pixels is not None:
+            try:
+                image = self._pixels_image = _put_pixels_in_photo_image(self._pixels_image, pixels, pixels_size)
+                if subsample is not None:
+                    image = image.subsample(subsample)
+                if zoom is not None:
+                    image = image.zoom(int(zoom))
+            except Exception as e:
+                _error_popup_with_traceback('Exception updating Image element', e)
+
+        if image is not None and image is getattr(self.tktext_label, 'image', None):
+            # The pixels were copied into the image already being shown. tkinter redraws it, only the size may need changing
+            try:
+                self.tktext_label.configure(
+                    width=size[0] if size[0] is not None else image.width(),
+                    height=size[1] if size[1] is not None else image.height(),
+                )
+            except Exception as e:
+                _error_popup_with_traceback('Exception updating Image element', e)
+        elif image is not None:
             self.tktext_label.configure(image='')  # clear previous image
             if self.tktext_label.image is not None:
                 del self.tktext_label.image
@@ -207,7 +388,7 @@ class Image(Element):
             self._pack_restore_settings()
 
         # if everything is set to None, then delete the image
-        if filename is None and image is None and visible is None and size == (None, None):
+        if filename is None and image is None and pixels is None and visible is None and size == (None, None):
             # Using a try because the image may have been previously deleted and don't want an error if that's happened
             try:
                 self.tktext_label.configure(image='', width=1, height=1, bd=0)
@@ -221,6 +402,9 @@ class Image(Element):
     def update_animation(self, source, time_between_frames=0):
         """
         Show an Animated GIF. Call the function as often as you like. The function will determine when to show the next frame and will automatically advance to the next frame at the right time.
+        The frames are kept in a cache shared by all Image elements, so switching between GIFs does not load them again.
+        An element keeps the frames it is showing even if the cache drops them, so its animation is never restarted.
+        Each frame is decoded the first time it is shown.
         NOTE - does NOT perform a sleep call to delay
         :param source:              Filename or Base64 encoded string containing Animated GIF
         :type source:               str | bytes | None
@@ -228,28 +412,19 @@ class Image(Element):
         :type time_between_frames:  (int)
         """
 
-        if self.Source != source:
-            self.AnimatedFrames = None
-            self.Source = source
-
-        if self.AnimatedFrames is None:
-            self.TotalAnimatedFrames = 0
-            self.AnimatedFrames = []
-            # Load up to 1000 frames of animation.  stops when a bad frame is returns by tkinter
-            for i in range(1000):
-                if type(source) is not bytes:
-                    try:
-                        self.AnimatedFrames.append(tk.PhotoImage(file=source, format='gif -index %i' % (i)))
-                    except Exception:
-                        break
-                else:
-                    try:
-                        self.AnimatedFrames.append(tk.PhotoImage(data=source, format='gif -index %i' % (i)))
-                    except Exception:
-                        break
+        frames = self._gif_frames
+        if frames is None or self.Source != source or frames.root is not tk._default_root:
+            frames = self._gif_frames = _gif_frames_from_cache(source)
+        elif _gif_frame_cache.get(source) is frames:
+            _gif_frame_cache.move_to_end(source)
+        self.Source = source
+        if self.AnimatedFrames is not frames.images:  # a different GIF
+            self.AnimatedFrames = frames.images
             self.TotalAnimatedFrames = len(self.AnimatedFrames)
             self.LastFrameTime = time.time()
             self.CurrentFrameNumber = -1  # start at -1 because it is incremented before every frame is shown
+        if not self.TotalAnimatedFrames:
+            return
         # show the frame
 
         now = time.time()
@@ -262,15 +437,19 @@ class Image(Element):
                 return
         else:
             self.CurrentFrameNumber = (self.CurrentFrameNumber + 1) % self.TotalAnimatedFrames
-        image = self.AnimatedFrames[self.CurrentFrameNumber]
+        image = frames.frame(self.CurrentFrameNumber)
+        if image is None:
+            return
         try:  # needed in case the window was closed with an "X"
             self.tktext_label.configure(image=image, width=image.width(), heigh=image.height())
+            self.tktext_label.image = image  # keeps the frame alive should the cache drop it
         except Exception as e:
             print('Exception in update_animation', e)
 
     def update_animation_no_buffering(self, source, time_between_frames=0):
         """
         Show an Animated GIF. Call the function as often as you like. The function will determine when to show the next frame and will automatically advance to the next frame at the right time.
+        Only the frame being shown is decoded. The GIF is split into its frames once, so each frame is decoded without reading through the frames before it.
         NOTE - does NOT perform a sleep call to delay
 
         :param source:              Filename or Base64 encoded string containing Animated GIF
@@ -283,6 +462,10 @@ class Image(Element):
             self.AnimatedFrames = None
             self.Source = source
             self.frame_num = 0
+        if self._unbuffered_source is not source and self._unbuffered_source != source:
+            self._unbuffered_source = source
+            self._unbuffered_frame_data = _split_gif_frames(source)
+            self.frame_num = 0
 
         now = time.time()
 
@@ -292,8 +475,16 @@ class Image(Element):
             else:  # don't reshow the frame again if not time for new frame
                 return
 
-        # read a frame
-        while True:
+        frame_data = self._unbuffered_frame_data
+        if frame_data is not None:
+            self.frame_num %= len(frame_data)
+            try:
+                self.image = tk.PhotoImage(data=frame_data[self.frame_num], format='gif')
+            except:
+                pass
+            self.frame_num += 1
+        # read a frame. Used for images that could not be split into frames
+        while frame_data is None:
             if type(source) is not bytes:
                 try:
                     self.image = tk.PhotoImage(file=source, format='gif -index %i' % (self.frame_num))
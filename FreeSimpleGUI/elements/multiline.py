@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import sys
+import threading
 import tkinter as tk
 
 import FreeSimpleGUI
@@ -67,6 +68,10 @@ class Multiline(Element):
         right_click_menu=None,
         visible=True,
         metadata=None,
+        buffered=False,
+        buffer_latency=50,
+        max_lines=None,
+        max_chars=None,
     ):
         """
         :param default_text:                 Initial text to show
@@ -161,6 +166,14 @@ class Multiline(Element):
         :type visible:                       (bool)
         :param metadata:                     User metadata that can be set to ANYTHING
         :type metadata:                      (Any)
+        :param buffered:                     If True, text added to the end (print, cprint, write, update with append=True) is collected and shown in one operation at most buffer_latency ms later or at the next window.read / window.refresh. Use for chatty output such as rerouted stdout
+        :type buffered:                      (bool)
+        :param buffer_latency:               When buffered, the longest time in milliseconds text waits before it's shown
+        :type buffer_latency:                (int)
+        :param max_lines:                    If set, the oldest lines are removed so that no more than this many lines are kept. Use for logs that run for a long time
+        :type max_lines:                     (int)
+        :param max_chars:                    If set, the oldest lines are removed so that no more than about this many characters are kept
+        :type max_chars:                     (int)
         """
 
         self.DefaultText = str(default_text)
@@ -198,6 +211,14 @@ class Multiline(Element):
         self.no_scrollbar = no_scrollbar
         self.hscrollbar = None  # The horizontal scrollbar
         self.auto_scroll_only_at_bottom = autoscroll_only_at_bottom
+        self.buffered = buffered
+        self.buffer_latency = buffer_latency
+        self._buffer = []  # list of [justification tag, text color, background color, font, list of strings]
+        self._buffer_lock = threading.Lock()
+        self._buffer_flush_scheduled = False
+        self.max_lines = max_lines
+        self.max_chars = max_chars
+        self._character_count = None  # number of characters in the widget when max_chars is used. None means it must be counted
         sz = size if size != (None, None) else s
 
         super().__init__(
@@ -281,43 +302,31 @@ class Multiline(Element):
 
         if autoscroll is not None:
             self.Autoscroll = autoscroll
-        current_scroll_position = self.TKText.yview()[1]
 
-        if justification is not None:
-            if justification.startswith('l'):
-                just_tag = 'left'
-            if justification.startswith('r'):
-                just_tag = 'right'
-            if justification.startswith('c'):
-                just_tag = 'center'
-        else:
-            just_tag = self.justification_tag
+        if self.buffered:
+            if append and value is not None and disabled is None and font is None and text_color is None and background_color is None and visible is None:
+                self._buffer_write(str(value), self._justification_to_tag(justification), text_color_for_value, background_color_for_value, font_for_value)
+                return
+            self._flush_buffer()  # anything else must happen after the text already buffered is shown
+
+        current_scroll_position = self.TKText.yview()[1]
+        just_tag = self._justification_to_tag(justification)
 
         tag = None
         if value is not None:
             value = str(value)
-            if background_color_for_value is not None or text_color_for_value is not None or font_for_value is not None:
-                try:
-                    tag = 'Multiline(' + str(text_color_for_value) + ',' + str(background_color_for_value) + ',' + str(font_for_value) + ')'
-                    if tag not in self.tags:
-                        self.tags.add(tag)
-                    if background_color_for_value is not None:
-                        self.TKText.tag_configure(tag, background=background_color_for_value)
-                    if text_color_for_value is not None:
-                        self.TKText.tag_configure(tag, foreground=text_color_for_value)
-                    if font_for_value is not None:
-                        self.TKText.tag_configure(tag, font=font_for_value)
-                except Exception as e:
-                    print('* Multiline.update - bad color likely specified:', e)
+            tag = self._value_tag(text_color_for_value, background_color_for_value, font_for_value)
             if self.Disabled:
                 self.TKText.configure(state='normal')
             try:
                 if not append:
                     self.TKText.delete('1.0', tk.END)
+                    self._character_count = None
                 if tag is not None or just_tag is not None:
                     self.TKText.insert(tk.END, value, (just_tag, tag))
                 else:
                     self.TKText.insert(tk.END, value)
+                self._trim_to_limits(len(value))
             except Exception as e:
                 print('* Error setting multiline *', e)
             if self.Disabled:
@@ -353,6 +362,164 @@ class Multiline(Element):
         if visible is not None:
             self._visible = visible
 
+    def _justification_to_tag(self, justification):
+        """
+        Not user callable.  Returns the tag to use for a justification parameter
+
+        :param justification: text justification. left, right, center. Can use single characters l, r, c. If None, the element's justification is used
+        :type justification:  (str)
+        :return:              The name of the justification tag
+        :rtype:               (str)
+        """
+        if justification is not None:
+            if justification.startswith('l'):
+                return 'left'
+            if justification.startswith('r'):
+                return 'right'
+            if justification.startswith('c'):
+                return 'center'
+        return self.justification_tag
+
+    def _value_tag(self, text_color, background_color, font):
+        """
+        Not user callable.  Returns the tag for text added with its own colors or font, configuring it in tkinter.
+
+        :param text_color:       color of the text
+        :type text_color:        (str)
+        :param background_color: color of the background of the text
+        :type background_color:  (str)
+        :param font:             font of the text
+        :type font:              str | (str, int)
+        :return:                 The name of the tag or None if no colors or font were specified
+        :rtype:                  str | None
+        """
+        if background_color is None and text_color is None and font is None:
+            return None
+        tag = 'Multiline(' + str(text_color) + ',' + str(background_color) + ',' + str(font) + ')'
+        try:
+            if tag not in self.tags:
+                self.tags.add(tag)
+            if background_color is not None:
+                self.TKText.tag_configure(tag, background=background_color)
+            if text_color is not None:
+                self.TKText.tag_configure(tag, foreground=text_color)
+            if font is not None:
+                self.TKText.tag_configure(tag, font=font)
+        except Exception as e:
+            print('* Multiline.update - bad color likely specified:', e)
+        return tag
+
+    def _buffer_write(self, text, just_tag, text_color, background_color, font):
+        """
+        Not user callable.  Adds text to the buffer of a buffered Multiline.  Text with the same colors, font and
+        justification as the text before it is combined with it so that it's inserted as a single piece.  The first
+        text added after a flush schedules the next flush.  May be called from a thread.
+
+        :param text:             The text to add
+        :type text:              (str)
+        :param just_tag:         The justification tag for the text
+        :type just_tag:          (str)
+        :param text_color:       color of the text
+        :type text_color:        (str)
+        :param background_color: color of the background of the text
+        :type background_color:  (str)
+        :param font:             font of the text
+        :type font:              str | (str, int)
+        """
+        with self._buffer_lock:
+            if self._buffer and self._buffer[-1][:4] == [just_tag, text_color, background_color, font]:
+                self._buffer[-1][4].append(text)
+            else:
+                self._buffer.append([just_tag, text_color, background_color, font, [text]])
+            if self._buffer_flush_scheduled:
+                return
+            self._buffer_flush_scheduled = True
+        window = self.ParentForm
+        with window._multilines_to_flush_lock:
+            window._multilines_to_flush[self] = None
+        try:
+            self.TKText.tk.willdispatch()
+            self.TKText.after(self.buffer_latency, self._flush_buffer)
+        except:
+            pass
+
+    def _flush_buffer(self):
+        """
+        Not user callable.  Shows all of the text in the buffer of a buffered Multiline using a single insert.
+        """
+        with self._buffer_lock:
+            segments = self._buffer
+            self._buffer = []
+            self._buffer_flush_scheduled = False
+        if not segments or self._this_elements_window_closed():
+            return
+        current_scroll_position = self.TKText.yview()[1]
+        insert_args = []
+        for just_tag, text_color, background_color, font, texts in segments:
+            tag = self._value_tag(text_color, background_color, font)
+            insert_args += [''.join(texts), (just_tag, tag) if tag is not None or just_tag is not None else ()]
+        if self.Disabled:
+            self.TKText.configure(state='normal')
+        try:
+            self.TKText.insert(tk.END, *insert_args)
+            self._trim_to_limits(sum(len(text) for text in insert_args[::2]))
+        except Exception as e:
+            print('* Error setting multiline *', e)
+        if self.Disabled:
+            self.TKText.configure(state='disabled')
+        self.DefaultText = insert_args[-2]
+        if self.Autoscroll:
+            if not self.auto_scroll_only_at_bottom or (self.auto_scroll_only_at_bottom and current_scroll_position == 1.0):
+                self.TKText.see(tk.END)
+
+    def _trim_to_limits(self, characters_added):
+        """
+        Not user callable.  Removes the oldest lines when the element has grown past its max_lines or max_chars.
+        The element is allowed to grow about 10% past its limit before lines are removed so that the removal is done
+        in batches rather than on every insert.  The widget must be in the normal (not disabled) state.
+
+        :param characters_added: The number of characters that were just added
+        :type characters_added:  (int)
+        """
+        if self.max_lines is not None:
+            lines = int(self.TKText.index('end-1c').split('.')[0])
+            if lines > self.max_lines + max(self.max_lines // 10, 1):
+                self.TKText.delete('1.0', '{}.0'.format(lines - self.max_lines + 1))
+                self._character_count = None
+        if self.max_chars is not None:
+            if self._character_count is None:
+                self._character_count = int(self.TKText.tk.call(self.TKText._w, 'count', '-chars', '1.0', 'end'))
+            else:
+                self._character_count += characters_added
+            if self._character_count > self.max_chars + max(self.max_chars // 10, 1):
+                end_index = '1.0 + {} chars lineend + 1 chars'.format(self._character_count - self.max_chars)  # remove whole lines only
+                self._character_count -= int(self.TKText.tk.call(self.TKText._w, 'count', '-chars', '1.0', end_index))
+                self.TKText.delete('1.0', end_index)
+
+    def set_max_size(self, max_lines=None, max_chars=None):
+        """
+        Sets the most lines and characters the element keeps.  When the limits are passed, the oldest lines are removed.
+        Use None for no limit.
+
+        :param max_lines: The most lines to keep
+        :type max_lines:  (int)
+        :param max_chars: About the most characters to keep. Only whole lines are removed
+        :type max_chars:  (int)
+        """
+        self.max_lines = max_lines
+        self.max_chars = max_chars
+        self._character_count = None
+        if not self._widget_was_created() or self._this_elements_window_closed():
+            return
+        if self.Disabled:
+            self.TKText.configure(state='normal')
+        try:
+            self._trim_to_limits(0)
+        except Exception as e:
+            print('* Error setting multiline *', e)
+        if self.Disabled:
+            self.TKText.configure(state='disabled')
+
     def get(self):
         """
         Return current contents of the Multiline Element
@@ -360,6 +527,8 @@ class Multiline(Element):
         :return: current contents of the Multiline Element (used as an input type of Multiline
         :rtype:  (str)
         """
+        if self.buffered:
+            self._flush_buffer()
         value = str(self.TKText.get(1.0, tk.END))
         if self.rstrip:
             return value.rstrip()
@@ -503,12 +672,15 @@ class Multiline(Element):
     def flush(self):
         """
         Flush parameter was passed into a print statement.
-        For now doing nothing.  Not sure what action should be taken to ensure a flush happens regardless.
+        For a buffered Multiline, the text waiting in the buffer is shown right away when called from the GUI thread.
+        Calls made from other threads leave the text for the scheduled flush as tkinter can only be used from the GUI thread.
         """
         # try:
         #     self.previous_stdout.flush()
         # except:
         #     pass
+        if self.buffered and threading.current_thread() is threading.main_thread():
+            self._flush_buffer()
         return
 
     def set_ibeam_color(self, ibeam_color=None):
@@ -593,6 +765,10 @@ class Output(Multiline):
         sbar_arrow_width=None,
         sbar_frame_color=None,
         sbar_relief=None,
+        buffered=False,
+        buffer_latency=50,
+        max_lines=None,
+        max_chars=None,
     ):
         """
         :param size:                        (w, h) w=characters-wide, h=rows-high. If an int instead of a tuple is supplied, then height is auto-set to 1
@@ -647,6 +823,14 @@ class Output(Multiline):
         :type sbar_frame_color:             (str)
         :param sbar_relief:                 Scrollbar relief that will be used for the "thumb" of the scrollbar (the thing you grab that slides). Should be a constant that is defined at starting with "RELIEF_" - RELIEF_RAISED, RELIEF_SUNKEN, RELIEF_FLAT, RELIEF_RIDGE, RELIEF_GROOVE, RELIEF_SOLID
         :type sbar_relief:                  (str)
+        :param buffered:                    If True, output is collected and shown in one operation at most buffer_latency ms later or at the next window.read / window.refresh. Use for chatty output
+        :type buffered:                     (bool)
+        :param buffer_latency:              When buffered, the longest time in milliseconds output waits before it's shown
+        :type buffer_latency:               (int)
+        :param max_lines:                   If set, the oldest lines are removed so that no more than this many lines are kept
+        :type max_lines:                    (int)
+        :param max_chars:                   If set, the oldest lines are removed so that no more than about this many characters are kept
+        :type max_chars:                    (int)
         """
 
         super().__init__(
@@ -682,4 +866,8 @@ class Output(Multiline):
             sbar_arrow_width=sbar_arrow_width,
             sbar_frame_color=sbar_frame_color,
             sbar_relief=sbar_relief,
+            buffered=buffered,
+            buffer_latency=buffer_latency,
+            max_lines=max_lines,
+            max_chars=max_chars,
         )
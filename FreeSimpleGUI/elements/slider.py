@@ -161,6 +161,7 @@ class Slider(Element):
 
         if range != (None, None):
             self.TKScale.config(from_=range[0], to_=range[1])
+            self._value_dirty = True  # value may have been clipped to the new range
         if value is not None:
             try:
                 self.TKIntVar.set(value)
@@ -160,6 +160,7 @@ class Spin(Element):
         if values is not None:
             old_value = self.TKStringVar.get()
             self.Values = values
+            self._value_dirty = True  # returned value is looked up in Values so it must be read again
             self.TKSpinBox.configure(values=values)
             self.TKStringVar.set(old_value)
         if value is not None:
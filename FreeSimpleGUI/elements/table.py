@@ -2,6 +2,9 @@ from __future__ import annotations
 
 import warnings
 from tkinter import ttk
+from typing import Any
+from typing import Dict
+from typing import Tuple
 
 import FreeSimpleGUI
 from FreeSimpleGUI import COLOR_SYSTEM_DEFAULT
@@ -45,6 +48,11 @@ class Table(Element):
         header_border_width=None,
         header_relief=None,
         row_colors=None,
+        virtual=False,
+        row_provider=None,
+        row_count=None,
+        overscan=20,
+        row_key=None,
         vertical_scroll_only=True,
         hide_vertical_scroll=False,
         border_width=None,
@@ -124,6 +132,16 @@ class Table(Element):
         :type header_relief:            (str | None)
         :param row_colors:              list of tuples of (row, background color) OR (row, foreground color, background color). Sets the colors of listed rows to the color(s) provided (note the optional foreground color)
         :type row_colors:               List[Tuple[int, str] | Tuple[Int, str, str]]
+        :param virtual:                 if True only the rows that can be seen (plus the overscan rows) are created in the table. They are reused as the table is scrolled. Use for very large tables. values can then be any sequence that supports len and slicing
+        :type virtual:                  (bool)
+        :param row_provider:            Function called as row_provider(start, stop) that returns the rows start up to (not including) stop. Use instead of values for a virtual table. Setting it makes the table virtual
+        :type row_provider:             Callable[[int, int], List[List[str | int | float]]]
+        :param row_count:               The total number of rows the row_provider can provide
+        :type row_count:                (int)
+        :param overscan:                Virtual tables only. Number of rows created above and below the visible rows so that short scrolls do not need new rows
+        :type overscan:                 (int)
+        :param row_key:                 Function called with a row that returns a value that identifies the row (an id, a filename, etc). When given, update matches rows using this value so rows that changed position are moved instead of being deleted and inserted again. Not used by virtual tables
+        :type row_key:                  Callable[[List[str | int | float]], Any]
         :param vertical_scroll_only:    if True only the vertical scrollbar will be visible
         :type vertical_scroll_only:     (bool)
         :param hide_vertical_scroll:    if True vertical scrollbar will be hidden
@@ -226,7 +244,24 @@ class Table(Element):
 
         self.RightClickMenu = right_click_menu
         self.RowColors = row_colors
-        self.tree_ids = []  # ids returned when inserting items into table - will use to delete colors
+        self.tree_ids = []  # ids of the items in the table, in the order they're shown
+        self.row_key = row_key
+        self._values_snapshot = []  # copy of each row shown so that changes can be found even if the rows are changed in place
+        self._row_key_iids = {}  # type: Dict[Tuple[Any, int], str]
+        self._iid_rows = None  # type: Dict[str, int]  # row number of each item when a row_key is used
+        self._next_iid = 1
+        self.row_provider = row_provider
+        self.row_count = row_count
+        self.virtual = virtual or row_provider is not None
+        self.overscan = max(1, overscan)
+        self._virtual_start = 0  # row number of the first item in the treeview. Always 0 for tables that are not virtual
+        self._virtual_top = 0  # row number shown at the top of the table
+        self._virtual_item_count = 0  # number of items in the treeview
+        self._virtual_visible_rows = self.NumRows if self.NumRows else 10
+        self._virtual_modifier_state = 0  # state of the shift/control keys for the last click or key press
+        self._virtual_select_pending = False
+        self._color_tags = {}  # type: Dict[Tuple[str | None, str], str]
+        self._row_colors_by_row = self._make_row_colors_by_row(row_colors)
         key = key if key is not None else k
         sz = size if size != (None, None) else s
         pad = pad if pad is not None else p
@@ -254,7 +289,7 @@ class Table(Element):
         )
         return
 
-    def update(self, values=None, num_rows=None, visible=None, select_rows=None, alternating_row_color=None, row_colors=None):
+    def update(self, values=None, num_rows=None, visible=None, select_rows=None, alternating_row_color=None, row_colors=None, row_count=None):
         """
         Changes some of the settings for the Table Element. Must call `Window.Read` or `Window.Finalize` prior
 
@@ -276,6 +311,8 @@ class Table(Element):
         :type alternating_row_color:  (str)
         :param row_colors:            list of tuples of (row, background color) OR (row, foreground color, background color). Changes the colors of listed rows to the color(s) provided (note the optional foreground color)
         :type row_colors:             List[Tuple[int, str] | Tuple[Int, str, str]]
+        :param row_count:             Virtual tables using a row_provider only. The new total number of rows. The visible rows are fetched again from the row_provider
+        :type row_count:              (int)
         """
         if not self._widget_was_created():  # if widget hasn't been created yet, then don't allow
             return
@@ -284,36 +321,33 @@ class Table(Element):
             _error_popup_with_traceback('Error in Table.update - The window was closed')
             return
 
-        if values is not None:
-            for id in self.tree_ids:
-                self.TKTreeview.item(id, tags=())
-                if self.BackgroundColor is not None and self.BackgroundColor != COLOR_SYSTEM_DEFAULT:
-                    self.TKTreeview.tag_configure(id, background=self.BackgroundColor)
-                else:
-                    self.TKTreeview.tag_configure(id, background='#FFFFFF', foreground='#000000')
-                if self.TextColor is not None and self.TextColor != COLOR_SYSTEM_DEFAULT:
-                    self.TKTreeview.tag_configure(id, foreground=self.TextColor)
-                else:
-                    self.TKTreeview.tag_configure(id, foreground='#000000')
-
-            children = self.TKTreeview.get_children()
-            for i in children:
-                self.TKTreeview.detach(i)
-                self.TKTreeview.delete(i)
-            children = self.TKTreeview.get_children()
+        # Row colors are set before the rows so that rows inserted or moved get the right tag
+        if alternating_row_color is not None:  # alternating colors
+            self.AlternatingRowColor = alternating_row_color
+            self._configure_alternate_tag()
+        recolored_rows = set()
+        if values is not None or row_colors is not None:
+            recolored_rows.update(self._row_colors_by_row)
+            if values is not None:  # new values clear the colors of individual rows unless new ones are given
+                self._row_colors_by_row = {}
+            if row_colors is not None:  # individual row colors
+                self.RowColors = row_colors
+                self._row_colors_by_row = self._make_row_colors_by_row(row_colors)
+            recolored_rows.update(self._row_colors_by_row)
 
-            self.tree_ids = []
-            for i, value in enumerate(values):
-                if self.DisplayRowNumbers:
-                    value = [i + self.StartingRowNumber] + value
-                id = self.TKTreeview.insert('', 'end', text=value, iid=i + 1, values=value, tag=i)
-                if self.BackgroundColor is not None and self.BackgroundColor != COLOR_SYSTEM_DEFAULT:
-                    self.TKTreeview.tag_configure(id, background=self.BackgroundColor)
-                else:
-                    self.TKTreeview.tag_configure(id, background='#FFFFFF')
-                self.tree_ids.append(id)
-            self.Values = values
-            self.SelectedRows = []
+        if self.virtual:
+            if values is not None:
+                self.Values = values
+                self.SelectedRows = []
+            if row_count is not None:
+                self.row_count = row_count
+        else:
+            if values is not None:
+                self._update_rows(values)
+                self.SelectedRows = [self._iid_to_row(x) for x in self.TKTreeview.selection()]
+            for row in recolored_rows:
+                if row < len(self.tree_ids):
+                    self.TKTreeview.item(self.tree_ids[row], tags=self._row_color_tags(row))
         if visible is False:
             self._pack_forget_save_settings(self.element_frame)
         elif visible is True:
@@ -321,26 +355,314 @@ class Table(Element):
 
         if num_rows is not None:
             self.TKTreeview.config(height=num_rows)
+            self._virtual_visible_rows = num_rows
         if select_rows is not None:
-            rows_to_select = [i + 1 for i in select_rows]
-            self.TKTreeview.selection_set(rows_to_select)
-
-        if alternating_row_color is not None:  # alternating colors
-            self.AlternatingRowColor = alternating_row_color
+            if self.virtual:
+                self.SelectedRows = sorted(select_rows)
+                self._virtual_select_pending = True
+            else:
+                rows_to_select = [self._row_to_iid(i) for i in select_rows]
+                self.TKTreeview.selection_set(rows_to_select)
 
-        if self.AlternatingRowColor is not None:
-            for row in range(0, len(self.Values), 2):
-                self.TKTreeview.tag_configure(row, background=self.AlternatingRowColor)
-        if row_colors is not None:  # individual row colors
-            self.RowColors = row_colors
-            for row_def in self.RowColors:
-                if len(row_def) == 2:  # only background is specified
-                    self.TKTreeview.tag_configure(row_def[0], background=row_def[1])
-                else:
-                    self.TKTreeview.tag_configure(row_def[0], background=row_def[2], foreground=row_def[1])
+        if self.virtual and (values, row_count, num_rows, select_rows, alternating_row_color, row_colors) != (None,) * 6:
+            self._virtual_render(self._virtual_top)
         if visible is not None:
             self._visible = visible
 
+    def _update_rows(self, values):
+        """
+        Not user callable.  Changes the items in the treeview to match values.  The new values are compared with a copy
+        of the rows shown now and only rows that changed are changed in the treeview.  Rows added at the end are inserted
+        and rows no longer in the table are deleted.  If there is a row_key, rows are matched using their keys instead of
+        their position so that rows that moved are moved in the treeview, not deleted and inserted again.
+
+        :param values: The new rows of the table
+        :type values:  List[List[str | int | float]]
+        """
+        treeview = self.TKTreeview
+        old_iids, old_snapshot = self.tree_ids, self._values_snapshot
+        new_iids, new_snapshot = [], []
+        if self.row_key is None:
+            for i, value in enumerate(values):
+                row = tuple(value)
+                if i < len(old_iids):
+                    iid = old_iids[i]
+                    if row != old_snapshot[i]:
+                        treeview.item(iid, values=self._display_row(i, value))
+                else:
+                    iid = treeview.insert('', 'end', iid=i + 1, values=self._display_row(i, value), tags=self._row_color_tags(i))
+                new_iids.append(iid)
+                new_snapshot.append(row)
+            if len(old_iids) > len(values):
+                treeview.delete(*old_iids[len(values) :])
+        else:
+            old_rows = dict(zip(old_iids, old_snapshot))
+            old_positions = {iid: i for i, iid in enumerate(old_iids)}
+            old_key_iids, new_key_iids = self._row_key_iids, {}
+            inserted = []
+            for i, value in enumerate(values):
+                row = tuple(value)
+                key = self.row_key(value)
+                occurrence = 0
+                while (key, occurrence) in new_key_iids:  # rows with the same key are matched in the order they appear
+                    occurrence += 1
+                iid = old_key_iids.pop((key, occurrence), None)
+                if iid is None:
+                    iid = treeview.insert('', 'end', iid='row{}'.format(self._next_iid), values=self._display_row(i, value), tags=self._row_color_tags(i))
+                    self._next_iid += 1
+                    inserted.append(iid)
+                elif row != old_rows[iid] or old_positions[iid] != i:
+                    treeview.item(iid, values=self._display_row(i, value), tags=self._row_color_tags(i))
+                new_key_iids[(key, occurrence)] = iid
+                new_iids.append(iid)
+                new_snapshot.append(row)
+            if old_key_iids:  # the rows that are left weren't in the new values
+                treeview.delete(*old_key_iids.values())
+            deleted = set(old_key_iids.values())
+            if [iid for iid in old_iids if iid not in deleted] + inserted != new_iids:
+                treeview.set_children('', *new_iids)  # put the rows in their new order with a single call
+            self._row_key_iids = new_key_iids
+            self._iid_rows = {iid: i for i, iid in enumerate(new_iids)}
+        self.tree_ids = new_iids
+        self._values_snapshot = new_snapshot
+        self.Values = values
+
+    def _display_row(self, row, value):
+        """
+        Not user callable.  Returns the values to show in the treeview for a row, with the row number if they're shown
+
+        :param row:   The row number
+        :type row:    (int)
+        :param value: The row
+        :type value:  List[str | int | float]
+        :return:      The values for the treeview item
+        :rtype:       List[str | int | float]
+        """
+        if self.DisplayRowNumbers:
+            return [row + self.StartingRowNumber] + list(value)
+        return value
+
+    def _iid_to_row(self, iid):
+        """
+        Not user callable.  Returns the row number of a treeview item
+
+        :param iid: The treeview item id
+        :type iid:  (str)
+        :return:    The row number
+        :rtype:     (int)
+        """
+        if self._iid_rows is not None:
+            return self._iid_rows[iid]
+        return int(iid) - 1 + self._virtual_start
+
+    def _row_to_iid(self, row):
+        """
+        Not user callable.  Returns the treeview item id of a row
+
+        :param row: The row number
+        :type row:  (int)
+        :return:    The treeview item id
+        :rtype:     (str | int)
+        """
+        if self._iid_rows is not None:
+            return self.tree_ids[row]
+        return row + 1 - self._virtual_start
+
+    @staticmethod
+    def _make_row_colors_by_row(row_colors):
+        """
+        Not user callable.  Converts the row_colors parameter into a dictionary of row -> (foreground color, background color)
+
+        :param row_colors: list of tuples of (row, background color) OR (row, foreground color, background color)
+        :type row_colors:  List[Tuple[int, str] | Tuple[Int, str, str]] | None
+        :return:           Dictionary with the colors of each row that has colors set. Foreground is None if only the background was specified
+        :rtype:            Dict[int, Tuple[str | None, str]]
+        """
+        colors_by_row = {}
+        for row_def in row_colors or []:
+            if len(row_def) == 2:  # only background is specified
+                colors_by_row[row_def[0]] = (None, row_def[1])
+            else:
+                colors_by_row[row_def[0]] = (row_def[1], row_def[2])
+        return colors_by_row
+
+    def _row_color_tags(self, row):
+        """
+        Not user callable.  Returns the tags to use for a row so that it's shown with its row color or the alternating
+        row color.  Rows with the same colors share a single tag.  Every other row has the 'alternate' tag even if
+        there is no alternating row color so that setting one later only needs to configure that tag.
+
+        :param row: The row number (absolute, not the position in the treeview)
+        :type row:  (int)
+        :return:    The tags for the row. Empty if the row uses the table's colors
+        :rtype:     Tuple[str] | Tuple[()]
+        """
+        colors = self._row_colors_by_row.get(row)
+        if colors is None:
+            return () if row % 2 else ('alternate',)
+        tag = self._color_tags.get(colors)
+        if tag is None:
+            tag = self._color_tags[colors] = 'color{}'.format(len(self._color_tags))
+            if colors[0] is None:
+                self.TKTreeview.tag_configure(tag, background=colors[1])
+            else:
+                self.TKTreeview.tag_configure(tag, background=colors[1], foreground=colors[0])
+        return (tag,)
+
+    def _configure_alternate_tag(self):
+        """
+        Not user callable.  Sets the background of the rows with the 'alternate' tag to the alternating row color
+        """
+        if self.AlternatingRowColor not in (None, COLOR_SYSTEM_DEFAULT):
+            self.TKTreeview.tag_configure('alternate', background=self.AlternatingRowColor)
+
+    def _get_row_count(self):
+        """
+        Not user callable.  Returns the total number of rows in the table
+
+        :return: Number of rows
+        :rtype:  (int)
+        """
+        if self.row_provider is not None:
+            return self.row_count or 0
+        return len(self.Values) if self.Values is not None else 0
+
+    def _get_rows(self, start, stop):
+        """
+        Not user callable.  Returns the rows from start up to (not including) stop, from either the row_provider or the values
+
+        :param start: First row to get
+        :type start:  (int)
+        :param stop:  Row after the last row to get
+        :type stop:   (int)
+        :return:      The rows
+        :rtype:       List[List[str | int | float]]
+        """
+        if self.row_provider is not None:
+            return self.row_provider(start, stop)
+        try:
+            return self.Values[start:stop]
+        except TypeError:  # sequence that can't be sliced
+            return [self.Values[i] for i in range(start, stop)]
+
+    def _virtual_render(self, top):
+        """
+        Not user callable.  Fills the treeview of a virtual table with the rows around top and scrolls so that top is the
+        first row shown.  The items already in the treeview are reused, only their values and tags are changed.
+
+        :param top: The row to show at the top of the table
+        :type top:  (int)
+        """
+        treeview = self.TKTreeview
+        total = self._get_row_count()
+        visible = self._virtual_visible_rows
+        top = max(0, min(top, total - visible))
+        start = max(0, top - self.overscan)
+        stop = min(total, top + visible + self.overscan)
+        rows = self._get_rows(start, stop) if stop > start else []
+        self._virtual_start = start
+        self._virtual_top = top
+        for position, value in enumerate(rows):
+            row = start + position
+            if self.DisplayRowNumbers:
+                value = [row + self.StartingRowNumber] + list(value)
+            if position < self._virtual_item_count:
+                treeview.item(position + 1, values=value, tags=self._row_color_tags(row))
+            else:
+                treeview.insert('', 'end', iid=position + 1, values=value, tags=self._row_color_tags(row))
+        for iid in range(len(rows) + 1, self._virtual_item_count + 1):
+            treeview.delete(iid)
+        self._virtual_item_count = len(rows)
+        treeview.selection_set([row - start + 1 for row in self.SelectedRows if start <= row < stop])
+        if rows:
+            treeview.yview_moveto((top - start + 0.25) / len(rows))  # the 0.25 keeps rounding from landing on the item above
+        self._virtual_set_scrollbar(visible)
+
+    def _virtual_set_scrollbar(self, visible):
+        """
+        Not user callable.  Sets the vertical scrollbar of a virtual table based on all of the rows, not only the ones in the treeview
+
+        :param visible: Number of rows that are visible
+        :type visible:  (int)
+        """
+        if self.vsb is None:
+            return
+        total = self._get_row_count()
+        if total:
+            self.vsb.set(self._virtual_top / total, min(1, (self._virtual_top + visible) / total))
+        else:
+            self.vsb.set(0, 1)
+
+    def _virtual_yscroll(self, first, last):
+        """
+        Not user callable.  The yscrollcommand of the treeview for virtual tables. Called by tkinter when the treeview
+        scrolls (mouse wheel, keyboard, etc).  When the view gets close to the edge of the rows that are in the treeview,
+        the rows are filled in again around the view.
+
+        :param first: fraction of the treeview items that are above the view
+        :type first:  (str)
+        :param last:  fraction of the treeview items that are above the bottom of the view
+        :type last:   (str)
+        """
+        first, last = float(first), float(last)
+        items = self._virtual_item_count
+        total = self._get_row_count()
+        top = self._virtual_start + int(round(first * items))
+        shown = max(1, int(round((last - first) * items)))
+        self._virtual_visible_rows = max(shown, self.NumRows if self.NumRows else 10)
+        grow = first <= 0 and last >= 1 and items < total  # all items fit in the view so more are needed
+        if grow:
+            self._virtual_visible_rows = items + 1
+        margin = max(1, self.overscan // 2)
+        stop = self._virtual_start + items
+        if grow or (top - self._virtual_start < margin and self._virtual_start > 0) or (stop - (top + shown) < margin and stop < total):
+            self._virtual_render(top)
+            return
+        self._virtual_top = top
+        self._virtual_set_scrollbar(shown)
+
+    def _virtual_yview(self, *args):
+        """
+        Not user callable.  The command of the vertical scrollbar for virtual tables.  Scrolls through all of the rows.
+
+        :param args: Arguments from the scrollbar. Either ('moveto', fraction) or ('scroll', number, 'units' | 'pages')
+        :type args:  (str)
+        """
+        if args[0] == 'moveto':
+            top = int(float(args[1]) * self._get_row_count())
+        else:
+            step = self._virtual_visible_rows if args[2].startswith('page') else 1
+            top = self._virtual_top + int(args[1]) * step
+        self._virtual_render(top)
+
+    def _virtual_record_modifiers(self, event):
+        """
+        Not user callable.  Saves the state of the modifier keys of a click or key press so that a virtual table knows if
+        rows selected outside of the treeview should stay selected
+
+        :param event: event information from tkinter
+        :type event:  (unknown)
+        """
+        self._virtual_modifier_state = event.state
+
+    def _virtual_selected_rows(self):
+        """
+        Not user callable.  Works out the selected rows of a virtual table from the selection in the treeview.
+        Selected rows that are not in the treeview stay selected if shift or control was held.
+
+        :return: The selected rows or None if the selection of the rows in the treeview didn't change
+        :rtype:  List[int] | None
+        """
+        start, stop = self._virtual_start, self._virtual_start + self._virtual_item_count
+        shown = {start + int(x) - 1 for x in self.TKTreeview.selection()}
+        shown_before = {row for row in self.SelectedRows if start <= row < stop}
+        if shown == shown_before:
+            return None
+        modifiers = 0x000D if running_mac() else 0x0005  # shift, control (and command on the Mac)
+        if self._virtual_modifier_state & modifiers:
+            return sorted(shown.union(row for row in self.SelectedRows if not start <= row < stop))
+        return sorted(shown)
+
     def _treeview_selected(self, event):
         """
         Not user callable.  Callback function that is called when something is selected from Table.
@@ -350,8 +672,16 @@ class Table(Element):
         :type event:  (unknown)
         """
         # print('**-- in treeview selected --**')
-        selections = self.TKTreeview.selection()
-        self.SelectedRows = [int(x) - 1 for x in selections]
+        if self.virtual:
+            selected_rows = self._virtual_selected_rows()
+            if selected_rows is None and not self._virtual_select_pending:
+                return  # the treeview's items were filled in again, the selection didn't really change
+            self._virtual_select_pending = False
+            if selected_rows is not None:
+                self.SelectedRows = selected_rows
+        else:
+            selections = self.TKTreeview.selection()
+            self.SelectedRows = [self._iid_to_row(x) for x in selections]
         if self.ChangeSubmits:
             if self.Key is not None:
                 self.ParentForm.LastButtonClicked = self.Key
@@ -368,8 +698,9 @@ class Table(Element):
         :param event: event information from tkinter
         :type event:  (unknown)
         """
-        selections = self.TKTreeview.selection()
-        self.SelectedRows = [int(x) - 1 for x in selections]
+        if not self.virtual:
+            selections = self.TKTreeview.selection()
+            self.SelectedRows = [self._iid_to_row(x) for x in selections]
         if self.BindReturnKey:  # Signifies BOTH a return key AND a double click
             if self.Key is not None:
                 self.ParentForm.LastButtonClicked = self.Key
@@ -394,7 +725,7 @@ class Table(Element):
             if region == 'heading':
                 row = -1
             elif region == 'cell':
-                row = int(self.Widget.identify_row(event.y)) - 1
+                row = self._iid_to_row(self.Widget.identify_row(event.y))
             elif region == 'separator':
                 row = None
             else:
@@ -425,10 +756,13 @@ class Table(Element):
         if self.right_click_selects and len(selections) <= 1:
             if (event.num == 3 and not running_mac()) or (event.num == 2 and running_mac()):
                 if row != -1 and row is not None:
-                    selections = [row + 1]
+                    selections = [self._row_to_iid(row)]
                     self.TKTreeview.selection_set(selections)
+                    if self.virtual:
+                        self.SelectedRows = [row]
         # print(selections)
-        self.SelectedRows = [int(x) - 1 for x in selections]
+        if not self.virtual:
+            self.SelectedRows = [self._iid_to_row(x) for x in selections]
         # print('The new selected rows = ', self.SelectedRows, 'selections =', selections)
         if self.enable_click_events is True:
             if self.Key is not None:
@@ -445,9 +779,10 @@ class Table(Element):
         :return: a list of the index of the selected rows (a list of ints)
         :rtype:  List[int]
         """
-
+        if self.virtual:
+            return list(self.SelectedRows)
         selections = self.TKTreeview.selection()
-        selected_rows = [int(x) - 1 for x in selections]
+        selected_rows = [self._iid_to_row(x) for x in selections]
         return selected_rows
 
     def get_last_clicked_position(self):
@@ -3,6 +3,8 @@ from __future__ import annotations
 import tkinter.font
 
 import FreeSimpleGUI
+from FreeSimpleGUI import _font_linespace
+from FreeSimpleGUI import _font_string_width
 from FreeSimpleGUI import _get_hidden_master_root
 from FreeSimpleGUI import COLOR_SYSTEM_DEFAULT
 from FreeSimpleGUI import ELEM_TYPE_TEXT
@@ -216,7 +218,7 @@ class Text(Element):
 
         size = 0
         try:
-            size = tkinter.font.Font(font=font).measure(character)  # single character width
+            size = _font_string_width(font, character)  # single character width
         except Exception as e:
             _error_popup_with_traceback('Exception retrieving char width in pixels', e)
 
@@ -239,7 +241,7 @@ class Text(Element):
 
         size = 0
         try:
-            size = tkinter.font.Font(font=font).metrics('linespace')
+            size = _font_linespace(font)
         except Exception as e:
             _error_popup_with_traceback('Exception retrieving char height in pixels', e)
 
@@ -263,7 +265,7 @@ class Text(Element):
 
         size = 0
         try:
-            size = tkinter.font.Font(font=font).measure(string)  # string's  width
+            size = _font_string_width(font, string)  # string's  width
         except Exception as e:
             _error_popup_with_traceback('Exception retrieving string width in pixels', e)
 
@@ -34,6 +34,8 @@ class Tree(Element):
         max_col_width=20,
         select_mode=None,
         show_expanded=False,
+        lazy=False,
+        lazy_loader=None,
         change_submits=False,
         enable_events=False,
         click_toggles_select=None,
@@ -93,6 +95,10 @@ class Tree(Element):
         :type select_mode:              (enum)
         :param show_expanded:           if True then the tree will be initially shown with all nodes completely expanded
         :type show_expanded:            (bool)
+        :param lazy:                    if True the children of a node are only added to the tree the first time the node is expanded. Use for very large trees
+        :type lazy:                     (bool)
+        :param lazy_loader:             Function called with the key of a node that was inserted with has_children=True the first time it's expanded. Either insert the children into the TreeData yourself or return (or yield) tuples of (key, text, values[, icon[, has_children]]) to insert under the node. Setting it makes the tree lazy
+        :type lazy_loader:              Callable[[Any], Iterable[Tuple] | None]
         :param change_submits:          DO NOT USE. Only listed for backwards compat - Use enable_events instead
         :type change_submits:           (bool)
         :param enable_events:           Turns on the element specific events. Tree events happen when row is clicked
@@ -212,6 +218,9 @@ class Tree(Element):
         self.IconList = {}
         self.IdToKey = {'': ''}
         self.KeyToID = {'': ''}
+        self.lazy_loader = lazy_loader
+        self.lazy = lazy or lazy_loader is not None
+        self._lazy_placeholders = {}  # type: Dict[str, str]  # id of a node whose children haven't been added -> id of the empty child that makes it expandable
         key = key if key is not None else k
         pad = pad if pad is not None else p
         self.expand_x = expand_x
@@ -266,10 +275,13 @@ class Tree(Element):
     def add_treeview_data(self, node):
         """
         Not a user function.  Recursive method that inserts tree data into the tkinter treeview widget.
+        If the tree is lazy, the children of a node that isn't shown expanded are not inserted.  An empty child is
+        inserted in their place so that the node can be expanded.  See _treeview_open
 
         :param node: The node to insert.  Will insert all nodes from starting point downward, recursively
         :type node:  (TreeData)
         """
+        deferred = self.lazy and node.key != '' and (not node.children_loaded or (node.children and not self.ShowExpanded))
         if node.key != '':
             if node.icon:
                 try:
@@ -289,7 +301,7 @@ class Tree(Element):
                         iid=None,
                         text=node.text,
                         values=node.values,
-                        open=self.ShowExpanded,
+                        open=self.ShowExpanded and not deferred,
                         image=node.photo,
                     )
                     self.IdToKey[id] = node.key
@@ -303,14 +315,45 @@ class Tree(Element):
                     iid=None,
                     text=node.text,
                     values=node.values,
-                    open=self.ShowExpanded,
+                    open=self.ShowExpanded and not deferred,
                 )
                 self.IdToKey[id] = node.key
                 self.KeyToID[node.key] = id
 
+        if deferred:
+            if node.key in self.KeyToID:
+                id = self.KeyToID[node.key]
+                self._lazy_placeholders[id] = self.TKTreeview.insert(id, 'end', text='')
+            return
+
         for node in node.children:
             self.add_treeview_data(node)
 
+    def _treeview_open(self, event):
+        """
+        Not a user function.  Callback function that happens when a node of a lazy tree is expanded.  The first time a
+        node is expanded its children are added to the treeview.  Nodes inserted with has_children=True get their
+        children from the lazy_loader.
+
+        :param event: An event parameter passed in by tkinter.  Not used
+        :type event:  (Any)
+        """
+        id = self.TKTreeview.focus()  # tkinter makes the node being expanded the focus before sending the event
+        placeholder = self._lazy_placeholders.pop(id, None)
+        if placeholder is None:
+            return
+        self.TKTreeview.delete(placeholder)
+        node = self.TreeData.tree_dict[self.IdToKey[id]]
+        if not node.children_loaded:
+            node.children_loaded = True
+            if self.lazy_loader is not None:
+                children = self.lazy_loader(node.key)
+                if children is not None:
+                    for child in children:
+                        self.TreeData.insert(node.key, *child)
+        for child in node.children:
+            self.add_treeview_data(child)
+
     def update(self, values=None, key=None, value=None, text=None, icon=None, visible=None):
         """
         Changes some of the settings for the Tree Element. Must call `Window.Read` or `Window.Finalize` prior
@@ -350,34 +393,14 @@ class Tree(Element):
             self.TreeData = values
             self.IdToKey = {'': ''}
             self.KeyToID = {'': ''}
+            self._lazy_placeholders = {}
             self.add_treeview_data(self.TreeData.root_node)
             self.SelectedRows = []
         if key is not None:
-            for id in self.IdToKey.keys():
-                if key == self.IdToKey[id]:
-                    break
+            if key in self.TreeData.tree_dict:
+                self._update_node(key, text=text, values=value, icon=icon)
             else:
-                id = None
                 print('** Key not found **')
-        else:
-            id = None
-        if id:
-            # item = self.TKTreeview.item(id)
-            if value is not None:
-                self.TKTreeview.item(id, values=value)
-            if text is not None:
-                self.TKTreeview.item(id, text=text)
-            if icon is not None:
-                try:
-                    if type(icon) is bytes:
-                        photo = tk.PhotoImage(data=icon)
-                    else:
-                        photo = tk.PhotoImage(file=icon)
-                    self.TKTreeview.item(id, image=photo)
-                    self.IconList[key] = photo  # save so that it's not deleted (save reference)
-                except:
-                    pass
-            # item = self.TKTreeview.item(id)
         if visible is False:
             self._pack_forget_save_settings(self.element_frame)
         elif visible is True:
@@ -388,6 +411,193 @@ class Tree(Element):
 
         return self
 
+    def insert_node(self, parent_key, key, text, values, icon=None, index='end', has_children=False):
+        """
+        Inserts a single node into the tree without having to update the entire tree.  The node is also inserted into
+        the tree's TreeData.  Must call `Window.Read` or `Window.Finalize` prior
+
+        :param parent_key:   The key of the node to insert under. '' is the top of the tree
+        :type parent_key:    str | int | tuple | object
+        :param key:          Used to uniquely identify this node
+        :type key:           str | int | tuple | object
+        :param text:         The text that is displayed at this node's location
+        :type text:          (str)
+        :param values:       The list of values that are displayed at this node
+        :type values:        List[Any]
+        :param icon:         can be either a base64 icon or a filename for the icon
+        :type icon:          bytes | str
+        :param index:        Position among the other children of parent_key. 'end' adds it after the others
+        :type index:         int | str
+        :param has_children: If True the node's children will be supplied later by the lazy_loader
+        :type has_children:  (bool)
+        :return:             The Tree element so calls can be chained
+        :rtype:              (Tree)
+        """
+        if not self._widget_was_created():  # if widget hasn't been created yet, then don't allow
+            return
+        if parent_key not in self.TreeData.tree_dict:
+            print('** Key not found **')
+            return self
+        if key in self.TreeData.tree_dict:
+            print('** Key already in tree **')
+            return self
+        self.TreeData.insert(parent_key, key, text, values, icon, has_children)
+        node = self.TreeData.tree_dict[key]
+        if index != 'end':
+            siblings = self.TreeData.tree_dict[parent_key].children
+            siblings.insert(index, siblings.pop())
+        if self._children_in_treeview(parent_key):
+            self.add_treeview_data(node)
+            if index != 'end' and key in self.KeyToID:
+                self.TKTreeview.move(self.KeyToID[key], self.KeyToID[parent_key], index)
+        return self
+
+    def delete_node(self, key):
+        """
+        Deletes a node and all of the nodes under it from the tree and from the tree's TreeData
+
+        :param key: The key of the node to delete
+        :type key:  str | int | tuple | object
+        :return:    The Tree element so calls can be chained
+        :rtype:     (Tree)
+        """
+        if not self._widget_was_created():  # if widget hasn't been created yet, then don't allow
+            return
+        if key == '' or key not in self.TreeData.tree_dict:  # the top of the tree ('') can't be deleted
+            print('** Key not found **')
+            return self
+        id = self.KeyToID.get(key)
+        removed_keys = self.TreeData._remove_node(key)
+        self._forget_ids(removed_keys)
+        if id is not None:
+            self.TKTreeview.delete(id)
+        if self.SelectedRows:
+            removed_keys = set(removed_keys)
+            self.SelectedRows = [k for k in self.SelectedRows if k not in removed_keys]
+        return self
+
+    def move_node(self, key, new_parent_key, index='end'):
+        """
+        Moves a node, and the nodes under it, so that it's under a different node or in a different position under the same node.
+        The tree's TreeData is changed to match.
+
+        :param key:            The key of the node to move
+        :type key:             str | int | tuple | object
+        :param new_parent_key: The key of the node to move it under. '' is the top of the tree
+        :type new_parent_key:  str | int | tuple | object
+        :param index:          Position among the other children of new_parent_key. 'end' puts it after the others
+        :type index:           int | str
+        :return:               The Tree element so calls can be chained
+        :rtype:                (Tree)
+        """
+        if not self._widget_was_created():  # if widget hasn't been created yet, then don't allow
+            return
+        if key == '' or key not in self.TreeData.tree_dict or new_parent_key not in self.TreeData.tree_dict:  # the top of the tree ('') can't be moved
+            print('** Key not found **')
+            return self
+        parent = new_parent_key
+        while parent != '':
+            if parent == key:
+                _error_popup_with_traceback('Error in Tree.move_node - A node cannot be moved under itself', 'Key = {}'.format(key), 'New parent key = {}'.format(new_parent_key))
+                return
+            parent = self.TreeData.tree_dict[parent].parent
+        self.TreeData._move_node(key, new_parent_key, index)
+        id = self.KeyToID.get(key)
+        if self._children_in_treeview(new_parent_key):
+            if id is not None:
+                self.TKTreeview.move(id, self.KeyToID[new_parent_key], index)
+            else:  # the node's old parent hadn't been expanded yet so it's not in the treeview
+                self.add_treeview_data(self.TreeData.tree_dict[key])
+                if index != 'end' and key in self.KeyToID:
+                    self.TKTreeview.move(self.KeyToID[key], self.KeyToID[new_parent_key], index)
+        elif id is not None:  # the new parent hasn't been expanded, the node will be added when it is
+            self.TKTreeview.delete(id)
+            self._forget_ids(self.TreeData._subtree_keys(key))
+        return self
+
+    def update_nodes(self, nodes):
+        """
+        Changes the text, values and/or icons of many nodes at once. The tree's TreeData is changed to match.
+
+        :param nodes: Dictionary with the key of each node to change and a dictionary of what to change. The changes can
+                      have the keys 'text', 'values' and 'icon'.  Example {'key1': {'text': 'new text'}, 'key2': {'values': [1, 2]}}
+        :type nodes:  Dict[Any, Dict[str, Any]]
+        :return:      The Tree element so calls can be chained
+        :rtype:       (Tree)
+        """
+        if not self._widget_was_created():  # if widget hasn't been created yet, then don't allow
+            return
+        for key, changes in nodes.items():
+            if key not in self.TreeData.tree_dict:
+                print('** Key not found **')
+                continue
+            self._update_node(key, text=changes.get('text'), values=changes.get('values'), icon=changes.get('icon'))
+        return self
+
+    def _update_node(self, key, text=None, values=None, icon=None):
+        """
+        Not a user function.  Changes the text, values and/or icon of a node in the TreeData and, if the node has been
+        added to the treeview, in the treeview.
+
+        :param key:    The key of the node to change
+        :type key:     str | int | tuple | object
+        :param text:   The new text. None if not changed
+        :type text:    (str | None)
+        :param values: The new values. None if not changed
+        :type values:  List[Any] | None
+        :param icon:   The new icon. None if not changed
+        :type icon:    bytes | str | None
+        """
+        node = self.TreeData.tree_dict[key]
+        id = self.KeyToID.get(key)
+        if values is not None:
+            node.values = values
+            if id:
+                self.TKTreeview.item(id, values=values)
+        if text is not None:
+            node.text = text
+            if id:
+                self.TKTreeview.item(id, text=text)
+        if icon is not None:
+            node.icon = icon
+            try:
+                if type(icon) is bytes:
+                    photo = tk.PhotoImage(data=icon)
+                else:
+                    photo = tk.PhotoImage(file=icon)
+                node.photo = photo
+                if id:
+                    self.TKTreeview.item(id, image=photo)
+                self.IconList[key] = photo  # save so that it's not deleted (save reference)
+            except:
+                pass
+
+    def _children_in_treeview(self, key):
+        """
+        Not a user function.  Returns True if the children of a node are in the treeview.  They're not if the node
+        itself isn't in the treeview or if it's a lazy tree and the node hasn't been expanded yet.
+
+        :param key: The key of the node
+        :type key:  str | int | tuple | object
+        :return:    True if children of the node are in the treeview
+        :rtype:     (bool)
+        """
+        id = self.KeyToID.get(key)
+        return id is not None and id not in self._lazy_placeholders
+
+    def _forget_ids(self, keys):
+        """
+        Not a user function.  Removes nodes from the maps between keys and treeview ids
+
+        :param keys: The keys of the nodes
+        :type keys:  List[Any]
+        """
+        for key in keys:
+            id = self.KeyToID.pop(key, None)
+            if id is not None:
+                self.IdToKey.pop(id, None)
+                self._lazy_placeholders.pop(id, None)
+
     Update = update
 
 
@@ -403,7 +613,7 @@ class TreeData:
         Contains information about the individual node in the tree
         """
 
-        def __init__(self, parent, key, text, values, icon=None):
+        def __init__(self, parent, key, text, values, icon=None, has_children=False):
             """
             Represents a node within the TreeData class
 
@@ -417,6 +627,8 @@ class TreeData:
             :type values:  List[Any]
             :param icon:   just a icon
             :type icon:    str | bytes
+            :param has_children: If True the node's children will be supplied later by the Tree's lazy_loader
+            :type has_children:  (bool)
             """
 
             self.parent = parent  # type: TreeData.Node
@@ -425,6 +637,8 @@ class TreeData:
             self.text = text  # type: str
             self.values = values  # type: List[Any]
             self.icon = icon  # type: str | bytes
+            self.has_children = has_children  # type: bool
+            self.children_loaded = not has_children  # type: bool
 
         def _Add(self, node):
             self.children.append(node)
@@ -448,7 +662,7 @@ class TreeData:
         """
         self.tree_dict[key] = node
 
-    def insert(self, parent, key, text, values, icon=None):
+    def insert(self, parent, key, text, values, icon=None, has_children=False):
         """
         Inserts a node into the tree. This is how user builds their tree, by Inserting Nodes
         This is the ONLY user callable method in the TreeData class
@@ -463,13 +677,68 @@ class TreeData:
         :type values:  List[Any]
         :param icon:   icon
         :type icon:    str | bytes
+        :param has_children: If True the node can be expanded even though no children were inserted. The Tree's lazy_loader is called to get them the first time the node is expanded
+        :type has_children:  (bool)
         """
 
-        node = self.Node(parent, key, text, values, icon)
+        node = self.Node(parent, key, text, values, icon, has_children)
         self.tree_dict[key] = node
         parent_node = self.tree_dict[parent]
         parent_node._Add(node)
 
+    def _subtree_keys(self, key):
+        """
+        Returns the keys of a node and all of the nodes under it (not user callable)
+
+        :param key: The key of the node
+        :type key:  str | int | tuple | object
+        :return:    The keys
+        :rtype:     List[Any]
+        """
+        keys = []
+        nodes = [self.tree_dict[key]]
+        while nodes:
+            node = nodes.pop()
+            keys.append(node.key)
+            nodes.extend(node.children)
+        return keys
+
+    def _remove_node(self, key):
+        """
+        Removes a node and the nodes under it (not user callable)
+
+        :param key: The key of the node to remove
+        :type key:  str | int | tuple | object
+        :return:    The keys of the nodes removed
+        :rtype:     List[Any]
+        """
+        keys = self._subtree_keys(key)
+        node = self.tree_dict[key]
+        self.tree_dict[node.parent].children.remove(node)
+        for k in keys:
+            del self.tree_dict[k]
+        return keys
+
+    def _move_node(self, key, new_parent, index='end'):
+        """
+        Moves a node to be under a different parent or at a different position under the same parent (not user callable)
+
+        :param key:        The key of the node to move
+        :type key:         str | int | tuple | object
+        :param new_parent: The key of the new parent
+        :type new_parent:  str | int | tuple | object
+        :param index:      Position among the new parent's children. 'end' to put it last
+        :type index:       int | str
+        """
+        node = self.tree_dict[key]
+        self.tree_dict[node.parent].children.remove(node)
+        node.parent = new_parent
+        children = self.tree_dict[new_parent].children
+        if index == 'end':
+            children.append(node)
+        else:
+            children.insert(index, node)
+
     def __repr__(self):
         """
         Converts the TreeData into a printable version, nicely formatted
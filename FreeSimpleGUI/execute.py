@@ -0,0 +1,382 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import traceback
+import warnings
+
+import FreeSimpleGUI
+from FreeSimpleGUI import popup_error
+from FreeSimpleGUI import pysimplegui_user_settings
+from FreeSimpleGUI import user_settings_get_entry
+from FreeSimpleGUI._utils import _error_popup_with_traceback
+
+'''
+'########:'##::::'##:'########::'######::'##::::'##:'########:'########:
+ ##.....::. ##::'##:: ##.....::'##... ##: ##:::: ##:... ##..:: ##.....::
+ ##::::::::. ##'##::: ##::::::: ##:::..:: ##:::: ##:::: ##:::: ##:::::::
+ ######:::::. ###:::: ######::: ##::::::: ##:::: ##:::: ##:::: ######:::
+ ##...:::::: ## ##::: ##...:::: ##::::::: ##:::: ##:::: ##:::: ##...::::
+ ##:::::::: ##:. ##:: ##::::::: ##::: ##: ##:::: ##:::: ##:::: ##:::::::
+ ########: ##:::. ##: ########:. ######::. #######::::: ##:::: ########:
+........::..:::::..::........:::......::::.......::::::..:::::........::
+:::'###::::'########::'####::'######::
+::'## ##::: ##.... ##:. ##::'##... ##:
+:'##:. ##:: ##:::: ##:: ##:: ##:::..::
+'##:::. ##: ########::: ##::. ######::
+ #########: ##.....:::: ##:::..... ##:
+ ##.... ##: ##::::::::: ##::'##::: ##:
+ ##:::: ##: ##::::::::'####:. ######::
+..:::::..::..:::::::::....:::......:::
+
+
+
+These are the functions used to implement the subprocess APIs (Exec APIs) of PySimpleGUI
+
+'''
+
+
+def execute_command_subprocess(command, *args, wait=False, cwd=None, pipe_output=False, merge_stderr_with_stdout=True, stdin=None):
+    """
+    Runs the specified command as a subprocess.
+    By default the call is non-blocking.
+    The function will immediately return without waiting for the process to complete running. You can use the returned Popen object to communicate with the subprocess and get the results.
+    Returns a subprocess Popen object.
+
+    :param command:                  The command/file to execute. What you would type at a console to run a program or shell command.
+    :type command:                   (str)
+    :param *args:                    Variable number of arguments that are passed to the program being started as command line parms
+    :type *args:                     (Any)
+    :param wait:                     If True then wait for the subprocess to finish
+    :type wait:                      (bool)
+    :param cwd:                      Working directory to use when executing the subprocess
+    :type cwd:                       (str))
+    :param pipe_output:              If True then output from the subprocess will be piped. You MUST empty the pipe by calling execute_get_results or your subprocess will block until no longer full
+    :type pipe_output:               (bool)
+    :param merge_stderr_with_stdout: If True then output from the subprocess stderr will be merged with stdout. The result is ALL output will be on stdout.
+    :type merge_stderr_with_stdout:  (bool)
+    :param stdin:                    Value passed to the Popen call. Defaults to subprocess.DEVNULL so that the pyinstaller created executable work correctly
+    :type stdin:                     (bool)
+    :return:                         Popen object
+    :rtype:                          (subprocess.Popen)
+    """
+    if stdin is None:
+        stdin = subprocess.DEVNULL
+    try:
+        if args is not None:
+            expanded_args = ' '.join(args)
+            # print('executing subprocess command:',command, 'args:',expanded_args)
+            if command[0] != '"' and ' ' in command:
+                command = '"' + command + '"'
+            # print('calling popen with:', command +' '+ expanded_args)
+            # sp = subprocess.Popen(command +' '+ expanded_args, shell=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, cwd=cwd)
+            if pipe_output:
+                if merge_stderr_with_stdout:
+                    sp = subprocess.Popen(
+                        command + ' ' + expanded_args,
+                        shell=True,
+                        stdout=subprocess.PIPE,
+                        stderr=subprocess.STDOUT,
+                        cwd=cwd,
+                        stdin=stdin,
+                    )
+                else:
+                    sp = subprocess.Popen(
+                        command + ' ' + expanded_args,
+                        shell=True,
+                        stdout=subprocess.PIPE,
+                        stderr=subprocess.PIPE,
+                        cwd=cwd,
+                        stdin=stdin,
+                    )
+            else:
+                sp = subprocess.Popen(
+                    command + ' ' + expanded_args,
+                    shell=True,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    cwd=cwd,
+                    stdin=stdin,
+                )
+        else:
+            sp = subprocess.Popen(command, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, cwd=cwd, stdin=stdin)
+        if wait:
+            out, err = sp.communicate()
+            if out:
+                print(out.decode('utf-8'))
+            if err:
+                print(err.decode('utf-8'))
+    except Exception as e:
+        warnings.warn(f'Error in execute_command_subprocess {e}', UserWarning)
+        _error_popup_with_traceback(
+            'Error in execute_command_subprocess',
+            e,
+            f'command={command}',
+            f'args={args}',
+            f'cwd={cwd}',
+        )
+        sp = None
+    return sp
+
+
+def execute_py_file(pyfile, parms=None, cwd=None, interpreter_command=None, wait=False, pipe_output=False, merge_stderr_with_stdout=True):
+    """
+    Executes a Python file.
+    The interpreter to use is chosen based on this priority order:
+        1. interpreter_command paramter
+        2. global setting "-python command-"
+        3. the interpreter running running PySimpleGUI
+    :param pyfile:                   the file to run
+    :type pyfile:                    (str)
+    :param parms:                    parameters to pass on the command line
+    :type parms:                     (str)
+    :param cwd:                      the working directory to use
+    :type cwd:                       (str)
+    :param interpreter_command:      the command used to invoke the Python interpreter
+    :type interpreter_command:       (str)
+    :param wait:                     the working directory to use
+    :type wait:                      (bool)
+    :param pipe_output:              If True then output from the subprocess will be piped. You MUST empty the pipe by calling execute_get_results or your subprocess will block until no longer full
+    :type pipe_output:               (bool)
+    :param merge_stderr_with_stdout: If True then output from the subprocess stderr will be merged with stdout. The result is ALL output will be on stdout.
+    :type merge_stderr_with_stdout:  (bool)
+    :return:                         Popen object
+    :rtype:                          (subprocess.Popen) | None
+    """
+
+    if cwd is None:
+        # if the specific file is not found (not an absolute path) then assume it's relative to '.'
+        if not os.path.exists(pyfile):
+            cwd = '.'
+
+    if pyfile[0] != '"' and ' ' in pyfile:
+        pyfile = '"' + pyfile + '"'
+    if interpreter_command is not None:
+        python_program = interpreter_command
+    else:
+        # use the version CURRENTLY RUNNING if nothing is specified. Previously used the one from the settings file
+        # ^ hmmm... that's not the code is doing now... it's getting the one from the settings file first
+        pysimplegui_user_settings.reload_if_changed()  # Refresh the settings just in case they've changed via another program
+        python_program = pysimplegui_user_settings.get('-python command-', '')
+        if python_program == '':  # if no interpreter set in the settings, then use the current one
+            python_program = sys.executable
+            # python_program = 'python' if running_windows() else 'python3'
+    if parms is not None and python_program:
+        sp = execute_command_subprocess(
+            python_program,
+            pyfile,
+            parms,
+            wait=wait,
+            cwd=cwd,
+            pipe_output=pipe_output,
+            merge_stderr_with_stdout=merge_stderr_with_stdout,
+        )
+    elif python_program:
+        sp = execute_command_subprocess(
+            python_program,
+            pyfile,
+            wait=wait,
+            cwd=cwd,
+            pipe_output=pipe_output,
+            merge_stderr_with_stdout=merge_stderr_with_stdout,
+        )
+    else:
+        print('execute_py_file - No interpreter has been configured')
+        sp = None
+    return sp
+
+
+def execute_py_get_interpreter():
+    """
+    Returns Python Interpreter from the system settings. If none found in the settings file
+    then the currently running interpreter is returned.
+
+    :return: Full path to python interpreter (uses settings file or sys.executable)
+    :rtype:  (str)
+    """
+    pysimplegui_user_settings.reload_if_changed()  # Refresh the settings just in case they've changed via another program
+    interpreter = pysimplegui_user_settings.get('-python command-', '')
+    if interpreter == '':
+        interpreter = sys.executable
+    return interpreter
+
+
+def execute_py_get_running_interpreter():
+    """
+    Returns the command that is currently running.
+
+    :return: Full path to python interpreter (uses sys.executable)
+    :rtype:  (str)
+    """
+    return sys.executable
+
+
+def execute_editor(file_to_edit, line_number=None):
+    """
+    Runs the editor that was configured in the global settings and opens the file to a specific line number.
+    Two global settings keys are used.
+    '-editor program-' the command line used to startup your editor. It's set
+        in the global settings window or by directly manipulating the PySimpleGUI settings object
+    '-editor format string-' a string containing 3 "tokens" that describes the command that is executed
+            <editor> <file> <line>
+    :param file_to_edit: the full path to the file to edit
+    :type file_to_edit:  (str)
+    :param line_number:  optional line number to place the cursor
+    :type line_number:   (int)
+    :return:             Popen object
+    :rtype:              (subprocess.Popen) | None
+    """
+    if file_to_edit is not None and len(file_to_edit) != 0 and file_to_edit[0] not in ('\"', "\'") and ' ' in file_to_edit:
+        file_to_edit = '"' + file_to_edit + '"'
+    pysimplegui_user_settings.reload_if_changed()  # Refresh the settings just in case they've changed via another program
+    editor_program = pysimplegui_user_settings.get('-editor program-', None)
+    if editor_program is not None:
+        format_string = pysimplegui_user_settings.get('-editor format string-', None)
+        # if no format string, then just launch the editor with the filename
+        if not format_string or line_number is None:
+            sp = execute_command_subprocess(editor_program, file_to_edit)
+        else:
+            command = _create_full_editor_command(file_to_edit, line_number, format_string)
+            # print('final command line = ', command)
+            sp = execute_command_subprocess(editor_program, command)
+    else:
+        print('No editor has been configured in the global settings')
+        sp = None
+    return sp
+
+
+def execute_get_results(subprocess_id, timeout=None):
+    """
+    Get the text results of a previously executed execute call
+    Returns a tuple of the strings (stdout, stderr)
+    :param subprocess_id: a Popen subprocess ID returned from a previous execute call
+    :type subprocess_id:  (subprocess.Popen)
+    :param timeout:       Time in fractions of a second to wait. Returns '','' if timeout. Default of None means wait forever
+    :type timeout:        (None | float)
+    :returns:             Tuple with 2 strings (stdout, stderr)
+    :rtype:               (str | None , str | None)
+    """
+
+    out_decoded = err_decoded = None
+    if subprocess_id is not None:
+        try:
+            out, err = subprocess_id.communicate(timeout=timeout)
+            if out:
+                out_decoded = out.decode('utf-8')
+            if err:
+                err_decoded = err.decode('utf-8')
+        except ValueError:
+            # will get an error if stdout and stderr are combined and attempt to read stderr
+            # so ignore the error that would be generated
+            pass
+        except subprocess.TimeoutExpired:
+            # a Timeout error is not actually an error that needs to be reported
+            pass
+        except Exception as e:
+            popup_error('Error in execute_get_results', e)
+    return out_decoded, err_decoded
+
+
+def execute_subprocess_still_running(subprocess_id):
+    """
+    Returns True is the subprocess ID provided is for a process that is still running
+
+    :param subprocess_id: ID previously returned from Exec API calls that indicate this value is returned
+    :type subprocess_id:  (subprocess.Popen)
+    :return:              True if the subproces is running
+    :rtype:               bool
+    """
+    if subprocess_id.poll() == 0:
+        return False
+    return True
+
+
+def execute_file_explorer(folder_to_open=''):
+    """
+    The global settings has a setting called -   "-explorer program-"
+    It defines the program to run when this function is called.
+    The optional folder paramter specified which path should be opened.
+
+    :param folder_to_open: The path to open in the explorer program
+    :type folder_to_open:  str
+    :return:               Popen object
+    :rtype:                (subprocess.Popen) | None
+    """
+    pysimplegui_user_settings.reload_if_changed()  # Refresh the settings just in case they've changed via another program
+    explorer_program = pysimplegui_user_settings.get('-explorer program-', None)
+    if explorer_program is not None:
+        sp = execute_command_subprocess(explorer_program, folder_to_open)
+    else:
+        print('No file explorer has been configured in the global settings')
+        sp = None
+    return sp
+
+
+def execute_find_callers_filename():
+    """
+    Returns the first filename found in a traceback that is not the name of this file (__file__)
+    Used internally with the debugger for example.
+
+    :return: filename of the caller, assumed to be the first non PySimpleGUI file
+    :rtype:  str
+    """
+    try:  # lots can go wrong so wrapping the entire thing
+        trace_details = traceback.format_stack()
+        file_info_pysimplegui, error_message = None, ''
+        for line in reversed(trace_details):
+            if os.path.dirname(FreeSimpleGUI.__file__) not in line:
+                file_info_pysimplegui = line.split(',')[0]
+                error_message = line
+                break
+        if file_info_pysimplegui is None:
+            return ''
+        error_parts = None
+        if error_message != '':
+            error_parts = error_message.split(', ')
+            if len(error_parts) < 4:
+                error_message = error_parts[0] + '\n' + error_parts[1] + '\n' + ''.join(error_parts[2:])
+        if error_parts is None:
+            print('*** Error popup attempted but unable to parse error details ***')
+            print(trace_details)
+            return ''
+        filename = error_parts[0][error_parts[0].index('File ') + 5 :]
+        return filename
+    except:
+        return ''
+
+
+def _create_full_editor_command(file_to_edit, line_number, edit_format_string):
+    """
+    The global settings has a setting called -   "-editor format string-"
+    It uses 3 "tokens" to describe how to invoke the editor in a way that starts at a specific line #
+    <editor> <file> <line>
+
+    :param file_to_edit:
+    :type file_to_edit:        str
+    :param edit_format_string:
+    :type edit_format_string:  str
+    :return:
+    :rtype:
+    """
+
+    command = edit_format_string
+    command = command.replace('<editor>', '')
+    command = command.replace('<file>', file_to_edit)
+    command = command.replace('<line>', str(line_number) if line_number is not None else '')
+    return command
+
+
+def execute_get_editor():
+    """
+    Get the path to the editor based on user settings or on PySimpleGUI's global settings
+
+    :return: Path to the editor
+    :rtype:  str
+    """
+    try:  # in case running with old version of PySimpleGUI that doesn't have a global PSG settings path
+        global_editor = pysimplegui_user_settings.get('-editor program-')
+    except:
+        global_editor = ''
+
+    return user_settings_get_entry('-editor program-', global_editor)
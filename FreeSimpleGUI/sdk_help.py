@@ -0,0 +1,268 @@
+from __future__ import annotations
+
+import inspect
+import pydoc
+import webbrowser
+
+import FreeSimpleGUI
+from FreeSimpleGUI import B
+from FreeSimpleGUI import CBox
+from FreeSimpleGUI import Col
+from FreeSimpleGUI import MENU_RIGHT_CLICK_EDITME_EXIT
+from FreeSimpleGUI import MenubarCustom
+from FreeSimpleGUI import popup_get_text
+from FreeSimpleGUI import T
+from FreeSimpleGUI import Titlebar
+from FreeSimpleGUI import webbrowser_available
+from FreeSimpleGUI import WIN_CLOSED
+from FreeSimpleGUI._utils import _error_popup_with_traceback
+from FreeSimpleGUI.elements.base import Element
+from FreeSimpleGUI.elements.button import Button
+from FreeSimpleGUI.elements.column import Column
+from FreeSimpleGUI.elements.multiline import Multiline
+from FreeSimpleGUI.elements.sizegrip import Sizegrip
+from FreeSimpleGUI.images import EMOJI_BASE64_THINK
+from FreeSimpleGUI.window import Window
+
+# ..######..########..##....##....##.....##.########.##.......########.
+# .##....##.##.....##.##...##.....##.....##.##.......##.......##.....##
+# .##.......##.....##.##..##......##.....##.##.......##.......##.....##
+# ..######..##.....##.#####.......#########.######...##.......########.
+# .......##.##.....##.##..##......##.....##.##.......##.......##.......
+# .##....##.##.....##.##...##.....##.....##.##.......##.......##.......
+# ..######..########..##....##....##.....##.########.########.##.......
+
+
+def main_sdk_help():
+    """
+    Display a window that will display the docstrings for each PySimpleGUI Element and the Window object
+
+    """
+    online_help_links = {
+        'Button': r'https://PySimpleGUI.org/en/latest/call%20reference/#button-element',
+        'ButtonMenu': r'https://PySimpleGUI.org/en/latest/call%20reference/#buttonmenu-element',
+        'Canvas': r'https://PySimpleGUI.org/en/latest/call%20reference/#canvas-element',
+        'Checkbox': r'https://PySimpleGUI.org/en/latest/call%20reference/#checkbox-element',
+        'Column': r'https://PySimpleGUI.org/en/latest/call%20reference/#column-element',
+        'Combo': r'https://PySimpleGUI.org/en/latest/call%20reference/#combo-element',
+        'Frame': r'https://PySimpleGUI.org/en/latest/call%20reference/#frame-element',
+        'Graph': r'https://PySimpleGUI.org/en/latest/call%20reference/#graph-element',
+        'HorizontalSeparator': r'https://PySimpleGUI.org/en/latest/call%20reference/#horizontalseparator-element',
+        'Image': r'https://PySimpleGUI.org/en/latest/call%20reference/#image-element',
+        'Input': r'https://PySimpleGUI.org/en/latest/call%20reference/#input-element',
+        'Listbox': r'https://PySimpleGUI.org/en/latest/call%20reference/#listbox-element',
+        'Menu': r'https://PySimpleGUI.org/en/latest/call%20reference/#menu-element',
+        'MenubarCustom': r'https://PySimpleGUI.org/en/latest/call%20reference/#menubarcustom-element',
+        'Multiline': r'https://PySimpleGUI.org/en/latest/call%20reference/#multiline-element',
+        'OptionMenu': r'https://PySimpleGUI.org/en/latest/call%20reference/#optionmenu-element',
+        'Output': r'https://PySimpleGUI.org/en/latest/call%20reference/#output-element',
+        'Pane': r'https://PySimpleGUI.org/en/latest/call%20reference/#pane-element',
+        'ProgressBar': r'https://PySimpleGUI.org/en/latest/call%20reference/#progressbar-element',
+        'Radio': r'https://PySimpleGUI.org/en/latest/call%20reference/#radio-element',
+        'Slider': r'https://PySimpleGUI.org/en/latest/call%20reference/#slider-element',
+        'Spin': r'https://PySimpleGUI.org/en/latest/call%20reference/#spin-element',
+        'StatusBar': r'https://PySimpleGUI.org/en/latest/call%20reference/#statusbar-element',
+        'Tab': r'https://PySimpleGUI.org/en/latest/call%20reference/#tab-element',
+        'TabGroup': r'https://PySimpleGUI.org/en/latest/call%20reference/#tabgroup-element',
+        'Table': r'https://PySimpleGUI.org/en/latest/call%20reference/#table-element',
+        'Text': r'https://PySimpleGUI.org/en/latest/call%20reference/#text-element',
+        'Titlebar': r'https://PySimpleGUI.org/en/latest/call%20reference/#titlebar-element',
+        'Tree': r'https://PySimpleGUI.org/en/latest/call%20reference/#tree-element',
+        'VerticalSeparator': r'https://PySimpleGUI.org/en/latest/call%20reference/#verticalseparator-element',
+        'Window': r'https://PySimpleGUI.org/en/latest/call%20reference/#window',
+    }
+
+    NOT_AN_ELEMENT = 'Not An Element'
+    element_classes = Element.__subclasses__()
+    element_names = {element.__name__: element for element in element_classes}
+    element_names['Window'] = Window
+    element_classes.append(Window)
+    element_arg_default_dict, element_arg_default_dict_update = {}, {}
+    vars3 = [m for m in inspect.getmembers(FreeSimpleGUI)]
+
+    functions = [m for m in inspect.getmembers(FreeSimpleGUI, inspect.isfunction)]
+    functions_names_lower = [f for f in functions if f[0][0].islower()]
+    functions_names_upper = [f for f in functions if f[0][0].isupper()]
+    functions_names = sorted(functions_names_lower) + sorted(functions_names_upper)
+
+    for element in element_classes:
+        # Build info about init method
+        args = inspect.getfullargspec(element.__init__).args[1:]
+        defaults = inspect.getfullargspec(element.__init__).defaults
+        # print('------------- {element}----------')
+        # print(args)
+        # print(defaults)
+        if len(args) != len(defaults):
+            diff = len(args) - len(defaults)
+            defaults = ('NO DEFAULT',) * diff + defaults
+        args_defaults = []
+        for i, a in enumerate(args):
+            args_defaults.append((a, defaults[i]))
+        element_arg_default_dict[element.__name__] = args_defaults
+
+        # Build info about update method
+        try:
+            args = inspect.getfullargspec(element.update).args[1:]
+            defaults = inspect.getfullargspec(element.update).defaults
+            if args is None or defaults is None:
+                element_arg_default_dict_update[element.__name__] = (('', ''),)
+                continue
+            if len(args) != len(defaults):
+                diff = len(args) - len(defaults)
+                defaults = ('NO DEFAULT',) * diff + defaults
+            args_defaults = []
+            for i, a in enumerate(args):
+                args_defaults.append((a, defaults[i]))
+            element_arg_default_dict_update[element.__name__] = args_defaults if len(args_defaults) else (('', ''),)
+        except Exception:
+            pass
+
+    # Add on the pseudo-elements
+    element_names['MenubarCustom'] = MenubarCustom
+    element_names['Titlebar'] = Titlebar
+
+    buttons = [[B(e, pad=(0, 0), size=(22, 1), font='Courier 10')] for e in sorted(element_names.keys())]
+    buttons += [[B('Func Search', pad=(0, 0), size=(22, 1), font='Courier 10')]]
+    button_col = Col(buttons, vertical_alignment='t')
+    mline_col = Column(
+        [
+            [
+                Multiline(
+                    size=(100, 46),
+                    key='-ML-',
+                    write_only=True,
+                    reroute_stdout=True,
+                    font='Courier 10',
+                    expand_x=True,
+                    expand_y=True,
+                )
+            ],
+            [T(size=(80, 1), font='Courier 10 underline', k='-DOC LINK-', enable_events=True)],
+        ],
+        pad=(0, 0),
+        expand_x=True,
+        expand_y=True,
+        vertical_alignment='t',
+    )
+    layout = [[button_col, mline_col]]
+    layout += [
+        [
+            CBox('Summary Only', enable_events=True, k='-SUMMARY-'),
+            CBox('Display Only PEP8 Functions', default=True, k='-PEP8-'),
+        ]
+    ]
+    # layout = [[Column(layout, scrollable=True, p=0, expand_x=True, expand_y=True, vertical_alignment='t'), Sizegrip()]]
+    layout += [[Button('Exit', size=(15, 1)), Sizegrip()]]
+
+    window = Window(
+        'SDK API Call Reference',
+        layout,
+        resizable=True,
+        use_default_focus=False,
+        keep_on_top=True,
+        icon=EMOJI_BASE64_THINK,
+        finalize=True,
+        right_click_menu=MENU_RIGHT_CLICK_EDITME_EXIT,
+    )
+    window['-DOC LINK-'].set_cursor('hand1')
+    online_help_link = ''
+    ml = window['-ML-']
+    current_element = ''
+    try:
+        while True:  # Event Loop
+            event, values = window.read()
+            if event in (WIN_CLOSED, 'Exit'):
+                break
+            if event == '-DOC LINK-':
+                if webbrowser_available and online_help_link:
+                    webbrowser.open_new_tab(online_help_link)
+            if event == '-SUMMARY-':
+                event = current_element
+
+            if event in element_names.keys():
+                current_element = event
+                window['-ML-'].update('')
+                online_help_link = online_help_links.get(event, '')
+                window['-DOC LINK-'].update(online_help_link)
+                if not values['-SUMMARY-']:
+                    elem = element_names[event]
+                    ml.print(pydoc.help(elem))
+                    # print the aliases for the class
+                    ml.print('\n--- Shortcut Aliases for Class ---')
+                    for v in vars3:
+                        if elem == v[1] and elem.__name__ != v[0]:
+                            print(v[0])
+                    ml.print('\n--- Init Parms ---')
+                else:
+                    elem = element_names[event]
+                    if inspect.isfunction(elem):
+                        ml.print('Not a class...It is a function', background_color='red', text_color='white')
+                    else:
+                        element_methods = [m[0] for m in inspect.getmembers(Element, inspect.isfunction) if not m[0].startswith('_') and not m[0][0].isupper()]
+                        methods = inspect.getmembers(elem, inspect.isfunction)
+                        methods = [m[0] for m in methods if not m[0].startswith('_') and not m[0][0].isupper()]
+
+                        unique_methods = [m for m in methods if m not in element_methods and not m[0][0].isupper()]
+
+                        properties = inspect.getmembers(elem, lambda o: isinstance(o, property))
+                        properties = [p[0] for p in properties if not p[0].startswith('_')]
+                        ml.print('--- Methods ---', background_color='red', text_color='white')
+                        ml.print('\n'.join(methods))
+                        ml.print('--- Properties ---', background_color='red', text_color='white')
+                        ml.print('\n'.join(properties))
+                        if elem != NOT_AN_ELEMENT:
+                            if issubclass(elem, Element):
+                                ml.print('Methods Unique to This Element', background_color='red', text_color='white')
+                                ml.print('\n'.join(unique_methods))
+                        ml.print('========== Init Parms ==========', background_color='#FFFF00', text_color='black')
+                        elem_text_name = event
+                        for parm, default in element_arg_default_dict[elem_text_name]:
+                            ml.print(f'{parm:18}', end=' = ')
+                            ml.print(default, end=',\n')
+                        if elem_text_name in element_arg_default_dict_update:
+                            ml.print('========== Update Parms ==========', background_color='#FFFF00', text_color='black')
+                            for parm, default in element_arg_default_dict_update[elem_text_name]:
+                                ml.print(f'{parm:18}', end=' = ')
+                                ml.print(default, end=',\n')
+                ml.set_vscroll_position(0)  # scroll to top of multoline
+            elif event == 'Func Search':
+                search_string = popup_get_text('Search for this in function list:', keep_on_top=True)
+                if search_string is not None:
+                    online_help_link = ''
+                    window['-DOC LINK-'].update('')
+                    ml.update('')
+                    for f_entry in functions_names:
+                        f = f_entry[0]
+                        if search_string in f.lower() and not f.startswith('_'):
+                            if (values['-PEP8-'] and not f[0].isupper()) or not values['-PEP8-']:
+                                if values['-SUMMARY-']:
+                                    ml.print(f)
+                                else:
+                                    ml.print(
+                                        '=========== ' + f + '===========',
+                                        background_color='#FFFF00',
+                                        text_color='black',
+                                    )
+                                    ml.print(pydoc.help(f_entry[1]))
+                ml.set_vscroll_position(0)  # scroll to top of multoline
+    except Exception as e:
+        _error_popup_with_traceback('Exception in SDK reference', e)
+    window.close()
+
+
+#                     oo
+#
+# 88d8b.d8b. .d8888b. dP 88d888b.
+# 88'`88'`88 88'  `88 88 88'  `88
+# 88  88  88 88.  .88 88 88    88
+# dP  dP  dP `88888P8 dP dP    dP
+#
+#
+# M""MMM""MMM""M oo                dP
+# M  MMM  MMM  M                   88
+# M  MMP  MMP  M dP 88d888b. .d888b88 .d8888b. dP  dP  dP
+# M  MM'  MM' .M 88 88'  `88 88'  `88 88'  `88 88  88  88
+# M  `' . '' .MM 88 88    88 88.  .88 88.  .88 88.88b.88'
+# M    .d  .dMMM dP dP    dP `88888P8 `88888P' 8888P Y8P
+# MMMMMMMMMMMMMM
+#
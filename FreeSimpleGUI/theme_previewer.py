@@ -0,0 +1,219 @@
+from __future__ import annotations
+
+from FreeSimpleGUI import B
+from FreeSimpleGUI import clipboard_set
+from FreeSimpleGUI import COLOR_SYSTEM_DEFAULT
+from FreeSimpleGUI import InputText
+from FreeSimpleGUI import list_of_look_and_feel_values
+from FreeSimpleGUI import OFFICIAL_PYSIMPLEGUI_THEME
+from FreeSimpleGUI import popup_quick_message
+from FreeSimpleGUI import SYMBOL_SQUARE
+from FreeSimpleGUI import T
+from FreeSimpleGUI import theme
+from FreeSimpleGUI import theme_background_color
+from FreeSimpleGUI import theme_button_color
+from FreeSimpleGUI import theme_input_background_color
+from FreeSimpleGUI import theme_input_text_color
+from FreeSimpleGUI import theme_list
+from FreeSimpleGUI import theme_text_color
+from FreeSimpleGUI import WIN_CLOSED
+from FreeSimpleGUI.elements.button import Button
+from FreeSimpleGUI.elements.column import Column
+from FreeSimpleGUI.elements.frame import Frame
+from FreeSimpleGUI.elements.slider import Slider
+from FreeSimpleGUI.elements.text import Text
+from FreeSimpleGUI.window import Window
+
+
+def theme_previewer(columns=12, scrollable=False, scroll_area_size=(None, None), search_string=None, location=(None, None)):
+    """
+    Displays a "Quick Reference Window" showing all of the different Look and Feel settings that are available.
+    They are sorted alphabetically.  The legacy color names are mixed in, but otherwise they are sorted into Dark and Light halves
+    If one of the "OK" buttons are pressed then that theme name is returned.
+
+    :param columns:          The number of themes to display per row
+    :type columns:           int
+    :param scrollable:       If True then scrollbars will be added
+    :type scrollable:        bool
+    :param scroll_area_size: Size of the scrollable area (The Column Element used to make scrollable)
+    :type scroll_area_size:  (int, int)
+    :param search_string:    If specified then only themes containing this string will be shown
+    :type search_string:     str
+    :param location:         Location on the screen to place the window. Defaults to the center like all windows
+    :type location:          (int, int)
+    """
+
+    current_theme = theme()
+
+    # Show a "splash" type message so the user doesn't give up waiting
+    popup_quick_message(
+        'Hang on for a moment, this will take a bit to create....',
+        keep_on_top=True,
+        background_color='red',
+        text_color='#FFFFFF',
+        auto_close=True,
+        non_blocking=True,
+    )
+
+    web = False
+
+    win_bg = 'black'
+
+    def sample_layout(theme_name):
+        return [
+            [Text('Text element'), InputText('Input data here', size=(10, 1))],
+            [Button('Ok', key=f"choose_{theme_name}", tooltip=f"Choose {theme_name}"), Button('Disabled', disabled=True), Slider((1, 10), orientation='h', size=(5, 15))],
+        ]
+
+    names = list_of_look_and_feel_values()
+    names.sort()
+    if search_string not in (None, ''):
+        names = [name for name in names if search_string.lower().replace(' ', '') in name.lower().replace(' ', '')]
+
+    if search_string not in (None, ''):
+        layout = [[Text(f'Themes containing "{search_string}"', font='Default 18', background_color=win_bg)]]
+    else:
+        layout = [[Text('List of all themes', font='Default 18', background_color=win_bg)]]
+
+    col_layout = []
+    row = []
+    for count, theme_name in enumerate(names):
+        theme(theme_name)
+        if not count % columns:
+            col_layout += [row]
+            row = []
+        row += [Frame(theme_name, sample_layout(theme_name) if not web else [[T(theme_name)]] + sample_layout(theme_name), pad=(2, 2))]
+    if row:
+        col_layout += [row]
+
+    layout += [
+        [
+            Column(
+                col_layout,
+                scrollable=scrollable,
+                size=scroll_area_size,
+                pad=(0, 0),
+                background_color=win_bg,
+                key='-COL-',
+            )
+        ]
+    ]
+    window = Window(
+        'Preview of Themes',
+        layout,
+        background_color=win_bg,
+        resizable=True,
+        location=location,
+        keep_on_top=True,
+        finalize=True,
+        modal=True,
+    )
+    window['-COL-'].expand(True, True, True)  # needed so that col will expand with the window
+    event, values = window.read(close=True)
+    theme(current_theme)
+    if event and event.startswith('choose_'):
+        return event[7:]
+
+
+preview_all_look_and_feel_themes = theme_previewer
+
+
+def _theme_preview_window_swatches():
+    # Begin the layout with a header
+    layout = [
+        [Text('Themes as color swatches', text_color='white', background_color='black', font='Default 25')],
+        [
+            Text(
+                'Tooltip and right click a color to get the value',
+                text_color='white',
+                background_color='black',
+                font='Default 15',
+            )
+        ],
+        [
+            Text(
+                'Left click a color to copy to clipboard',
+                text_color='white',
+                background_color='black',
+                font='Default 15',
+            )
+        ],
+    ]
+    layout = [[Column(layout, element_justification='c', background_color='black')]]
+    # Create the pain part, the rows of Text with color swatches
+    for i, theme_name in enumerate(theme_list()):
+        theme(theme_name)
+        colors = [
+            theme_background_color(),
+            theme_text_color(),
+            theme_input_background_color(),
+            theme_input_text_color(),
+        ]
+        if theme_button_color() != COLOR_SYSTEM_DEFAULT:
+            colors.append(theme_button_color()[0])
+            colors.append(theme_button_color()[1])
+        colors = list(set(colors))  # de-duplicate items
+        row = [T(theme(), background_color='black', text_color='white', size=(20, 1), justification='r')]
+        for color in colors:
+            if color != COLOR_SYSTEM_DEFAULT:
+                row.append(
+                    T(
+                        SYMBOL_SQUARE,
+                        text_color=color,
+                        background_color='black',
+                        pad=(0, 0),
+                        font='DEFAUlT 20',
+                        right_click_menu=['Nothing', [color]],
+                        tooltip=color,
+                        enable_events=True,
+                        key=(i, color),
+                    )
+                )
+        layout += [row]
+    # place layout inside of a Column so that it's scrollable
+    layout = [[Column(layout, size=(500, 900), scrollable=True, vertical_scroll_only=True, background_color='black')]]
+    # finish the layout by adding an exit button
+    layout += [[B('Exit')]]
+
+    # create and return Window that uses the layout
+    return Window('Theme Color Swatches', layout, background_color='black', finalize=True, keep_on_top=True)
+
+
+def theme_previewer_swatches():
+    """
+    Display themes in a window as color swatches.
+    Click on a color swatch to see the hex value printed on the console.
+    If you hover over a color or right click it you'll also see the hext value.
+    """
+    current_theme = theme()
+    popup_quick_message(
+        'This is going to take a minute...',
+        text_color='white',
+        background_color='red',
+        font='Default 20',
+        keep_on_top=True,
+    )
+    window = _theme_preview_window_swatches()
+    theme(OFFICIAL_PYSIMPLEGUI_THEME)
+    # col_height = window.get_screen_size()[1]-200
+    # if window.size[1] > 100:
+    #     window.size = (window.size[0], col_height)
+    # window.move(window.get_screen_size()[0] // 2 - window.size[0] // 2, 0)
+
+    while True:  # Event Loop
+        event, values = window.read()
+        if event == WIN_CLOSED or event == 'Exit':
+            break
+        if isinstance(event, tuple):  # someone clicked a swatch
+            chosen_color = event[1]
+        else:
+            if event[0] == '#':  # someone right clicked
+                chosen_color = event
+            else:
+                chosen_color = ''
+        print('Copied to clipboard color = ', chosen_color)
+        clipboard_set(chosen_color)
+        # window.TKroot.clipboard_clear()
+        # window.TKroot.clipboard_append(chosen_color)
+    window.close()
+    theme(current_theme)
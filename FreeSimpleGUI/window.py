@@ -1,30 +1,36 @@
 from __future__ import annotations
 
-import calendar
 import datetime
 import difflib
 import os
-import pickle
 import queue
 import sys
 import threading
+import time
 import tkinter
 import tkinter as tk
+import types
 import warnings
 from typing import Any
+from typing import Callable
 from typing import Dict
 from typing import List
 from typing import Tuple
 
 import FreeSimpleGUI
+from FreeSimpleGUI import _ASYNC_POLL_KEY
+from FreeSimpleGUI import _ASYNC_READ_MAX_SLEEP
+from FreeSimpleGUI import _ASYNC_READ_MIN_SLEEP
+from FreeSimpleGUI import _async_read_sleep
 from FreeSimpleGUI import _BuildResults
-from FreeSimpleGUI import _Debugger
+from FreeSimpleGUI import _debugger_build_floating_window_hook
+from FreeSimpleGUI import _debugger_build_main_window_hook
 from FreeSimpleGUI import _debugger_window_is_open
 from FreeSimpleGUI import _FindElementWithFocusInSubForm
 from FreeSimpleGUI import _get_hidden_master_root
 from FreeSimpleGUI import _global_settings_get_watermark_info
 from FreeSimpleGUI import _long_func_thread
-from FreeSimpleGUI import _refresh_debugger
+from FreeSimpleGUI import _ReadProfiler
 from FreeSimpleGUI import _TimerPeriodic
 from FreeSimpleGUI import BUTTON_TYPE_CALENDAR_CHOOSER
 from FreeSimpleGUI import COLOR_SYSTEM_DEFAULT
@@ -51,7 +57,6 @@ from FreeSimpleGUI import ELEM_TYPE_TAB
 from FreeSimpleGUI import ELEM_TYPE_TAB_GROUP
 from FreeSimpleGUI import ELEM_TYPE_TABLE
 from FreeSimpleGUI import ELEM_TYPE_TREE
-from FreeSimpleGUI import EMOJI_BASE64_KEY
 from FreeSimpleGUI import EVENT_TIMER
 from FreeSimpleGUI import fill_form_with_values
 from FreeSimpleGUI import GRAB_ANYWHERE_IGNORE_THESE_WIDGETS
@@ -68,6 +73,8 @@ from FreeSimpleGUI import StartupTK
 from FreeSimpleGUI import theme_input_background_color
 from FreeSimpleGUI import theme_input_text_color
 from FreeSimpleGUI import theme_use_custom_titlebar
+from FreeSimpleGUI import THREAD_EVENTS_BATCH_LATEST
+from FreeSimpleGUI import THREAD_EVENTS_KEY
 from FreeSimpleGUI import TIMEOUT_KEY
 from FreeSimpleGUI import Titlebar
 from FreeSimpleGUI import TITLEBAR_CLOSE_KEY
@@ -104,10 +111,9 @@ class Window:
     _window_running_mainloop = None  # The window that is running the mainloop
     _container_element_counter = 0  # used to get a number of Container Elements (Frame, Column, Tab)
     _read_call_from_debugger = False
+    _read_hooks = []  # type: List[Callable[[Window, types.FrameType], None]]    # called at the start of reads. See _add_read_hook
     _timeout_0_counter = 0  # when timeout=0 then go through each window one at a time
     _counter_for_ttk_widgets = 0
-    _floating_debug_window_build_needed = False
-    _main_debug_window_build_needed = False
     # rereouted stdout info. List of tuples (window, element, previous destination)
     _rerouted_stdout_stack = []  # type: List[Tuple[Window, Element]]
     _rerouted_stderr_stack = []  # type: List[Tuple[Window, Element]]
@@ -116,6 +122,37 @@ class Window:
     _watermark = None
     _watermark_temp_forced = False
     _watermark_user_text = ''
+    _window_pool = []  # type: List[Window]    # closed windows with a reuse_key, hidden and waiting to be used again. Oldest first
+    _window_taken_from_pool = None  # type: Window    # set by __new__ so that __init__ knows it's reusing a window
+    _async_read_wakeups = set()  # functions that wake up the async reads that are sleeping between polls
+    # Attributes of an element that may hold a tkinter widget other than element.Widget. Used to build the widget to element map
+    _element_widget_attributes = (
+        'TKEntry',
+        'TKText',
+        'TKTreeview',
+        'TKListbox',
+        'TKCombo',
+        'TKSpinBox',
+        'TKCheckbutton',
+        'TKRadio',
+        'TKOptionMenu',
+        'TKNotebook',
+        'TKButton',
+        'TKButtonMenu',
+        'TKScale',
+        'TKFrame',
+        'TKColFrame',
+        '_TKCanvas',
+        'element_frame',
+        'table_frame',
+        'tktext_label',
+    )
+
+    def __new__(cls, *args, **kwargs):
+        window = cls._take_from_window_pool(kwargs.get('reuse_key'))
+        if window is not None:
+            return window
+        return super().__new__(cls)
 
     def __init__(
         self,
@@ -181,6 +218,8 @@ class Window:
         sbar_relief=None,
         watermark=None,
         metadata=None,
+        thread_event_batching=None,
+        reuse_key=None,
     ):
         """
         :param title:                                The title that will be displayed in the Titlebar and on the Taskbar
@@ -307,8 +346,17 @@ class Window:
         :type watermark:                             bool
         :param metadata:                             User metadata that can be set to ANYTHING
         :type metadata:                              (Any)
+        :param thread_event_batching:                If set, a read returns all of the events written by write_event_value at once as the event THREAD_EVENTS_KEY, with the batch in values[THREAD_EVENTS_KEY]. THREAD_EVENTS_BATCH_LIST gives a list of (key, value) tuples. THREAD_EVENTS_BATCH_LATEST gives a dictionary with the latest value for each key
+        :type thread_event_batching:                 (str | None)
+        :param reuse_key:                            If set, closing the window hides it instead of destroying it. The next Window made with the same reuse_key gets this window back (the layout and settings passed to it are not used) with the input values reset to what they were when the window was first shown. See set_options window_pool_size
+        :type reuse_key:                             (Any)
         """
 
+        if Window._window_taken_from_pool is self:
+            Window._window_taken_from_pool = None
+            self._reuse_from_window_pool(title, metadata, finalize)
+            return
+
         self._metadata = None  # type: Any
         self.AutoSizeText = auto_size_text if auto_size_text is not None else FreeSimpleGUI.DEFAULT_AUTOSIZE_TEXT
         self.AutoSizeButtons = auto_size_buttons if auto_size_buttons is not None else FreeSimpleGUI.DEFAULT_AUTOSIZE_BUTTONS
@@ -389,6 +437,17 @@ class Window:
         # The dictionary containing all elements and keys for the window
         # The keys are the keys for the elements and the values are the elements themselves.
         self.AllKeysDict = {}
+        self._element_index = None  # type: List[Element]  # every element in the window. See _build_element_index
+        self._element_index_parents = None  # type: List[int]
+        self._element_index_ends = None  # type: List[int]
+        self._element_index_positions = None  # type: Dict[Element, int]
+        self._element_index_by_type = None  # type: Dict[str, List[Element]]
+        self._widget_to_element_dict = {}  # type: Dict[tk.Widget, Element]
+        self._results_elements = None  # Flat list of the elements that are read to build results. Built on first read
+        self._results_list_order = None
+        self._results_use_dictionary = False
+        self._multilines_to_flush = {}  # buffered Multiline elements with text waiting to be shown. A dict is used as an ordered set
+        self._multilines_to_flush_lock = threading.Lock()  # held when adding to or swapping _multilines_to_flush as threads add to it
         self.TransparentColor = transparent_color
         self.UniqueKeyCounter = 0
         self.DebuggerEnabled = debugger_enabled
@@ -405,6 +464,13 @@ class Window:
         self.thread_lock = None  # type: threading.Lock
         self.thread_timer = None  # type: tk.Misc
         self.thread_strvar = None  # type: tk.StringVar
+        self.thread_event_batching = thread_event_batching
+        self._thread_wakeup_pending = False  # True after a thread wakes up the window until the queue is read
+        self._profiler = None  # type: _ReadProfiler    # Set by enable_profiler
+        self.reuse_key = reuse_key
+        self._values_for_reuse = None  # type: Dict    # values of the input elements when first shown. Used to reset a reused window
+        self._withdrawn_for_pool = False  # True if the tkinter window was withdrawn instead of destroyed
+        self._reappear_from_pool_needed = False  # True from taking the window out of the pool until it's read
         self.read_closed_window_count = 0
         self.config_last_size = (None, None)
         self.config_last_location = (None, None)
@@ -599,6 +665,9 @@ class Window:
                 self.NoTitleBar = True
         # -------------------------  Append the row to list of Rows  ------------------------- #
         self.Rows.append(CurrentRow)
+        if self._element_index is not None:  # rows added after the layout was set are added to the end of the index
+            self._index_elements_in_row(CurrentRow, -1)
+        self._results_elements = None  # layout changed so the list of elements read to build results must be rebuilt
 
     # ------------------------- Add Multiple Rows to Form ------------------------- #
     def add_rows(self, rows):
@@ -901,7 +970,7 @@ class Window:
             now = datetime.datetime.now()
             hour, minute, second = now.hour, now.minute, now.second
             try:
-                date_string = calendar.datetime.datetime(year, month, day, hour, minute, second).strftime(elem.calendar_format)
+                date_string = datetime.datetime(year, month, day, hour, minute, second).strftime(elem.calendar_format)
             except Exception as e:
                 print('Bad format string in calendar chooser button', e)
                 date_string = 'Bad format string'
@@ -920,6 +989,46 @@ class Window:
             should_submit_window = False
         return should_submit_window
 
+    @classmethod
+    def _add_read_hook(cls, hook):
+        """
+        Not user callable.  Registers a function that is called at the start of every read until it is removed.  It is
+        called with the window being read and the frame of the code that called read.
+
+        :param hook: The function to call.  hook(window, frame)
+        :type hook:  Callable[[Window, types.FrameType], None]
+        """
+        if hook not in Window._read_hooks:
+            Window._read_hooks.append(hook)
+
+    @classmethod
+    def _remove_read_hook(cls, hook):
+        """
+        Not user callable.  Removes a function registered with _add_read_hook.
+
+        :param hook: The function to remove
+        :type hook:  Callable[[Window, types.FrameType], None]
+        """
+        if hook in Window._read_hooks:
+            Window._read_hooks.remove(hook)
+
+    def _call_read_hooks(self, frame):
+        """
+        Not user callable.  Calls the read hooks.  Reads made by the hooks themselves do not call the hooks.
+
+        :param frame: The frame of the code that called read
+        :type frame:  (types.FrameType)
+        """
+        Window._read_call_from_debugger = True
+        try:
+            for hook in list(Window._read_hooks):  # a hook may add or remove hooks
+                try:
+                    hook(self, frame)
+                except:
+                    pass
+        finally:
+            Window._read_call_from_debugger = False
+
     # @_timeit_summary
     def read(self, timeout=None, timeout_key=TIMEOUT_KEY, close=False):
         """
@@ -937,22 +1046,21 @@ class Window:
         :rtype:             Tuple[(Any), Dict[Any, Any], List[Any], None]
         """
 
-        if Window._floating_debug_window_build_needed is True:
-            Window._floating_debug_window_build_needed = False
-            _Debugger.debugger._build_floating_window()
+        # Read hooks are only registered while needed (e.g. while a debugger window is open) so normally nothing is done
+        if Window._read_hooks and not Window._read_call_from_debugger:
+            self._call_read_hooks(sys._getframe(1))
+            # if the user has not added timeout and a debug window is open, then set a timeout for them so the debugger continuously refreshes
+            if _debugger_window_is_open() and (timeout is None or timeout > 3000):
+                timeout = 200
 
-        if Window._main_debug_window_build_needed is True:
-            Window._main_debug_window_build_needed = False
-            _Debugger.debugger._build_main_debugger_window()
+        self._flush_multiline_buffers()
 
-        # ensure called only 1 time through a single read cycle
-        if not Window._read_call_from_debugger:
-            _refresh_debugger()
+        if self._reappear_from_pool_needed:
+            self._reappear_from_window_pool()
 
-        # if the user has not added timeout and a debug window is open, then set a timeout for them so the debugger continuously refreshes
-        if _debugger_window_is_open() and not Window._read_call_from_debugger:
-            if timeout is None or timeout > 3000:
-                timeout = 200
+        profiler = self._profiler
+        if profiler is not None:
+            profiler.read_started()
 
         while True:
             Window._root_running_mainloop = self.TKroot
@@ -984,11 +1092,50 @@ class Window:
             except:
                 break  # wasn't a calendar button for sure
 
+        if profiler is not None:
+            profiler.read_finished()
+
         if close:
             self.close()
 
         return results
 
+    async def read_async(self, timeout=None, timeout_key=TIMEOUT_KEY, close=False):
+        """
+        The asyncio version of read.  Other coroutines keep running while the window waits for an event.  The window
+        is polled using read with a timeout of 0.  Between polls the asyncio loop is given control.  The time between
+        polls grows while the window is idle so that an idle window uses almost no CPU.  Calling write_event_value from
+        a thread or a coroutine gets the event returned right away.
+
+        :param timeout:     Milliseconds to wait until the read will return IF no other GUI events happen first
+        :type timeout:      (int)
+        :param timeout_key: The value that will be returned from the call if the timer expired
+        :type timeout_key:  (Any)
+        :param close:       if True the window will be closed prior to returning
+        :type close:        (bool)
+        :return:            (event, values)
+        :rtype:             Tuple[(Any), Dict[Any, Any], List[Any], None]
+        """
+        start_time = time.perf_counter()
+        delay = _ASYNC_READ_MIN_SLEEP
+        while True:
+            event, values = self.read(timeout=0, timeout_key=_ASYNC_POLL_KEY)
+            if event is not _ASYNC_POLL_KEY:
+                break
+            if timeout is not None:
+                remaining = timeout / 1000 - (time.perf_counter() - start_time)
+                if remaining <= 0:
+                    event = timeout_key
+                    break
+                delay = min(delay, remaining)
+            await _async_read_sleep(delay)
+            delay = min(delay * 2, _ASYNC_READ_MAX_SLEEP)
+
+        if close:
+            self.close()
+
+        return event, values
+
     # @_timeit
     def _read(self, timeout=None, timeout_key=TIMEOUT_KEY):
         """
@@ -1070,7 +1217,7 @@ class Window:
                     pass
             if self.RootNeedsDestroying:
                 try:
-                    self.TKroot.destroy()
+                    self._destroy_tkroot()
                 except:
                     pass
                 # _my_windows.Decrement()
@@ -1083,11 +1230,16 @@ class Window:
                 self.TKAfterID = self.TKroot.after(timeout, self._TimeoutAlarmCallback)
             self.CurrentlyRunningMainloop = True
             Window._window_running_mainloop = self
+            profiler = self._profiler
+            if profiler is not None:
+                start = time.perf_counter()
             try:
                 Window._root_running_mainloop.mainloop()
             except:
                 print('**** EXITING ****')
                 sys.exit(-1)
+            if profiler is not None:
+                profiler._mainloop_time += time.perf_counter() - start
             # print('Out main')
             self.CurrentlyRunningMainloop = False
             # if self.LastButtonClicked != TIMEOUT_KEY:
@@ -1101,7 +1253,7 @@ class Window:
             if self.RootNeedsDestroying:
                 # print('*** DESTROYING LATE ***')
                 try:
-                    self.TKroot.destroy()
+                    self._destroy_tkroot()
                 except:
                     pass
                 Window._DecrementOpenCount()
@@ -1137,7 +1289,7 @@ class Window:
         if self.TKrootDestroyed:
             try:
                 self.TKroot.quit()
-                self.TKroot.destroy()
+                self._destroy_tkroot()
             except:
                 pass
                 # print('DESTROY FAILED')
@@ -1150,7 +1302,7 @@ class Window:
             self.TKrootDestroyed = True
             Window._DecrementOpenCount()
         if self.RootNeedsDestroying:
-            self.TKroot.destroy()
+            self._destroy_tkroot()
             Window._DecrementOpenCount()
             self.Values = None
             self.LastButtonClicked = None
@@ -1206,12 +1358,71 @@ class Window:
 
         if self.TKrootDestroyed:
             return self
+        self._flush_multiline_buffers()
         try:
             self.TKroot.update()
         except:
             pass
         return self
 
+    def _flush_multiline_buffers(self):
+        """
+        Not user callable.  Shows the text waiting in the buffers of Multiline elements that were created with buffered=True
+        """
+        if not self._multilines_to_flush:
+            return
+        with self._multilines_to_flush_lock:
+            multilines = self._multilines_to_flush
+            self._multilines_to_flush = {}
+        for multiline in multilines:
+            multiline._flush_buffer()
+
+    def enable_profiler(self, max_reads=1000):
+        """
+        Starts recording how long each read of this window takes and where the time goes.  For every read the profiler
+        records the total time, the time spent waiting in the tkinter mainloop, the time spent building the results,
+        the number of Tcl commands run, the number of thread events waiting and the time spent in callbacks.
+        Callback durations are also recorded for each element key.  Only the last max_reads reads are kept.
+        Calling again discards what has been recorded so far.
+        The results are shown in the "Profiler" tab of the debugger window and are available from get_profiler_stats.
+
+        :param max_reads: Number of reads (and callbacks per key) to keep
+        :type max_reads:  (int)
+        :return:          returns self so can be chained with other methods
+        :rtype:           (Window)
+        """
+        self._profiler = _ReadProfiler.enable(self, max_reads)
+        return self
+
+    def disable_profiler(self):
+        """
+        Stops recording the read timings for this window.  The recorded reads are discarded.
+
+        :return: returns self so can be chained with other methods
+        :rtype:  (Window)
+        """
+        _ReadProfiler.disable(self)
+        self._profiler = None
+        return self
+
+    def get_profiler_stats(self, percentiles=(50, 90, 99)):
+        """
+        Returns the statistics for the reads recorded since enable_profiler was called.  Times are in milliseconds.
+        The dictionary has the keys:
+            'reads' - the number of reads recorded
+            'total', 'mainloop_wait', 'build_results', 'callbacks', 'tcl_commands', 'thread_queue_depth' - a summary for each
+            'callbacks_by_key' - a summary for each element key (or function name), the largest total time first
+        Each summary is a dictionary with the keys 'count', 'mean', 'max' and each of the percentiles requested.
+
+        :param percentiles: The percentiles to compute. (50, 90, 99) gives the median, 90th and 99th percentile
+        :type percentiles:  List[int | float] | Tuple[int | float, ...]
+        :return:            Dictionary of statistics or None if the profiler is not enabled
+        :rtype:             Dict[str, Any] | None
+        """
+        if self._profiler is None:
+            return None
+        return self._profiler.get_stats(percentiles)
+
     def fill(self, values_dict):
         """
         Fill in elements that are input fields with data based on a 'values dictionary'
@@ -1313,7 +1524,7 @@ class Window:
                     'Key Error',
                     'Problem finding your key ' + str(key),
                     'Closest match = ' + str(closest_key),
-                    emoji=EMOJI_BASE64_KEY,
+                    emoji=FreeSimpleGUI.EMOJI_BASE64_KEY,
                 )
                 element = ErrorElement(key=key)
             else:
@@ -1349,92 +1560,178 @@ class Window:
         :return:    Element that uses the specified widget
         :rtype:     Element | None
         """
-        if self.AllKeysDict is None or len(self.AllKeysDict) == 0:
-            return None
-        for key, element in self.AllKeysDict.items():
-            if element.Widget == widget:
-                return element
-        return None
+        return self._widget_to_element_dict.get(widget)
 
     def _BuildKeyDict(self):
         """
         Used internally only! Not user callable
-        Builds a dictionary containing all elements with keys for this window.
+        Builds the element index for the window and a dictionary containing all elements with keys for this window.
         """
+        self._build_element_index()
         dict = {}
         self.AllKeysDict = self._BuildKeyDictForWindow(self, self, dict)
 
     def _BuildKeyDictForWindow(self, top_window, window, key_dict):
         """
-        Loop through all Rows and all Container Elements for this window and create the keys for all of them.
-        Note that the calls are recursive as all pathes must be walked
+        Loop through all elements in the window (or a container element) and create the keys for all of them.
+        The elements are visited using the window's element index, contents of a container first, then the container
 
         :param top_window: The highest level of the window
         :type top_window:  (Window)
         :param window:     The "sub-window" (container element) to be searched
-        :type window:      Column | Frame | FreeSimpleGUI.elements.tab.TabGroup | FreeSimpleGUI.elements.pane.Pane | FreeSimpleGUI.elements.tab.Tab
-        :param key_dict:   The dictionary as it currently stands.... used as part of recursive call
+        :type window:      Window | Column | Frame | FreeSimpleGUI.elements.tab.TabGroup | FreeSimpleGUI.elements.pane.Pane | FreeSimpleGUI.elements.tab.Tab
+        :param key_dict:   The dictionary as it currently stands
         :type key_dict:
         :return:           (dict) Dictionary filled with all keys in the window
         :rtype:
         """
-        for row_num, row in enumerate(window.Rows):
-            for col_num, element in enumerate(row):
-                if element.Type == ELEM_TYPE_COLUMN:
-                    key_dict = self._BuildKeyDictForWindow(top_window, element, key_dict)
-                if element.Type == ELEM_TYPE_FRAME:
-                    key_dict = self._BuildKeyDictForWindow(top_window, element, key_dict)
-                if element.Type == ELEM_TYPE_TAB_GROUP:
-                    key_dict = self._BuildKeyDictForWindow(top_window, element, key_dict)
-                if element.Type == ELEM_TYPE_PANE:
-                    key_dict = self._BuildKeyDictForWindow(top_window, element, key_dict)
-                if element.Type == ELEM_TYPE_TAB:
-                    key_dict = self._BuildKeyDictForWindow(top_window, element, key_dict)
-                if element.Key is None:  # if no key has been assigned.... create one for input elements
-                    if element.Type == ELEM_TYPE_BUTTON:
-                        element.Key = element.ButtonText
-                    elif element.Type == ELEM_TYPE_TAB:
-                        element.Key = element.Title
-                    if element.Type in (
-                        ELEM_TYPE_MENUBAR,
-                        ELEM_TYPE_BUTTONMENU,
-                        ELEM_TYPE_INPUT_SLIDER,
-                        ELEM_TYPE_GRAPH,
-                        ELEM_TYPE_IMAGE,
-                        ELEM_TYPE_INPUT_CHECKBOX,
-                        ELEM_TYPE_INPUT_LISTBOX,
-                        ELEM_TYPE_INPUT_COMBO,
-                        ELEM_TYPE_INPUT_MULTILINE,
-                        ELEM_TYPE_INPUT_OPTION_MENU,
-                        ELEM_TYPE_INPUT_SPIN,
-                        ELEM_TYPE_INPUT_RADIO,
-                        ELEM_TYPE_INPUT_TEXT,
-                        ELEM_TYPE_PROGRESS_BAR,
-                        ELEM_TYPE_TABLE,
-                        ELEM_TYPE_TREE,
-                        ELEM_TYPE_TAB_GROUP,
-                        ELEM_TYPE_SEPARATOR,
-                    ):
-                        element.Key = top_window.DictionaryKeyCounter
-                        top_window.DictionaryKeyCounter += 1
-                if element.Key is not None:
-                    if element.Key in key_dict.keys():
-                        if element.Type == ELEM_TYPE_BUTTON and FreeSimpleGUI.WARN_DUPLICATE_BUTTON_KEY_ERRORS:  # for Buttons see if should complain
-                            warnings.warn(f'*** Duplicate key found in your layout {element.Key} ***', UserWarning)
-                            warnings.warn(f'*** Replaced new key with {str(element.Key) + str(self.UniqueKeyCounter)} ***')
-                            if not FreeSimpleGUI.SUPPRESS_ERROR_POPUPS:
-                                _error_popup_with_traceback(
-                                    'Duplicate key found in your layout',
-                                    f'Dupliate key: {element.Key}',
-                                    f'Is being replaced with: {str(element.Key) + str(self.UniqueKeyCounter)}',
-                                    'The line of code above shows you which layout, but does not tell you exactly where the element was defined',
-                                    f'The element type is {element.Type}',
-                                )
-                        element.Key = str(element.Key) + str(self.UniqueKeyCounter)
-                        self.UniqueKeyCounter += 1
-                    key_dict[element.Key] = element
+        if self._element_index is None or (window is not top_window and window not in self._element_index_positions):
+            self._build_element_index()  # container was changed after the index was built (e.g. a tab was added)
+        if window is top_window:
+            start, end = 0, len(self._element_index)
+        else:
+            start = self._element_index_positions[window] + 1
+            end = self._element_index_ends[start - 1]
+        for position in self._element_index_postorder(start, end):
+            element = self._element_index[position]
+            if element.Key is None:  # if no key has been assigned.... create one for input elements
+                if element.Type == ELEM_TYPE_BUTTON:
+                    element.Key = element.ButtonText
+                elif element.Type == ELEM_TYPE_TAB:
+                    element.Key = element.Title
+                if element.Type in (
+                    ELEM_TYPE_MENUBAR,
+                    ELEM_TYPE_BUTTONMENU,
+                    ELEM_TYPE_INPUT_SLIDER,
+                    ELEM_TYPE_GRAPH,
+                    ELEM_TYPE_IMAGE,
+                    ELEM_TYPE_INPUT_CHECKBOX,
+                    ELEM_TYPE_INPUT_LISTBOX,
+                    ELEM_TYPE_INPUT_COMBO,
+                    ELEM_TYPE_INPUT_MULTILINE,
+                    ELEM_TYPE_INPUT_OPTION_MENU,
+                    ELEM_TYPE_INPUT_SPIN,
+                    ELEM_TYPE_INPUT_RADIO,
+                    ELEM_TYPE_INPUT_TEXT,
+                    ELEM_TYPE_PROGRESS_BAR,
+                    ELEM_TYPE_TABLE,
+                    ELEM_TYPE_TREE,
+                    ELEM_TYPE_TAB_GROUP,
+                    ELEM_TYPE_SEPARATOR,
+                ):
+                    element.Key = top_window.DictionaryKeyCounter
+                    top_window.DictionaryKeyCounter += 1
+            if element.Key is not None:
+                if element.Key in key_dict.keys():
+                    if element.Type == ELEM_TYPE_BUTTON and FreeSimpleGUI.WARN_DUPLICATE_BUTTON_KEY_ERRORS:  # for Buttons see if should complain
+                        warnings.warn(f'*** Duplicate key found in your layout {element.Key} ***', UserWarning)
+                        warnings.warn(f'*** Replaced new key with {str(element.Key) + str(self.UniqueKeyCounter)} ***')
+                        if not FreeSimpleGUI.SUPPRESS_ERROR_POPUPS:
+                            _error_popup_with_traceback(
+                                'Duplicate key found in your layout',
+                                f'Dupliate key: {element.Key}',
+                                f'Is being replaced with: {str(element.Key) + str(self.UniqueKeyCounter)}',
+                                'The line of code above shows you which layout, but does not tell you exactly where the element was defined',
+                                f'The element type is {element.Type}',
+                            )
+                    element.Key = str(element.Key) + str(self.UniqueKeyCounter)
+                    self.UniqueKeyCounter += 1
+                key_dict[element.Key] = element
         return key_dict
 
+    def _build_element_index(self):
+        """
+        Used internally only! Not user callable
+        Builds the element index for the window. This is the only place the rows of the window and its container
+        elements are walked. Everything else that needs to visit all elements uses the index. The index has:
+            _element_index - every element in the window, in the order found walking the layout (containers before their contents)
+            _element_index_parents - position in the index of the container holding each element. -1 if in the window itself
+            _element_index_ends - position just past the last element inside of each element (the element itself if not a container)
+            _element_index_positions - element to position in the index
+            _element_index_by_type - lists of the elements of each element type
+        Rows added later with add_row (and extend_layout) are added to the end of the index.
+        """
+        self._element_index = []
+        self._element_index_parents = []
+        self._element_index_ends = []
+        self._element_index_positions = {}
+        self._element_index_by_type = {}
+        self._results_elements = None
+        for row in self.Rows:
+            self._index_elements_in_row(row, -1)
+
+    def _index_elements_in_row(self, row, parent_position):
+        """
+        Used internally only! Not user callable
+        Adds the elements in a row to the element index. Container elements have their contents added right after them.
+
+        :param row:             The row of elements to add
+        :type row:              List[Element]
+        :param parent_position: The position in the index of the container holding the row. -1 if the row is in the window
+        :type parent_position:  (int)
+        """
+        for element in row:
+            position = len(self._element_index)
+            self._element_index.append(element)
+            self._element_index_parents.append(parent_position)
+            self._element_index_ends.append(position + 1)
+            self._element_index_positions[element] = position
+            self._element_index_by_type.setdefault(element.Type, []).append(element)
+            if element.Type in (
+                ELEM_TYPE_COLUMN,
+                ELEM_TYPE_FRAME,
+                ELEM_TYPE_TAB_GROUP,
+                ELEM_TYPE_PANE,
+                ELEM_TYPE_TAB,
+            ):
+                for container_row in element.Rows:
+                    self._index_elements_in_row(container_row, position)
+                self._element_index_ends[position] = len(self._element_index)
+
+    def _element_index_postorder(self, start=0, end=None):
+        """
+        Used internally only! Not user callable
+        Generates the positions of a range of the element index with the contents of containers coming before the container.
+
+        :param start: First position in the index
+        :type start:  (int)
+        :param end:   Position just past the last position in the index. None means the end of the index
+        :type end:    (int | None)
+        :return:      Positions in the element index
+        :rtype:       (int)
+        """
+        if end is None:
+            end = len(self._element_index)
+        ends = self._element_index_ends
+        pending = []
+        for position in range(start, end):
+            while pending and ends[pending[-1]] <= position:
+                yield pending.pop()
+            pending.append(position)
+        while pending:
+            yield pending.pop()
+
+    def _add_element_widgets_to_widget_map(self, element):
+        """
+        Used internally only! Not user callable
+        Adds the tkinter widgets that make up an element to the widget to element map.  This includes the inner
+        widgets (TKEntry, TKText, TKTreeview, the frames of a Column, etc) as well as element.Widget so that
+        widget_to_element can find the element no matter which of its widgets is passed in.
+
+        :param element: The element that was just packed into the window
+        :type element:  (Element)
+        """
+        widget_map = self._widget_to_element_dict
+        for attribute in self._element_widget_attributes:
+            widget = getattr(element, attribute, None)
+            if isinstance(widget, tk.Misc):
+                widget_map[widget] = element
+        if isinstance(element.Widget, tk.Misc):
+            widget_map[element.Widget] = element
+        if isinstance(element.Widget, TkScrollableFrame):
+            widget_map[element.Widget.canvas] = element
+            widget_map[element.Widget.TKFrame] = element
+
     def element_list(self):
         """
         Returns a list of all elements in the window
@@ -1447,38 +1744,11 @@ class Window:
     def _build_element_list(self):
         """
         Used internally only! Not user callable
-        Builds a dictionary containing all elements with keys for this window.
-        """
-        elem_list = []
-        elem_list = self._build_element_list_for_form(self, self, elem_list)
-        return elem_list
-
-    def _build_element_list_for_form(self, top_window, window, elem_list):
+        Builds a list containing all elements for this window.
         """
-        Loop through all Rows and all Container Elements for this window and create a list
-        Note that the calls are recursive as all pathes must be walked
-
-        :param top_window: The highest level of the window
-        :type top_window:  (Window)
-        :param window:     The "sub-window" (container element) to be searched
-        :type window:      Column | Frame | TabGroup | Pane | Tab
-        :param elem_list:  The element list as it currently stands.... used as part of recursive call
-        :type elem_list:   ???
-        :return:           List of all elements in this sub-window
-        :rtype:            List[Element]
-        """
-        for row_num, row in enumerate(window.Rows):
-            for col_num, element in enumerate(row):
-                elem_list.append(element)
-                if element.Type in (
-                    ELEM_TYPE_COLUMN,
-                    ELEM_TYPE_FRAME,
-                    ELEM_TYPE_TAB_GROUP,
-                    ELEM_TYPE_PANE,
-                    ELEM_TYPE_TAB,
-                ):
-                    elem_list = self._build_element_list_for_form(top_window, element, elem_list)
-        return elem_list
+        if self._element_index is None:
+            self._build_element_index()
+        return list(self._element_index)
 
     def save_to_disk(self, filename):
         """
@@ -1488,6 +1758,8 @@ class Window:
         :param filename: Filename to save the values to in pickled form
         :type filename:  str
         """
+        import pickle
+
         try:
             event, values = _BuildResults(self, False, self)
             remove_these = []
@@ -1508,6 +1780,8 @@ class Window:
         :param filename: Pickle Filename to load
         :type filename:  (str)
         """
+        import pickle
+
         try:
             with open(filename, 'rb') as df:
                 self.Fill(pickle.load(df))
@@ -1824,6 +2098,9 @@ class Window:
         a window so that resources are properly freed up within your thread.
         """
 
+        if self in Window._window_pool:
+            return
+
         try:
             del Window._active_windows[self]  # will only be in the list if window was explicitly finalized
         except:
@@ -1834,10 +2111,16 @@ class Window:
         except:
             pass
 
+        if not self.TKrootDestroyed and self._can_be_pooled():
+            self._destroy_tkroot()  # puts the window into the window pool
+            Window._DecrementOpenCount()
+            return
+
         self._restore_stdout()
         self._restore_stderr()
 
         _TimerPeriodic.stop_all_timers_for_window(self)
+        _ReadProfiler.disable(self)  # the recorded reads remain available from get_profiler_stats
 
         if self.TKrootDestroyed:
             return
@@ -1851,6 +2134,8 @@ class Window:
 
         # Free up anything that was held in the layout and the root variables
         self.Rows = None
+        self._widget_to_element_dict = {}
+        self._multilines_to_flush = {}
         self.TKroot = None
 
     def is_closed(self, quick_check=None):
@@ -1877,6 +2162,175 @@ class Window:
             return True
         return False
 
+    def _can_be_pooled(self):
+        """
+        Not user callable.  Returns True if closing this window should put it into the window pool instead of destroying it
+
+        :return: True if the window has a reuse_key and the window pool is turned on
+        :rtype:  (bool)
+        """
+        return self.reuse_key is not None and FreeSimpleGUI.DEFAULT_WINDOW_POOL_SIZE > 0 and self.TKroot is not None
+
+    def _destroy_tkroot(self):
+        """
+        Not user callable.  Destroys the tkinter window.  A window that can be pooled is withdrawn and put into the
+        window pool instead.  This happens however the window is closed (close, the X or a button that closes the
+        window) so that a window is pooled even if close is never called.
+        """
+        if self._can_be_pooled():
+            if self._withdrawn_for_pool:  # already in the window pool
+                return
+            try:
+                self.TKroot.grab_release()  # a withdrawn modal window would otherwise keep the grab
+            except:
+                pass
+            self.TKroot.withdraw()
+            self._withdrawn_for_pool = True
+            self._add_to_window_pool()
+        else:
+            self.TKroot.destroy()
+
+    def _save_values_for_reuse(self):
+        """
+        Not user callable.  Saves the values of the input elements right after the window is built.  They are put back
+        using fill when the window is taken out of the window pool.
+        """
+        values = {}
+        for key, element in self.AllKeysDict.items():
+            try:
+                if element.Type in (ELEM_TYPE_INPUT_TEXT, ELEM_TYPE_INPUT_MULTILINE, ELEM_TYPE_INPUT_CHECKBOX, ELEM_TYPE_INPUT_RADIO, ELEM_TYPE_INPUT_COMBO, ELEM_TYPE_INPUT_SPIN):
+                    values[key] = element.get()
+                elif element.Type == ELEM_TYPE_INPUT_SLIDER:
+                    values[key] = element.TKScale.get()
+                elif element.Type == ELEM_TYPE_INPUT_OPTION_MENU:
+                    values[key] = element.TKStringVar.get()
+            except:
+                pass
+        self._values_for_reuse = values
+
+    def _add_to_window_pool(self):
+        """
+        Not user callable.  Puts a window that was just withdrawn by _destroy_tkroot into the window pool, releasing
+        what close would release.  If the pool is full, the window that has been in the pool the longest is destroyed.
+        """
+        self.TKrootDestroyed = True  # so that the pooled window is seen as closed until it's reused
+        Window._active_windows.pop(self, None)
+        self._restore_stdout()
+        self._restore_stderr()
+        _TimerPeriodic.stop_all_timers_for_window(self)
+        _ReadProfiler.disable(self)
+        try:
+            self.TKroot.update_idletasks()  # makes the withdraw happen now rather than on the next read of any window
+        except:
+            pass
+        Window._window_pool.append(self)
+        Window._trim_window_pool()
+
+    @classmethod
+    def _trim_window_pool(cls):
+        """
+        Not user callable.  Destroys the oldest windows in the window pool until there are no more than
+        DEFAULT_WINDOW_POOL_SIZE windows in it.
+        """
+        while len(Window._window_pool) > max(FreeSimpleGUI.DEFAULT_WINDOW_POOL_SIZE, 0):
+            window = Window._window_pool.pop(0)
+            try:
+                window.TKroot.destroy()
+                window.TKroot.update()
+            except:
+                pass
+            window._withdrawn_for_pool = False
+            window.Rows = None
+            window._widget_to_element_dict = {}
+            window._multilines_to_flush = {}
+            window.TKroot = None
+
+    @classmethod
+    def _take_from_window_pool(cls, reuse_key):
+        """
+        Not user callable.  Used by __new__ to get a window from the window pool that was made with the same reuse_key.
+        The most recently closed window is used first.
+
+        :param reuse_key: The reuse_key of the Window being made
+        :type reuse_key:  (Any)
+        :return:          The pooled window, removed from the pool, or None if there is no window to reuse
+        :rtype:           (Window | None)
+        """
+        if reuse_key is None:
+            return None
+        for window in reversed(Window._window_pool):
+            if window.reuse_key != reuse_key or type(window) is not cls:
+                continue
+            Window._window_pool.remove(window)
+            try:
+                if not window.TKroot.winfo_exists():
+                    continue
+            except:
+                continue
+            Window._window_taken_from_pool = window
+            return window
+        return None
+
+    def _reuse_from_window_pool(self, title, metadata, finalize):
+        """
+        Not user callable.  Called by __init__ when __new__ took the window from the window pool.  Resets the window
+        so that it acts like a newly made one.  It stays hidden until it is read or finalized.
+
+        :param title:    The title passed to the Window being made
+        :type title:     (str)
+        :param metadata: The metadata passed to the Window being made
+        :type metadata:  (Any)
+        :param finalize: If True then the window is finalized
+        :type finalize:  (bool)
+        """
+        self.TKrootDestroyed = False
+        self.RootNeedsDestroying = False
+        self.XFound = False
+        self.FormRemainedOpen = False
+        self.LastButtonClicked = None
+        self.LastButtonClickedWasRealtime = False
+        self.LastKeyboardEvent = None
+        self.read_closed_window_count = 0
+        self._Hidden = False
+        self._withdrawn_for_pool = False
+        self._reappear_from_pool_needed = True
+        self.thread_queue = queue.Queue()  # throw away anything threads sent the window after it was closed
+        self._thread_wakeup_pending = False
+        self.metadata = metadata
+        Window._IncrementOpenCount()
+
+        if str(title) != self.Title:
+            self.Title = str(title)
+            self.set_title(title)
+
+        if self._values_for_reuse:
+            self.fill(self._values_for_reuse)
+
+        # stdout, stderr and cprint were given back when the window was closed
+        for element in self.AllKeysDict.values():
+            if getattr(element, 'reroute_cprint', False):
+                FreeSimpleGUI.cprint_set_output_destination(self, element.Key)
+            if getattr(element, 'reroute_stdout', False):
+                element.reroute_stdout_to_here()
+            if getattr(element, 'reroute_stderr', False):
+                element.reroute_stderr_to_here()
+
+        if finalize:
+            self.finalize()
+
+    def _reappear_from_window_pool(self):
+        """
+        Not user callable.  Shows a window that was taken from the window pool.  Done by the first read after the
+        window was taken so that changes made before the read are not seen being made.
+        """
+        self._reappear_from_pool_needed = False
+        try:
+            self.TKroot.deiconify()
+            if self.modal or FreeSimpleGUI.DEFAULT_MODAL_WINDOWS_FORCED:
+                self.make_modal()
+        except Exception as e:
+            print('Exception showing a window taken from the window pool', e)
+
     # IT FINALLY WORKED! 29-Oct-2018 was the first time this damned thing got called
     def _OnClosingCallback(self):
         """
@@ -1887,7 +2341,7 @@ class Window:
         if self.CurrentlyRunningMainloop:  # quit if this is the current mainloop, otherwise don't quit!
             _exit_mainloop(self)
             if self.close_destroys_window:
-                self.TKroot.destroy()  # destroy this window
+                self._destroy_tkroot()  # destroy this window
                 self.TKrootDestroyed = True
                 self.XFound = True
             else:
@@ -1896,7 +2350,7 @@ class Window:
             _exit_mainloop(self)
         else:
             if self.close_destroys_window:
-                self.TKroot.destroy()  # destroy this window
+                self._destroy_tkroot()  # destroy this window
                 self.XFound = True
             else:
                 self.LastButtonClicked = WINDOW_CLOSE_ATTEMPTED_EVENT
@@ -2313,7 +2767,7 @@ class Window:
         :param event: (event) not used. Passed in event info
         :type event:
         """
-        Window._main_debug_window_build_needed = True
+        Window._add_read_hook(_debugger_build_main_window_hook)
         # exit the event loop in a way that resembles a timeout occurring
         self.LastButtonClicked = self.TimeoutKey
         self.FormRemainedOpen = True
@@ -2326,7 +2780,7 @@ class Window:
         :param event: (event) not used. Passed in event info
         :type event:
         """
-        Window._floating_debug_window_build_needed = True
+        Window._add_read_hook(_debugger_build_floating_window_hook)
         # exit the event loop in a way that resembles a timeout occurring
         self.LastButtonClicked = self.TimeoutKey
         self.FormRemainedOpen = True
@@ -2485,21 +2939,50 @@ class Window:
         if self.thread_queue is None:
             print('*** Warning Window.write_event_value - no thread queue found ***')
             return
-        # self.thread_lock.acquire()  # first lock the critical section
         self.thread_queue.put(item=(key, value))
+        # Only wake up the window if it hasn't already been woken up for events that have not been read yet
+        with self.thread_lock:
+            if self._thread_wakeup_pending:
+                return
+            self._thread_wakeup_pending = True
+        for wake in list(Window._async_read_wakeups):
+            wake()
         self.TKroot.tk.willdispatch()  # brilliant bit of code provided by Giuliano who I owe a million thank yous!
         self.thread_strvar.set('new item')
 
     def _queued_thread_event_read(self):
+        """
+        Not user callable.  Gets the next event written by a thread.  If the window batches thread events, all of the
+        events waiting are read and returned together as a single THREAD_EVENTS_KEY event.
+
+        :return: The (event, value) or None if there are no events waiting
+        :rtype:  Tuple[Any, Any] | None
+        """
         if self.thread_queue is None:
             return None
 
-        try:  # see if something has been posted to Queue
-            message = self.thread_queue.get_nowait()
-        except queue.Empty:  # get_nowait() will get exception when Queue is empty
-            return None
+        # cleared BEFORE reading so that an event written while reading wakes up the window again
+        with self.thread_lock:
+            self._thread_wakeup_pending = False
+
+        if self.thread_event_batching is None:
+            try:  # see if something has been posted to Queue
+                message = self.thread_queue.get_nowait()
+            except queue.Empty:  # get_nowait() will get exception when Queue is empty
+                return None
+            return message
 
-        return message
+        messages = []
+        for _ in range(self.thread_queue.qsize()):  # only what's waiting now so a busy thread can't keep the read going forever
+            try:
+                messages.append(self.thread_queue.get_nowait())
+            except queue.Empty:
+                break
+        if not messages:
+            return None
+        if self.thread_event_batching == THREAD_EVENTS_BATCH_LATEST:
+            return THREAD_EVENTS_KEY, dict(messages)
+        return THREAD_EVENTS_KEY, messages
 
     def _queued_thread_event_available(self):
 
@@ -0,0 +1,80 @@
+"""
+Measures how long `import FreeSimpleGUI` takes in a fresh interpreter.
+
+Each run starts a new Python process so that nothing is already imported or cached in memory.  The time reported is
+the time the import statement takes inside that process, so interpreter start up is not included.
+
+Usage:
+    python benchmarks/import_time.py                  # times the working tree
+    python benchmarks/import_time.py --ref e5e6a84    # also times the tree at a git commit, for a before and after
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tarfile
+import tempfile
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TIMING_CODE = 'import time; start = time.perf_counter(); import FreeSimpleGUI; print(time.perf_counter() - start)'
+
+
+def time_import(package_root, runs):
+    """
+    Imports FreeSimpleGUI from package_root in runs fresh interpreters.
+
+    :param package_root: Folder that holds the FreeSimpleGUI package
+    :type package_root:  (str)
+    :param runs:         Number of interpreters to start
+    :type runs:          (int)
+    :return:             Import time of each run in milliseconds
+    :rtype:              List[float]
+    """
+    # run from package_root because python -c puts the current folder first on sys.path
+    env = dict(os.environ, PYTHONPATH=package_root)
+    env.pop('PYTHONDONTWRITEBYTECODE', None)  # otherwise every run would include compiling the package
+    subprocess.run([sys.executable, '-c', 'import FreeSimpleGUI'], cwd=package_root, env=env, check=True)  # writes the .pyc files so that every run below uses them
+    times = []
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, '-c', TIMING_CODE], cwd=package_root, env=env, check=True, capture_output=True, text=True).stdout
+        times.append(float(output.split()[-1]) * 1000)
+    return times
+
+
+def export_ref(ref, folder):
+    """
+    Writes the tree at a git commit into folder.
+
+    :param ref:    The git commit, branch or tag
+    :type ref:     (str)
+    :param folder: Folder to write the files to
+    :type folder:  (str)
+    """
+    archive = os.path.join(folder, 'tree.tar')
+    subprocess.run(['git', 'archive', '-o', archive, ref, 'FreeSimpleGUI'], cwd=REPO_ROOT, check=True)
+    with tarfile.open(archive) as tar:
+        tar.extractall(folder)
+
+
+def report(name, times):
+    print(f'{name:>14}: median {statistics.median(times):7.1f} ms   min {min(times):7.1f} ms   ({len(times)} runs)')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Time "import FreeSimpleGUI" in fresh interpreters')
+    parser.add_argument('--runs', type=int, default=20, help='number of fresh interpreters to time (default 20)')
+    parser.add_argument('--ref', help='git commit to time as well, to compare against')
+    args = parser.parse_args()
+
+    if args.ref is not None:
+        with tempfile.TemporaryDirectory() as folder:
+            export_ref(args.ref, folder)
+            report(args.ref, time_import(folder, args.runs))
+    report('working tree', time_import(REPO_ROOT, args.runs))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,84 @@
+"""
+Measures what the read hooks add to every call of Window.read(timeout=0).
+
+Window._read, the part that runs tkinter, is replaced with a function that returns a timeout right away so that the time
+reported is only the work read does around it.  This way no display is needed and the numbers are not lost in the time
+tkinter takes.  Three cases are timed:
+    no hook             nothing has loaded the debugger
+    debugger closed     the debugger has been loaded and created but none of its windows are open
+    hook attached       a hook that gets the variables of the caller, like the debugger does while a window is open
+
+Usage:
+    python benchmarks/read_hooks.py
+    python benchmarks/read_hooks.py --reads 200000
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import timeit
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+import FreeSimpleGUI as sg  # noqa: E402
+from FreeSimpleGUI.window import Window  # noqa: E402
+
+
+def time_reads(window, reads, repeat):
+    """
+    Calls window.read(timeout=0) reads times, repeat times over, and keeps the fastest.
+
+    :param window: The window to read
+    :type window:  (Window)
+    :param reads:  Number of reads to time
+    :type reads:   (int)
+    :param repeat: Number of times to time them
+    :type repeat:  (int)
+    :return:       Time of one read in microseconds
+    :rtype:        (float)
+    """
+    return min(timeit.repeat(lambda: window.read(timeout=0), number=reads, repeat=repeat)) / reads * 1_000_000
+
+
+def capture_caller(window, frame):
+    """
+    A read hook that does what the debugger's hook does when no refresh is needed.
+
+    :param window: The window being read
+    :type window:  (Window)
+    :param frame:  The frame of the code that called read
+    :type frame:   (types.FrameType)
+    """
+    capture_caller.locals = frame.f_locals
+    capture_caller.globals = frame.f_globals
+
+
+def report(name, microseconds):
+    print(f'{name:>16}: {microseconds:6.2f} us per read')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Time Window.read(timeout=0) with and without read hooks')
+    parser.add_argument('--reads', type=int, default=50_000, help='number of reads in each timing (default 50000)')
+    parser.add_argument('--repeat', type=int, default=5, help='number of timings, the fastest is reported (default 5)')
+    args = parser.parse_args()
+
+    window = sg.Window('Read hooks benchmark', [[sg.Text('Nothing to see')]])
+    Window._read = lambda self, timeout=None, timeout_key=None: (timeout_key, {})
+
+    report('no hook', time_reads(window, args.reads, args.repeat))
+
+    sg._get_debugger()
+    report('debugger closed', time_reads(window, args.reads, args.repeat))
+
+    Window._add_read_hook(capture_caller)
+    try:
+        report('hook attached', time_reads(window, args.reads, args.repeat))
+    finally:
+        Window._remove_read_hook(capture_caller)
+
+
+if __name__ == '__main__':
+    main()
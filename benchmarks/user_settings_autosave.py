@@ -0,0 +1,63 @@
+"""
+Measures how many UserSettings.set calls can be made per second when every change is saved right away and when
+autosave_delay is used.
+
+Each case writes a new settings file in a temporary folder.  The time reported includes the call to flush at the end,
+so the changes still waiting to be saved when the loop ends are counted too.
+
+Usage:
+    python benchmarks/user_settings_autosave.py
+    python benchmarks/user_settings_autosave.py --sets 5000 --delay 0.5
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+import FreeSimpleGUI as sg  # noqa: E402
+
+
+def time_sets(folder, sets, autosave_delay):
+    """
+    Makes sets changes to a new settings file in folder and returns how long they took.
+
+    :param folder:         Folder to write the settings file to
+    :type folder:          (str)
+    :param sets:           Number of calls to set
+    :type sets:            (int)
+    :param autosave_delay: Passed to UserSettings. None saves on every change
+    :type autosave_delay:  (float | None)
+    :return:               Time taken in seconds, including the final flush
+    :rtype:                (float)
+    """
+    settings = sg.UserSettings(f'autosave_{autosave_delay}.json', path=folder, autosave_delay=autosave_delay)
+    start = time.perf_counter()
+    for i in range(sets):
+        settings.set(f'key {i % 50}', i)
+    settings.flush()
+    return time.perf_counter() - start
+
+
+def report(name, sets, seconds):
+    print(f'{name:>18}: {sets / seconds:10.0f} sets/sec   ({sets} sets in {seconds * 1000:.1f} ms)')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Time UserSettings.set with and without autosave_delay')
+    parser.add_argument('--sets', type=int, default=2000, help='number of calls to set in each case (default 2000)')
+    parser.add_argument('--delay', type=float, default=1.0, help='autosave_delay in seconds to time (default 1.0)')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as folder:
+        report('save every change', args.sets, time_sets(folder, args.sets, None))
+        report(f'autosave_delay={args.delay:g}', args.sets, time_sets(folder, args.sets, args.delay))
+
+
+if __name__ == '__main__':
+    main()